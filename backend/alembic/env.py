@@ -14,7 +14,7 @@ from app.core.config import settings
 from app.db.database import Base
 
 # Import all models to ensure they're registered with Base
-from app.models import Reminder, CallAttempt, User
+from app.models import Reminder, CallAttempt, ArchivedReminder, ArchivedCallAttempt, ReminderStat, SchedulerSignal, User
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
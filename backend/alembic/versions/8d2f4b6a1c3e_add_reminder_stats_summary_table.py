@@ -0,0 +1,61 @@
+"""Add reminder_stats summary table
+
+Revision ID: 8d2f4b6a1c3e
+Revises: 600123ee543a
+Create Date: 2026-10-19 09:12:44.102318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f4b6a1c3e'
+down_revision: Union[str, None] = '600123ee543a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('reminder_stats',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=True),
+    sa.Column('status', postgresql.ENUM('SCHEDULED', 'COMPLETED', 'FAILED', name='reminderstatus', create_type=False), nullable=False),
+    sa.Column('reminder_count', sa.Integer(), nullable=False),
+    sa.Column('call_count', sa.Integer(), nullable=False),
+    sa.Column('total_call_duration_seconds', sa.Integer(), nullable=False),
+    sa.Column('total_call_cost', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_reminder_stats_user_status', 'reminder_stats', ['user_id', 'status'], unique=False)
+
+    # Backfill counters from existing data
+    op.execute("""
+        INSERT INTO reminder_stats
+            (user_id, status, reminder_count, call_count, total_call_duration_seconds, total_call_cost)
+        SELECT user_id, status, COUNT(*), 0, 0, 0
+        FROM reminders
+        GROUP BY user_id, status
+    """)
+    op.execute("""
+        UPDATE reminder_stats AS s
+        SET call_count = c.calls, total_call_duration_seconds = c.duration
+        FROM (
+            SELECT r.user_id, r.status, COUNT(a.id) AS calls,
+                   COALESCE(SUM(a.duration_seconds), 0) AS duration
+            FROM call_attempts a
+            JOIN reminders r ON r.id = a.reminder_id
+            WHERE a.status IN ('COMPLETED', 'FAILED') AND a.vapi_call_id IS NOT NULL
+            GROUP BY r.user_id, r.status
+        ) AS c
+        WHERE s.user_id IS NOT DISTINCT FROM c.user_id AND s.status = c.status
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_reminder_stats_user_status', table_name='reminder_stats')
+    op.drop_table('reminder_stats')
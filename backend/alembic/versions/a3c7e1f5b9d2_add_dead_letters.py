@@ -0,0 +1,42 @@
+"""Add dead_letters for failed dispatches and unprocessable webhooks
+
+Revision ID: a3c7e1f5b9d2
+Revises: f6b2d8a4c1e7
+Create Date: 2026-10-19 20:12:44.870351
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e1f5b9d2'
+down_revision: Union[str, None] = 'f6b2d8a4c1e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('dead_letters',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('kind', sa.Enum('DISPATCH', 'WEBHOOK', name='deadletterkind'), nullable=False),
+    sa.Column('reason', sa.Enum('TIMEOUT', 'RATE_LIMITED', 'PROVIDER_ERROR', 'REJECTED', 'UNREACHABLE', 'EXPIRED', 'INVALID_PAYLOAD', 'UNMATCHED', 'INTERNAL', name='deadletterreason'), nullable=False),
+    sa.Column('reminder_id', sa.UUID(), nullable=True),
+    sa.Column('user_id', sa.UUID(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('payload', sa.LargeBinary(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('replay_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('replayed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_dead_letters_reason_created', 'dead_letters', ['reason', 'created_at'], unique=False)
+    op.create_index(op.f('ix_dead_letters_reminder_id'), 'dead_letters', ['reminder_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_dead_letters_reminder_id'), table_name='dead_letters')
+    op.drop_index('idx_dead_letters_reason_created', table_name='dead_letters')
+    op.drop_table('dead_letters')
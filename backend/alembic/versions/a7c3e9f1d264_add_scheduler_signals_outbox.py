@@ -0,0 +1,31 @@
+"""Add scheduler_signals outbox for the standalone dispatcher worker
+
+Revision ID: a7c3e9f1d264
+Revises: e1f3b5c7d902
+Create Date: 2026-10-19 13:02:17.554810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f1d264'
+down_revision: Union[str, None] = 'e1f3b5c7d902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('scheduler_signals',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('reminder_id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('scheduler_signals')
@@ -0,0 +1,34 @@
+"""Add recurrence rule and series columns to reminders
+
+Revision ID: b5d8f2a4c617
+Revises: a7c3e9f1d264
+Create Date: 2026-10-19 14:41:09.218364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d8f2a4c617'
+down_revision: Union[str, None] = 'a7c3e9f1d264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ('reminders', 'reminders_archive'):
+        op.add_column(table, sa.Column('recurrence_rule', sa.String(length=255), nullable=True))
+        op.add_column(table, sa.Column('series_id', sa.UUID(), nullable=True))
+        op.add_column(table, sa.Column('occurrence_index', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('idx_reminders_series', 'reminders', ['series_id', 'occurrence_index'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_reminders_series', table_name='reminders')
+    for table in ('reminders_archive', 'reminders'):
+        op.drop_column(table, 'occurrence_index')
+        op.drop_column(table, 'series_id')
+        op.drop_column(table, 'recurrence_rule')
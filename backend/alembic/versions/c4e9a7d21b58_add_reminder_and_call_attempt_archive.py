@@ -0,0 +1,66 @@
+"""Add cold archive tables for finished reminders and their call attempts
+
+Revision ID: c4e9a7d21b58
+Revises: 8d2f4b6a1c3e
+Create Date: 2026-10-19 10:03:17.554120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9a7d21b58'
+down_revision: Union[str, None] = '8d2f4b6a1c3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_reminders_status_updated', 'reminders', ['status', 'updated_at'], unique=False)
+    op.create_table('reminders_archive',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=True),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('phone_number', sa.String(length=20), nullable=False),
+    sa.Column('scheduled_for', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('timezone', sa.String(length=50), nullable=False),
+    sa.Column('status', postgresql.ENUM('SCHEDULED', 'COMPLETED', 'FAILED', name='reminderstatus', create_type=False), nullable=False),
+    sa.Column('vapi_call_id', sa.String(length=100), nullable=True),
+    sa.Column('failure_reason', sa.Text(), nullable=True),
+    sa.Column('retry_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_reminders_archive_user', 'reminders_archive', ['user_id'], unique=False)
+    op.create_table('call_attempts_archive',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('reminder_id', sa.UUID(), nullable=False),
+    sa.Column('attempt_number', sa.Integer(), nullable=False),
+    sa.Column('status', postgresql.ENUM('INITIATED', 'RINGING', 'ANSWERED', 'COMPLETED', 'FAILED', 'NO_ANSWER', name='callattemptstatus', create_type=False), nullable=False),
+    sa.Column('vapi_call_id', sa.String(length=100), nullable=True),
+    sa.Column('duration_seconds', sa.Integer(), nullable=True),
+    sa.Column('failure_reason', sa.Text(), nullable=True),
+    sa.Column('initiated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['reminder_id'], ['reminders_archive.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_call_attempts_archive_reminder', 'call_attempts_archive', ['reminder_id'], unique=False)
+    op.create_index('idx_call_attempts_archive_initiated', 'call_attempts_archive', ['initiated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_call_attempts_archive_initiated', table_name='call_attempts_archive')
+    op.drop_index('idx_call_attempts_archive_reminder', table_name='call_attempts_archive')
+    op.drop_table('call_attempts_archive')
+    op.drop_index('idx_reminders_archive_user', table_name='reminders_archive')
+    op.drop_table('reminders_archive')
+    op.drop_index('idx_reminders_status_updated', table_name='reminders')
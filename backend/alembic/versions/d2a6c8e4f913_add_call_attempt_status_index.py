@@ -0,0 +1,27 @@
+"""Index call attempts by status and start time for the call reconciler
+
+Revision ID: d2a6c8e4f913
+Revises: b5d8f2a4c617
+Create Date: 2026-10-19 16:02:37.504118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a6c8e4f913'
+down_revision: Union[str, None] = 'b5d8f2a4c617'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_call_attempts_status_initiated', 'call_attempts', ['status', 'initiated_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_call_attempts_status_initiated', table_name='call_attempts')
@@ -0,0 +1,62 @@
+"""Add denormalized last-attempt summary columns to reminders
+
+Revision ID: e1f3b5c7d902
+Revises: c4e9a7d21b58
+Create Date: 2026-10-19 11:26:40.381927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f3b5c7d902'
+down_revision: Union[str, None] = 'c4e9a7d21b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ATTEMPT_STATUS = postgresql.ENUM('INITIATED', 'RINGING', 'ANSWERED', 'COMPLETED', 'FAILED', 'NO_ANSWER', name='callattemptstatus', create_type=False)
+
+
+def _backfill(reminders: str, attempts: str) -> None:
+    op.execute(f"""
+        UPDATE {reminders} AS r
+        SET attempt_count = a.attempts, last_attempt_at = a.last_at
+        FROM (
+            SELECT reminder_id, COUNT(*) AS attempts, MAX(initiated_at) AS last_at
+            FROM {attempts}
+            GROUP BY reminder_id
+        ) AS a
+        WHERE r.id = a.reminder_id
+    """)
+    op.execute(f"""
+        UPDATE {reminders} AS r
+        SET last_attempt_status = a.status
+        FROM (
+            SELECT DISTINCT ON (reminder_id) reminder_id, status
+            FROM {attempts}
+            ORDER BY reminder_id, attempt_number DESC, initiated_at DESC
+        ) AS a
+        WHERE r.id = a.reminder_id
+    """)
+
+
+def upgrade() -> None:
+    for table in ('reminders', 'reminders_archive'):
+        op.add_column(table, sa.Column('attempt_count', sa.Integer(), server_default='0', nullable=False))
+        op.add_column(table, sa.Column('last_attempt_at', sa.DateTime(timezone=True), nullable=True))
+        op.add_column(table, sa.Column('last_attempt_status', ATTEMPT_STATUS, nullable=True))
+
+    _backfill('reminders', 'call_attempts')
+    _backfill('reminders_archive', 'call_attempts_archive')
+
+
+def downgrade() -> None:
+    for table in ('reminders_archive', 'reminders'):
+        op.drop_column(table, 'last_attempt_status')
+        op.drop_column(table, 'last_attempt_at')
+        op.drop_column(table, 'attempt_count')
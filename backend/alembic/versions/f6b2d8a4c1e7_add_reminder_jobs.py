@@ -0,0 +1,34 @@
+"""Replace the pickled APScheduler jobs table with reminder_jobs
+
+Revision ID: f6b2d8a4c1e7
+Revises: d2a6c8e4f913
+Create Date: 2026-10-19 18:41:09.236514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b2d8a4c1e7'
+down_revision: Union[str, None] = 'd2a6c8e4f913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('reminder_jobs',
+    sa.Column('reminder_id', sa.UUID(), nullable=False),
+    sa.Column('promote_at', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('reminder_id')
+    )
+    op.create_index('idx_reminder_jobs_promote_at', 'reminder_jobs', ['promote_at'], unique=False)
+    # Nothing to copy: the scheduler re-creates a job for every pending reminder on start
+    op.execute('DROP TABLE IF EXISTS apscheduler_jobs')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_reminder_jobs_promote_at', table_name='reminder_jobs')
+    op.drop_table('reminder_jobs')
@@ -8,9 +8,21 @@ class Settings(BaseSettings):
     DEBUG: bool = True  # True for development, set to False in production
     ENVIRONMENT: str = "development"  # development or production
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # json or text
+    LOG_SAMPLING: str = ""  # e.g. "app.routers.webhooks=0.1,app.services.vapi_service=0.5"
 
     # Database
     DATABASE_URL: str
+    DATABASE_ECHO: bool = False  # Log every SQL statement (very noisy, keep off in production)
+    # Optional comma-separated replica URLs for read-only endpoints
+    DATABASE_READ_URLS: str = ""
+    # After a write, the same client reads from the primary for this long (replica lag cover)
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+    # Serialized reminder details cached per process (0 disables), checked against the
+    # row's updated_at on every read unless invalidations are broadcast over NOTIFY
+    REMINDER_CACHE_SIZE: int = 10_000
+    REMINDER_CACHE_TTL_SECONDS: float = 30.0
+    REMINDER_CACHE_CHANNEL: bool = False  # Postgres only
 
     # Vapi Configuration
     VAPI_API_KEY: str = "sk_test_key"
@@ -22,6 +34,8 @@ class Settings(BaseSettings):
     # Webhook Configuration
     WEBHOOK_SECRET: str = ""  # Optional: For webhook signature verification
     WEBHOOK_BASE_URL: str = "http://localhost:8000"  # Local development, change in production
+    WEBHOOK_CAPTURE_DIR: str = ""  # Opt-in: append raw Vapi webhooks here for replay
+    WEBHOOK_CAPTURE_QUEUE: int = 10_000  # Events buffered before capture starts dropping
 
     # Twilio (Optional - not currently used)
     # TWILIO_ACCOUNT_SID: str = "AC_test_sid"
@@ -39,6 +53,54 @@ class Settings(BaseSettings):
     MAX_RETRY_ATTEMPTS: int = 3
     RETRY_DELAY_MINUTES: int = 5
 
+    # "embedded" runs the dispatcher inside the API process (single uvicorn worker only);
+    # "worker" leaves it to `python -m app.worker` and signals changes through the database
+    SCHEDULER_MODE: str = "embedded"
+    SCHEDULER_SIGNAL_POLL_SECONDS: float = 2.0  # Fallback when LISTEN/NOTIFY is unavailable
+
+    # Dispatch: reminders due within the window are held in an in-memory timing wheel
+    DISPATCH_WINDOW_SECONDS: int = 300
+    DISPATCH_TICK_SECONDS: float = 0.05
+    DISPATCH_WORKERS: int = 10
+    # Workers are shared round-robin between users; optionally cap how many one user may
+    # occupy (0 = no cap) and give some users a larger share ("<user_id>=4,<user_id>=2")
+    DISPATCH_MAX_PER_USER: int = 0
+    DISPATCH_USER_WEIGHTS: str = ""
+
+    # Catch-up: reminders that came due while nothing was dispatching are called late, at
+    # most this many minutes late (0 disables), without holding up on-time reminders
+    CATCH_UP_MAX_LATENESS_MINUTES: float = 60.0
+    CATCH_UP_RATE_PER_SECOND: float = 20.0
+    CATCH_UP_CONCURRENCY: int = 5  # Dispatch workers the backlog may occupy at once
+    CATCH_UP_BATCH_SIZE: int = 1000
+
+    # Retention: finished reminders older than this move to the archive tables (0 disables)
+    RETENTION_ARCHIVE_AFTER_DAYS: int = 90
+    RETENTION_BATCH_SIZE: int = 1000
+    RETENTION_INTERVAL_MINUTES: float = 60.0
+
+    # Reconciliation: ask Vapi about calls whose final webhook never arrived (0 disables)
+    RECONCILE_STALE_AFTER_MINUTES: float = 15.0
+    RECONCILE_GIVE_UP_MINUTES: float = 24 * 60.0  # Fail calls Vapi can't tell us about
+    RECONCILE_INTERVAL_MINUTES: float = 5.0
+    RECONCILE_BATCH_SIZE: int = 500
+    RECONCILE_CONCURRENCY: int = 20
+    RECONCILE_RATE_PER_SECOND: float = 10.0
+
+    # Dead letters: replayed dispatches are rescheduled this many calls per second apart
+    # unless the replay request sets its own rate
+    DEAD_LETTER_REPLAY_RATE: float = 5.0
+
+    # Request profiling (off by default): profile this fraction of requests and any sent
+    # with "X-Profile: <PROFILING_TOKEN>"; results at GET /debug/profile
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_TOKEN: str = ""  # Also required to read /debug/profile when set
+    PROFILING_STACK_INTERVAL_MS: float = 0.0  # Sample call stacks this often (0 = off)
+
+    # Health checks
+    HEALTH_REFRESH_SECONDS: float = 15.0
+    HEALTH_DB_TIMEOUT_SECONDS: float = 2.0
+
     class Config:
         env_file = ".env.local"
         case_sensitive = True
@@ -49,4 +111,12 @@ def get_settings():
     return Settings()
 
 
-settings = get_settings()
+class _LazySettings:
+    """Stands in for Settings until first attribute access, so importing a module that
+    reads configuration doesn't parse .env.local or validate the environment."""
+
+    def __getattr__(self, name):
+        return getattr(get_settings(), name)
+
+
+settings = _LazySettings()
@@ -0,0 +1,149 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+_log_context: ContextVar[Dict[str, str]] = ContextVar("log_context", default={})
+
+# Attributes every LogRecord has; anything else on a record is a structured field
+_RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+@contextmanager
+def log_context(**fields):
+    """Attach correlation fields (reminder_id, call_attempt_id, vapi_call_id...) to every
+    record logged inside the block, including records from nested service calls."""
+    current = _log_context.get()
+    token = _log_context.set(
+        {**current, **{key: str(value) for key, value in fields.items() if value is not None}}
+    )
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps only a fraction of INFO/DEBUG records for the configured loggers.
+
+    Warnings and errors always pass. Rates are matched on the longest logger-name prefix,
+    so "app.services" covers every service module unless a more specific rate is set.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def _rate_for(self, name: str) -> float:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self._rate_for(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers message formatting to the listener thread.
+
+    The stock handler renders the message in the calling thread, which is exactly the cost
+    we want off the dispatch and webhook paths. We only snapshot the correlation context,
+    which lives in a ContextVar and would be lost once the record crosses threads.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        for key, value in _log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, default=str)
+
+
+def parse_sampling_rates(spec: str) -> Dict[str, float]:
+    rates = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        name, _, rate = item.partition("=")
+        try:
+            rates[name.strip()] = max(0.0, min(1.0, float(rate)))
+        except ValueError:
+            continue
+    return rates
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    global _listener, _queue_handler
+
+    if _listener is not None:
+        return _listener
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if settings.LOG_FORMAT == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+        )
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = ContextQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(parse_sampling_rates(settings.LOG_SAMPLING)))
+
+    root = logging.getLogger()
+    root.setLevel(settings.LOG_LEVEL.upper())
+    root.addHandler(queue_handler)
+
+    _queue_handler = queue_handler
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    return _listener
+
+
+def shutdown_logging():
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,279 @@
+from collections import Counter, deque
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import random
+import sys
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+PROFILE_HEADER = b"x-profile"
+# The same statement this many times in one request is reported as a likely N+1
+REPEATED_STATEMENT_THRESHOLD = 5
+# Leaf frames of threads that are waiting rather than working
+_IDLE_FILES = ("threading.py", "selectors.py", "queue.py", "/concurrent/futures/thread.py")
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "request_profile", default=None
+)
+
+
+class RequestProfile:
+    __slots__ = ("route", "wall_ms", "statements", "stacks")
+
+    def __init__(self):
+        self.route = ""
+        self.wall_ms = 0.0
+        # (statement, milliseconds) in execution order
+        self.statements: List[Tuple[str, float]] = []
+        self.stacks: List[Tuple[str, int]] = []
+
+    @property
+    def sql_ms(self) -> float:
+        return sum(ms for _, ms in self.statements)
+
+    def repeated(self) -> Dict[str, int]:
+        counts = Counter(statement for statement, _ in self.statements)
+        return {
+            statement: count
+            for statement, count in counts.most_common()
+            if count >= REPEATED_STATEMENT_THRESHOLD
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "route": self.route,
+            "wall_ms": round(self.wall_ms, 2),
+            "statements": len(self.statements),
+            "sql_ms": round(self.sql_ms, 2),
+            "repeated_statements": self.repeated(),
+            "stacks": self.stacks,
+        }
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        context._profile_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    if profile is not None:
+        started = getattr(context, "_profile_started", None)
+        if started is not None:
+            profile.statements.append((statement, (time.perf_counter() - started) * 1000))
+
+
+class StackSampler:
+    """Samples every thread's Python stack at `interval` seconds while running.
+
+    Stacks are collapsed to "file:function;file:function" (root first, the format flame
+    graph tools read) and counted; threads parked in a wait are skipped. Concurrent
+    requests land in the same samples, so profile one request at a time for clean stacks.
+    """
+
+    def __init__(self, interval: float, max_depth: int = 40):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="StackSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> List[Tuple[str, int]]:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        return self.samples.most_common(20)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own or frame.f_code.co_filename.endswith(_IDLE_FILES):
+                    continue
+                names = []
+                while frame is not None and len(names) < self.max_depth:
+                    code = frame.f_code
+                    names.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(names))] += 1
+
+
+class _Stats:
+    __slots__ = ("count", "total_ms", "max_ms", "statements", "sql_ms")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.statements = 0
+        self.sql_ms = 0.0
+
+    def add(self, ms: float, statements: int = 0, sql_ms: float = 0.0):
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.statements += statements
+        self.sql_ms += sql_ms
+
+
+class ProfileStore:
+    """Aggregates finished request profiles per route and per SQL statement, and keeps the
+    slowest recent requests. Statement text is SQLAlchemy's, with bound parameters as
+    placeholders, so no values end up here."""
+
+    def __init__(self, max_recent: int = 50, max_statements: int = 1000):
+        self.max_statements = max_statements
+        self._routes: Dict[str, _Stats] = {}
+        self._queries: Dict[str, _Stats] = {}
+        self._recent: Deque[RequestProfile] = deque(maxlen=max_recent)
+        self._lock = threading.Lock()
+
+    def record(self, profile: RequestProfile):
+        with self._lock:
+            self._routes.setdefault(profile.route, _Stats()).add(
+                profile.wall_ms, len(profile.statements), profile.sql_ms
+            )
+            for statement, ms in profile.statements:
+                stats = self._queries.get(statement)
+                if stats is None:
+                    # Expanded IN lists make new statement texts; stop tracking past the cap
+                    if len(self._queries) >= self.max_statements:
+                        continue
+                    stats = self._queries[statement] = _Stats()
+                stats.add(ms)
+            self._recent.append(profile)
+
+    def report(self, top: int = 10) -> Dict[str, Any]:
+        with self._lock:
+            routes = sorted(
+                self._routes.items(), key=lambda item: item[1].total_ms / item[1].count
+            )
+            queries = sorted(self._queries.items(), key=lambda item: item[1].total_ms)
+            recent = sorted(self._recent, key=lambda profile: profile.wall_ms)
+        return {
+            "routes": [
+                {
+                    "route": route,
+                    "requests": stats.count,
+                    "avg_ms": round(stats.total_ms / stats.count, 2),
+                    "max_ms": round(stats.max_ms, 2),
+                    "avg_statements": round(stats.statements / stats.count, 1),
+                    "avg_sql_ms": round(stats.sql_ms / stats.count, 2),
+                }
+                for route, stats in reversed(routes[-top:])
+            ],
+            "queries": [
+                {
+                    "statement": statement,
+                    "executions": stats.count,
+                    "total_ms": round(stats.total_ms, 2),
+                    "max_ms": round(stats.max_ms, 2),
+                }
+                for statement, stats in reversed(queries[-top:])
+            ],
+            "slowest_requests": [profile.summary() for profile in reversed(recent[-top:])],
+        }
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+            self._queries.clear()
+            self._recent.clear()
+
+
+@lru_cache()
+def get_profile_store() -> ProfileStore:
+    return ProfileStore()
+
+
+def profiling_enabled() -> bool:
+    return settings.PROFILING_SAMPLE_RATE > 0 or bool(settings.PROFILING_TOKEN)
+
+
+def _route_name(scope) -> str:
+    # The router records the matched endpoint in the scope; report its path template so
+    # /api/reminders/<id> requests aggregate together
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is not None and app is not None:
+        for route in app.router.routes:
+            if getattr(route, "endpoint", None) is endpoint:
+                return f"{scope['method']} {route.path}"
+    return f"{scope['method']} {scope['path']}"
+
+
+class ProfilingMiddleware:
+    """Profiles a PROFILING_SAMPLE_RATE fraction of requests, plus any request sent with
+    "X-Profile: <PROFILING_TOKEN>".
+
+    A profiled request records its wall time and every SQL statement it ran (with
+    timings, via engine events), optionally a stack sample every
+    PROFILING_STACK_INTERVAL_MS, and answers with a Server-Timing header. Results are
+    aggregated in the ProfileStore served at GET /debug/profile. Requests that aren't
+    profiled cost one settings lookup here and a ContextVar read per statement.
+    """
+
+    def __init__(self, app, store: Optional[ProfileStore] = None):
+        self.app = app
+        self.store = store
+
+    def _wanted(self, scope) -> bool:
+        if scope["type"] != "http" or scope["path"].startswith("/debug/"):
+            return False
+        rate = settings.PROFILING_SAMPLE_RATE
+        if rate > 0 and random.random() < rate:
+            return True
+        token = settings.PROFILING_TOKEN
+        if token:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return value.decode("latin-1") == token
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        context_token = _current_profile.set(profile)
+        interval = settings.PROFILING_STACK_INTERVAL_MS
+        sampler = StackSampler(interval / 1000) if interval > 0 else None
+        if sampler:
+            sampler.start()
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                timing = (
+                    f'sql;desc="{len(profile.statements)} statements";dur={profile.sql_ms:.2f}, '
+                    f"app;dur={(time.perf_counter() - started) * 1000:.2f}"
+                )
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (b"server-timing", timing.encode())],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            profile.wall_ms = (time.perf_counter() - started) * 1000
+            _current_profile.reset(context_token)
+            if sampler:
+                profile.stacks = sampler.stop()
+            profile.route = _route_name(scope)
+            (self.store or get_profile_store()).record(profile)
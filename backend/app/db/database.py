@@ -1,13 +1,49 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+from itertools import count
+from typing import Optional, Tuple
+import time
+
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# Create database engine
-engine = create_engine(settings.DATABASE_URL, echo=settings.DEBUG, pool_pre_ping=True)
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # ON DELETE CASCADE on call_attempts relies on this when running against SQLite
+    if type(dbapi_connection).__module__.startswith("sqlite3"):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+@lru_cache()
+def get_engine() -> Engine:
+    """Database engine, created on first use rather than at import time"""
+    return create_engine(settings.DATABASE_URL, echo=settings.DATABASE_ECHO, pool_pre_ping=True)
+
+
+@lru_cache()
+def get_read_engines() -> Tuple[Engine, ...]:
+    """Replica engines from DATABASE_READ_URLS; empty when every read goes to the primary"""
+    urls = [url.strip() for url in settings.DATABASE_READ_URLS.split(",") if url.strip()]
+    return tuple(
+        create_engine(url, echo=settings.DATABASE_ECHO, pool_pre_ping=True) for url in urls
+    )
+
+
+class _LazySessionmaker(sessionmaker):
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+
+# Create SessionLocal class; it binds to the engine the first time a session is opened
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
 
 # Create Base class for models
 Base = declarative_base()
@@ -20,3 +56,50 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Holds the epoch second until which a client that just wrote reads from the primary
+PRIMARY_PIN_COOKIE = "db_primary_until"
+_next_replica = count()
+
+
+def pin_to_primary(response: Response):
+    window = settings.READ_YOUR_WRITES_SECONDS
+    # Deployed, the frontend calls the API from another site, and browsers only attach
+    # a cross-site cookie to fetches when it is SameSite=None and Secure
+    cross_site = settings.ENVIRONMENT != "development"
+    response.set_cookie(
+        PRIMARY_PIN_COOKIE,
+        f"{time.time() + window:.3f}",
+        max_age=max(1, int(window + 0.999)),
+        httponly=True,
+        samesite="none" if cross_site else "lax",
+        secure=cross_site,
+    )
+
+
+def get_read_bind(request: Request) -> Optional[Engine]:
+    """Replica for this request, or None to use the primary: when no replicas are
+    configured, or the client wrote recently and must see its own writes."""
+    replicas = get_read_engines()
+    if not replicas:
+        return None
+
+    try:
+        if float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time():
+            return None
+    except ValueError:
+        pass
+
+    return replicas[next(_next_replica) % len(replicas)]
+
+
+def get_read_db(request: Request):
+    """Dependency for read-only endpoints: like get_db, but served by a replica when one
+    is configured"""
+    bind = get_read_bind(request)
+    db = SessionLocal(bind=bind) if bind is not None else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
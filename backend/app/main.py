@@ -1,10 +1,17 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
-from app.routers import reminders, webhooks
-from app.services.scheduler_service import scheduler
-from datetime import datetime
+from app.core.logging_config import setup_logging, shutdown_logging
+from app.core.profiling import ProfilingMiddleware
+from app.db.database import pin_to_primary
+from app.routers import dead_letters, debug, health, reminders, webhooks
+from app.services.health_service import get_health_monitor
+from app.services.reconciliation_service import run_call_reconciler
+from app.services.reminder_cache import get_reminder_cache
+from app.services.retention_service import run_retention_archiver
+from app.services.scheduler_service import ReminderScheduler
+from app.services.webhook_capture import get_webhook_capture
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,19 +19,50 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    setup_logging()
     logger.info("Starting up Call Me Reminder API...")
+    logger.info("Running in %s mode (DEBUG=%s)", settings.ENVIRONMENT, settings.DEBUG)
+    logger.info("CORS configured for origins: %s", origins)
 
-    scheduler.start()
-    logger.info("Scheduler started")
+    embedded = settings.SCHEDULER_MODE != "worker"
+    if embedded:
+        scheduler = ReminderScheduler()
+        scheduler.start()
+        logger.info("Scheduler started")
 
-    scheduler.reschedule_all_pending()
-    logger.info("Pending reminders rescheduled")
+        scheduler.reschedule_all_pending()
+        logger.info("Pending reminders rescheduled")
+
+        scheduler.add_maintenance_job(
+            run_retention_archiver, "retention_archiver", settings.RETENTION_INTERVAL_MINUTES
+        )
+        scheduler.add_maintenance_job(
+            run_call_reconciler, "call_reconciler", settings.RECONCILE_INTERVAL_MINUTES
+        )
+    else:
+        logger.info("Dispatch runs in the standalone worker; API only signals changes")
+
+    webhook_capture = get_webhook_capture()
+    if webhook_capture:
+        webhook_capture.start()
+
+    health_monitor = get_health_monitor()
+    health_monitor.start()
+
+    reminder_cache = get_reminder_cache()
+    reminder_cache.start()
 
     yield
 
     logger.info("Shutting down Call Me Reminder API...")
-    scheduler.shutdown()
-    logger.info("Scheduler shutdown complete")
+    reminder_cache.stop()
+    health_monitor.stop()
+    if webhook_capture:
+        webhook_capture.stop()
+    if embedded:
+        scheduler.shutdown()
+        logger.info("Scheduler shutdown complete")
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -44,12 +82,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-logger.info(f"Running in {settings.ENVIRONMENT} mode")
-logger.info(f"DEBUG: {settings.DEBUG}")
-logger.info(f"CORS configured for origins: {origins}")
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+@app.middleware("http")
+async def pin_reads_after_writes(request: Request, call_next):
+    """With read replicas configured, a client that just wrote reads from the primary for
+    READ_YOUR_WRITES_SECONDS so replica lag never hides its own change."""
+    response = await call_next(request)
+    if (
+        settings.DATABASE_READ_URLS
+        and request.method not in READ_ONLY_METHODS
+        and response.status_code < 400
+    ):
+        pin_to_primary(response)
+    return response
+
+
+# Outermost, so a profile covers the other middleware too
+app.add_middleware(ProfilingMiddleware)
+
 
 app.include_router(reminders.router, prefix="/api/reminders", tags=["Reminders"])
 app.include_router(webhooks.router, prefix="/api/webhooks", tags=["Webhooks"])
+app.include_router(dead_letters.router, prefix="/api/dead-letters", tags=["Dead letters"])
+app.include_router(health.router, tags=["Health"])
+app.include_router(debug.router, tags=["Debug"], include_in_schema=False)
 
 
 @app.get("/", tags=["Root"])
@@ -61,21 +119,9 @@ def read_root():
         "endpoints": {
             "reminders": "/api/reminders",
             "webhooks": "/api/webhooks",
+            "dead_letters": "/api/dead-letters",
             "health": "/health",
+            "liveness": "/health/live",
+            "readiness": "/health/ready",
         },
     }
-
-
-@app.get("/health", tags=["Health"])
-def health_check():
-    scheduler_status = (
-        "running" if scheduler._scheduler and scheduler._scheduler.running else "stopped"
-    )
-    scheduled_jobs_count = len(scheduler.get_scheduled_jobs()) if scheduler._scheduler else 0
-
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "database": "connected",
-        "scheduler": {"status": scheduler_status, "scheduled_jobs": scheduled_jobs_count},
-    }
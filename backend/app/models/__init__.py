@@ -1,10 +1,23 @@
 from app.models.reminder import Reminder, CallAttempt, ReminderStatus, CallAttemptStatus
+from app.models.archive import ArchivedReminder, ArchivedCallAttempt
+from app.models.dead_letter import DeadLetter, DeadLetterKind, DeadLetterReason
+from app.models.reminder_job import ReminderJob
+from app.models.signal import SchedulerSignal
+from app.models.stats import ReminderStat
 from app.models.user import User
 
 __all__ = [
     "Reminder",
     "CallAttempt",
+    "ArchivedReminder",
+    "ArchivedCallAttempt",
+    "DeadLetter",
+    "ReminderStat",
+    "ReminderJob",
+    "SchedulerSignal",
     "User",
     "ReminderStatus",
     "CallAttemptStatus",
+    "DeadLetterKind",
+    "DeadLetterReason",
 ]
@@ -0,0 +1,85 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy import Uuid as UUID
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.db.database import Base
+from app.models.reminder import ReminderStatus, CallAttemptStatus
+
+
+class ArchivedReminder(Base):
+    """Finished reminders moved out of the hot reminders table by the retention archiver."""
+
+    __tablename__ = "reminders_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+
+    title = Column(String(100), nullable=False)
+    message = Column(Text, nullable=False)
+    phone_number = Column(String(20), nullable=False)
+
+    scheduled_for = Column(DateTime(timezone=True), nullable=False)
+    timezone = Column(String(50), nullable=False)
+
+    recurrence_rule = Column(String(255), nullable=True)
+    series_id = Column(UUID(as_uuid=True), nullable=True)
+    occurrence_index = Column(Integer, default=0, server_default="0", nullable=False)
+
+    status = Column(SQLEnum(ReminderStatus), nullable=False)
+    vapi_call_id = Column(String(100), nullable=True)
+    failure_reason = Column(Text, nullable=True)
+    retry_count = Column(Integer, nullable=False)
+
+    attempt_count = Column(Integer, default=0, nullable=False)
+    last_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    last_attempt_status = Column(SQLEnum(CallAttemptStatus), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+    call_attempts = relationship(
+        "ArchivedCallAttempt",
+        back_populates="reminder",
+        cascade="all, delete-orphan",
+        order_by="ArchivedCallAttempt.attempt_number",
+    )
+
+    __table_args__ = (Index("idx_reminders_archive_user", "user_id"),)
+
+    archived = True
+
+    def __repr__(self):
+        return f"<ArchivedReminder(id={self.id}, title='{self.title}', status='{self.status}')>"
+
+
+class ArchivedCallAttempt(Base):
+    __tablename__ = "call_attempts_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    reminder_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("reminders_archive.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    attempt_number = Column(Integer, nullable=False)
+    status = Column(SQLEnum(CallAttemptStatus), nullable=False)
+    vapi_call_id = Column(String(100), nullable=True)
+
+    duration_seconds = Column(Integer, nullable=True)
+    failure_reason = Column(Text, nullable=True)
+
+    initiated_at = Column(DateTime(timezone=True), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    reminder = relationship("ArchivedReminder", back_populates="call_attempts")
+
+    __table_args__ = (
+        Index("idx_call_attempts_archive_reminder", "reminder_id"),
+        Index("idx_call_attempts_archive_initiated", "initiated_at"),
+    )
+
+    def __repr__(self):
+        return f"<ArchivedCallAttempt(id={self.id}, reminder_id={self.reminder_id}, attempt={self.attempt_number})>"
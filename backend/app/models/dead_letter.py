@@ -0,0 +1,54 @@
+from sqlalchemy import Column, DateTime, Enum as SQLEnum, Index, Integer, LargeBinary, Text
+from sqlalchemy import Uuid as UUID
+from sqlalchemy.sql import func
+import enum
+from app.db.database import Base
+
+
+class DeadLetterKind(str, enum.Enum):
+    DISPATCH = "dispatch"  # A reminder whose call could not be placed
+    WEBHOOK = "webhook"  # A Vapi event that could not be applied
+
+
+class DeadLetterReason(str, enum.Enum):
+    # Dispatch
+    TIMEOUT = "timeout"
+    RATE_LIMITED = "rate_limited"
+    PROVIDER_ERROR = "provider_error"  # Vapi answered 5xx
+    REJECTED = "rejected"  # Vapi answered 4xx: retrying the same request won't help
+    UNREACHABLE = "unreachable"  # No answer from Vapi at all
+    EXPIRED = "expired"  # Came due while nothing was dispatching
+    # Webhook
+    INVALID_PAYLOAD = "invalid_payload"
+    UNMATCHED = "unmatched"  # No call attempt (yet) for the call it reports on
+    # Either
+    INTERNAL = "internal"
+
+
+class DeadLetter(Base):
+    """A failed dispatch or unprocessable webhook, kept for inspection and replay.
+
+    No foreign key to reminders: dead letters outlive reminders that are deleted or
+    archived, and webhook events may name reminders that never existed here.
+    """
+
+    __tablename__ = "dead_letters"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(SQLEnum(DeadLetterKind), nullable=False)
+    reason = Column(SQLEnum(DeadLetterReason), nullable=False)
+    reminder_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+    error = Column(Text, nullable=True)
+    payload = Column(LargeBinary, nullable=True)  # Raw webhook body
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    replay_count = Column(Integer, default=0, server_default="0", nullable=False)
+    replayed_at = Column(DateTime(timezone=True), nullable=True)  # Set once a replay succeeds
+
+    __table_args__ = (
+        Index("idx_dead_letters_reason_created", "reason", "created_at"),
+    )
+
+    def __repr__(self):
+        return f"<DeadLetter(id={self.id}, kind='{self.kind}', reason='{self.reason}')>"
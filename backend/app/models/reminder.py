@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, DateTime, Integer, Text, ForeignKey, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Uuid as UUID
 from datetime import datetime
 import uuid
 import enum
@@ -22,6 +22,14 @@ class CallAttemptStatus(str, enum.Enum):
     NO_ANSWER = "no_answer"
 
 
+# A call for the reminder's latest attempt is still under way
+IN_PROGRESS_ATTEMPT_STATUSES = (
+    CallAttemptStatus.INITIATED,
+    CallAttemptStatus.RINGING,
+    CallAttemptStatus.ANSWERED,
+)
+
+
 class Reminder(Base):
     __tablename__ = "reminders"
 
@@ -35,6 +43,11 @@ class Reminder(Base):
     scheduled_for = Column(DateTime(timezone=True), nullable=False, index=True)
     timezone = Column(String(50), nullable=False)
 
+    # Recurring series materialize one occurrence at a time; see services/recurrence.py
+    recurrence_rule = Column(String(255), nullable=True)
+    series_id = Column(UUID(as_uuid=True), nullable=True)
+    occurrence_index = Column(Integer, default=0, server_default="0", nullable=False)
+
     status = Column(
         SQLEnum(ReminderStatus), default=ReminderStatus.SCHEDULED, nullable=False, index=True
     )
@@ -42,6 +55,11 @@ class Reminder(Base):
     failure_reason = Column(Text, nullable=True)
     retry_count = Column(Integer, default=0, nullable=False)
 
+    # Denormalized from call_attempts so dispatch and delete don't need to load the history
+    attempt_count = Column(Integer, default=0, nullable=False)
+    last_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    last_attempt_status = Column(SQLEnum(CallAttemptStatus), nullable=True)
+
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     updated_at = Column(
         DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
@@ -49,14 +67,21 @@ class Reminder(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
     call_attempts = relationship(
-        "CallAttempt", back_populates="reminder", cascade="all, delete-orphan"
+        "CallAttempt",
+        back_populates="reminder",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="CallAttempt.attempt_number",
     )
     user = relationship("User", back_populates="reminders")
 
     __table_args__ = (
         Index("idx_reminders_scheduled", "scheduled_for", "status"),
         Index("idx_reminders_status", "status"),
+        # The archiver takes finished reminders oldest updated_at first
+        Index("idx_reminders_status_updated", "status", "updated_at"),
         Index("idx_reminders_user", "user_id"),
+        Index("idx_reminders_series", "series_id", "occurrence_index", unique=True),
     )
 
     def __repr__(self):
@@ -86,7 +111,11 @@ class CallAttempt(Base):
 
     reminder = relationship("Reminder", back_populates="call_attempts")
 
-    __table_args__ = (Index("idx_call_attempts_reminder", "reminder_id"),)
+    __table_args__ = (
+        Index("idx_call_attempts_reminder", "reminder_id"),
+        # Finds in-flight attempts whose final webhook is overdue (call reconciler)
+        Index("idx_call_attempts_status_initiated", "status", "initiated_at"),
+    )
 
     def __repr__(self):
         return f"<CallAttempt(id={self.id}, reminder_id={self.reminder_id}, attempt={self.attempt_number}, status='{self.status}')>"
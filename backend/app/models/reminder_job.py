@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Float, Index
+from sqlalchemy import Uuid as UUID
+from app.db.database import Base
+
+
+class ReminderJob(Base):
+    """A pending promotion: at `promote_at` the reminder moves into the in-memory dispatch
+    wheel. Read and written only through ReminderJobStore, which rebuilds the APScheduler
+    job from these two columns instead of unpickling a stored one."""
+
+    __tablename__ = "reminder_jobs"
+
+    reminder_id = Column(UUID(as_uuid=True), primary_key=True)
+    promote_at = Column(Float, nullable=False)  # UTC epoch seconds
+
+    __table_args__ = (Index("idx_reminder_jobs_promote_at", "promote_at"),)
+
+    def __repr__(self):
+        return f"<ReminderJob(reminder_id={self.reminder_id}, promote_at={self.promote_at})>"
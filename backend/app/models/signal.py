@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy import Uuid as UUID
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class SchedulerSignal(Base):
+    """Outbox row telling the dispatcher worker that a reminder changed.
+
+    Rows carry no action: the worker re-reads the reminder and schedules or cancels it
+    based on its current state, so duplicate or reordered signals are harmless.
+    """
+
+    __tablename__ = "scheduler_signals"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    reminder_id = Column(UUID(as_uuid=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<SchedulerSignal(id={self.id}, reminder_id={self.reminder_id})>"
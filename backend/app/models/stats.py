@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy import Uuid as UUID
+from app.db.database import Base
+from app.models.reminder import ReminderStatus
+
+
+class ReminderStat(Base):
+    __tablename__ = "reminder_stats"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    status = Column(SQLEnum(ReminderStatus), nullable=False)
+
+    reminder_count = Column(Integer, default=0, nullable=False)
+    call_count = Column(Integer, default=0, nullable=False)
+    total_call_duration_seconds = Column(Integer, default=0, nullable=False)
+    total_call_cost = Column(Float, default=0.0, nullable=False)
+
+    __table_args__ = (Index("idx_reminder_stats_user_status", "user_id", "status"),)
+
+    def __repr__(self):
+        return (
+            f"<ReminderStat(user_id={self.user_id}, status='{self.status}', "
+            f"reminders={self.reminder_count})>"
+        )
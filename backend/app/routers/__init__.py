@@ -1,3 +1,3 @@
-from app.routers import reminders, webhooks
+from app.routers import health, reminders, webhooks
 
-__all__ = ["reminders", "webhooks"]
+__all__ = ["health", "reminders", "webhooks"]
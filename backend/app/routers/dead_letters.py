@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.db.database import get_db, get_read_db
+from app.models.dead_letter import DeadLetterKind, DeadLetterReason
+from app.schemas.dead_letter import (
+    DeadLetterListResponse,
+    DeadLetterReplay,
+    DeadLetterReplayResponse,
+    DeadLetterSelection,
+)
+from app.services.dead_letter_service import DeadLetterService
+
+router = APIRouter()
+
+
+@router.get("/", response_model=DeadLetterListResponse)
+def list_dead_letters(
+    kind: Optional[DeadLetterKind] = Query(None, description="dispatch or webhook"),
+    reason: Optional[DeadLetterReason] = Query(None, description="Error classification"),
+    reminder_id: Optional[List[UUID]] = Query(None, description="Repeat for several reminders"),
+    user_id: Optional[UUID] = Query(None),
+    created_from: Optional[datetime] = Query(None, description="Failed at or after"),
+    created_to: Optional[datetime] = Query(None, description="Failed before"),
+    replayed: Optional[bool] = Query(None, description="Only replayed (true) or pending (false)"),
+    after_id: Optional[int] = Query(None, description="next_after_id of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_read_db),
+):
+    selection = DeadLetterSelection(
+        kind=kind,
+        reason=reason,
+        reminder_ids=reminder_id,
+        user_id=user_id,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    return DeadLetterService.get_dead_letters(db, selection, replayed, after_id, limit)
+
+
+@router.post("/replay", response_model=DeadLetterReplayResponse)
+def replay_dead_letters(replay: DeadLetterReplay, db: Session = Depends(get_db)):
+    return DeadLetterService.replay(db, replay)
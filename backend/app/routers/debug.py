@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from typing import Optional
+
+from app.core.config import settings
+from app.core.profiling import get_profile_store, profiling_enabled
+
+router = APIRouter()
+
+
+def _check_access(x_profile: Optional[str]):
+    if not profiling_enabled():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if settings.PROFILING_TOKEN and x_profile != settings.PROFILING_TOKEN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid X-Profile")
+
+
+@router.get("/debug/profile")
+def profile_report(
+    top: int = Query(10, ge=1, le=100, description="Entries per list"),
+    x_profile: Optional[str] = Header(None),
+):
+    """Slowest routes, most expensive SQL statements and slowest recent requests among
+    the profiled ones"""
+    _check_access(x_profile)
+    return get_profile_store().report(top)
+
+
+@router.delete("/debug/profile", status_code=status.HTTP_204_NO_CONTENT)
+def reset_profile(x_profile: Optional[str] = Header(None)):
+    _check_access(x_profile)
+    get_profile_store().reset()
+    return None
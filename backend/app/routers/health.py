@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, Response, status
+from datetime import datetime
+
+from app.services.health_service import HealthMonitor, get_health_monitor
+
+router = APIRouter()
+
+
+def _serialize(snapshot: dict) -> dict:
+    checked_at = snapshot["checked_at"]
+    return {
+        **snapshot,
+        "timestamp": datetime.now().isoformat(),
+        "checked_at": checked_at.isoformat() if checked_at else None,
+    }
+
+
+@router.get("/health")
+def health_check(health_monitor: HealthMonitor = Depends(get_health_monitor)):
+    return _serialize(health_monitor.snapshot())
+
+
+@router.get("/health/live")
+def liveness():
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+def readiness(
+    response: Response, health_monitor: HealthMonitor = Depends(get_health_monitor)
+):
+    if not health_monitor.is_ready():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return _serialize(health_monitor.snapshot())
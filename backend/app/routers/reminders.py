@@ -1,19 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from datetime import datetime
+from functools import partial
 from typing import Optional
 from uuid import UUID
 import math
 
-from app.db.database import get_db
+from app.db.database import SessionLocal, get_db, get_read_bind, get_read_db
 from app.schemas.reminder import (
     ReminderCreate,
     ReminderUpdate,
     ReminderRetry,
     ReminderResponse,
     ReminderListResponse,
-    ReminderListItem,
+    ReminderStatsResponse,
+    ReminderCalendarResponse,
+    ReminderBulkSelection,
+    ReminderBulkReschedule,
+    BulkOperationResponse,
 )
+from app.services.calendar_service import CalendarService
+from app.services.export_service import MEDIA_TYPES, ExportService
 from app.services.reminder_service import ReminderService
+from app.services.retention_service import RetentionService
 
 router = APIRouter()
 
@@ -28,11 +38,17 @@ def list_reminders(
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     sort_by: str = Query("scheduled_for", description="Sort by field: scheduled_for, created_at"),
     sort_order: str = Query("asc", description="Sort order: asc, desc"),
-    db: Session = Depends(get_db),
+    scheduled_from: Optional[datetime] = Query(
+        None, description="Only reminders scheduled at or after this time"
+    ),
+    scheduled_to: Optional[datetime] = Query(
+        None, description="Only reminders scheduled before this time"
+    ),
+    db: Session = Depends(get_read_db),
 ):
     skip = (page - 1) * per_page
 
-    reminders, total = ReminderService.get_reminders(
+    rows, total = ReminderService.get_reminder_items(
         db=db,
         skip=skip,
         limit=per_page,
@@ -40,24 +56,103 @@ def list_reminders(
         search=search,
         sort_by=sort_by,
         sort_order=sort_order,
+        scheduled_from=scheduled_from,
+        scheduled_to=scheduled_to,
     )
 
     total_pages = math.ceil(total / per_page) if total > 0 else 0
 
-    reminder_items = []
-    for reminder in reminders:
-        reminder_dict = ReminderListItem.model_validate(reminder).model_dump()
-        reminder_dict["call_attempts_count"] = len(reminder.call_attempts)
-        reminder_items.append(ReminderListItem(**reminder_dict))
+    # Rows validate straight into the response, which is serialized here once rather than
+    # checked against response_model again
+    response = ReminderListResponse(
+        reminders=[row._mapping for row in rows],
+        total=total,
+        page=page,
+        per_page=per_page,
+        total_pages=total_pages,
+    )
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@router.get("/stats", response_model=ReminderStatsResponse)
+def get_reminder_stats(
+    user_id: Optional[UUID] = Query(None, description="Restrict counts to a single user"),
+    db: Session = Depends(get_read_db),
+):
+    return ReminderService.get_stats(db, user_id)
+
+
+@router.get("/calendar", response_model=ReminderCalendarResponse)
+def get_reminder_calendar(
+    start: datetime = Query(..., description="First day or hour; naive times are in `timezone`"),
+    end: datetime = Query(..., description="End of the range (exclusive)"),
+    timezone: str = Query("UTC", max_length=50, description="IANA timezone to bucket in"),
+    granularity: str = Query("day", pattern="^(day|hour)$", description="day or hour"),
+    user_id: Optional[UUID] = Query(None, description="Restrict counts to a single user"),
+    db: Session = Depends(get_read_db),
+):
+    return CalendarService.get_buckets(db, start, end, timezone, granularity, user_id)
+
 
-    return ReminderListResponse(
-        reminders=reminder_items, total=total, page=page, per_page=per_page, total_pages=total_pages
+@router.get("/export")
+def export_reminders(
+    request: Request,
+    export_format: str = Query(
+        "csv", alias="format", pattern="^(csv|ndjson)$", description="csv or ndjson"
+    ),
+    status: Optional[str] = Query(
+        None, description="Filter by status: all, scheduled, completed, failed"
+    ),
+    search: Optional[str] = Query(None, description="Search in title and message"),
+    include_attempts: bool = Query(True, description="Join each reminder's call attempts"),
+    scheduled_from: Optional[datetime] = Query(
+        None, description="Only reminders scheduled at or after this time"
+    ),
+    scheduled_to: Optional[datetime] = Query(
+        None, description="Only reminders scheduled before this time"
+    ),
+):
+    bind = get_read_bind(request)
+    session_factory = partial(SessionLocal, bind=bind) if bind is not None else SessionLocal
+    return StreamingResponse(
+        ExportService.stream(
+            export_format,
+            status,
+            search,
+            include_attempts,
+            session_factory,
+            scheduled_from=scheduled_from,
+            scheduled_to=scheduled_to,
+        ),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="reminders.{export_format}"'},
     )
 
 
+@router.post("/bulk/cancel", response_model=BulkOperationResponse)
+def bulk_cancel_reminders(selection: ReminderBulkSelection, db: Session = Depends(get_db)):
+    return ReminderService.bulk_cancel(db, selection)
+
+
+@router.post("/bulk/reschedule", response_model=BulkOperationResponse)
+def bulk_reschedule_reminders(selection: ReminderBulkReschedule, db: Session = Depends(get_db)):
+    return ReminderService.bulk_reschedule(db, selection)
+
+
+@router.post("/bulk/delete", response_model=BulkOperationResponse)
+def bulk_delete_reminders(selection: ReminderBulkSelection, db: Session = Depends(get_db)):
+    return ReminderService.bulk_delete(db, selection)
+
+
 @router.get("/{reminder_id}", response_model=ReminderResponse)
-def get_reminder(reminder_id: UUID, db: Session = Depends(get_db)):
-    reminder = ReminderService.get_reminder_by_id(db, reminder_id)
+def get_reminder(reminder_id: UUID, db: Session = Depends(get_read_db)):
+    # Live reminders come pre-serialized (and usually cached); archived ones don't change
+    # often enough to be worth caching
+    body = ReminderService.get_reminder_detail(db, reminder_id)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
+    reminder = RetentionService.get_archived_reminder(db, reminder_id)
 
     if not reminder:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reminder not found")
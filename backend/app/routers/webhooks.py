@@ -1,8 +1,14 @@
 from fastapi import APIRouter, Depends, Request, status
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 import logging
+import time
 
 from app.db.database import get_db
+from app.models.dead_letter import DeadLetterReason
+from app.services.dead_letter_service import DeadLetterService
+from app.services.vapi_service import vapi_service
+from app.services.webhook_capture import get_webhook_capture
 from app.services.webhook_service import webhook_service
 
 router = APIRouter()
@@ -11,27 +17,49 @@ logger = logging.getLogger(__name__)
 
 @router.post("/vapi", status_code=status.HTTP_200_OK)
 async def vapi_webhook(request: Request, db: Session = Depends(get_db)):
+    body = await request.body()
+    capture = get_webhook_capture()
+    if capture is not None:
+        capture.record(body, time.time())
+
+    event = None
     try:
-        event_data = await request.json()
+        # Decoded once from the raw bytes, keeping only the fields we use
+        event = vapi_service.decode_webhook(body)
 
         logger.info(
-            f"Received Vapi webhook: {event_data.get('type', 'unknown')} "
-            f"for call {event_data.get('call', {}).get('id', 'unknown')}"
+            "Received Vapi webhook: %s for call %s",
+            event.type or "unknown",
+            (event.call.id if event.call else None) or "unknown",
         )
 
-        result = webhook_service.process_vapi_webhook(db, event_data)
+        result = webhook_service.process_vapi_webhook(db, event)
 
         if result["status"] == "success":
             return {"message": "Webhook processed successfully", **result}
         elif result["status"] == "not_found":
-            logger.warning(f"Webhook processing: {result['message']}")
+            # Possibly ahead of the dispatch that records the call id; replayable later
+            logger.warning("Webhook processing: %s", result["message"])
+            DeadLetterService.record_webhook(
+                db, body, DeadLetterReason.UNMATCHED, result["message"], event
+            )
             return {"message": result["message"]}
         else:
-            logger.error(f"Webhook processing error: {result['message']}")
+            logger.error("Webhook processing error: %s", result["message"])
+            if result["status"] == "error":
+                DeadLetterService.record_webhook(
+                    db, body, DeadLetterReason.INTERNAL, result["message"], event
+                )
             return {"message": "Webhook received but processing failed", **result}
 
+    except ValidationError as e:
+        logger.error("Invalid Vapi webhook: %s", e)
+        DeadLetterService.record_webhook(db, body, DeadLetterReason.INVALID_PAYLOAD, str(e))
+        return {"message": "Webhook received but error occurred", "error": str(e)}
+
     except Exception as e:
-        logger.error(f"Error handling Vapi webhook: {str(e)}", exc_info=True)
+        logger.error("Error handling Vapi webhook: %s", e, exc_info=True)
+        DeadLetterService.record_webhook(db, body, DeadLetterReason.INTERNAL, str(e), event)
         return {"message": "Webhook received but error occurred", "error": str(e)}
 
 
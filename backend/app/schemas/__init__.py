@@ -4,6 +4,7 @@ from app.schemas.reminder import (
     ReminderResponse,
     ReminderListResponse,
     ReminderListItem,
+    ReminderStatsResponse,
     CallAttemptResponse,
 )
 
@@ -13,5 +14,6 @@ __all__ = [
     "ReminderResponse",
     "ReminderListResponse",
     "ReminderListItem",
+    "ReminderStatsResponse",
     "CallAttemptResponse",
 ]
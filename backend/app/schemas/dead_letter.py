@@ -0,0 +1,52 @@
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+from app.models.dead_letter import DeadLetterKind, DeadLetterReason
+
+
+class DeadLetterSelection(BaseModel):
+    """Dead letters to list or replay; every filter given must match."""
+
+    kind: Optional[DeadLetterKind] = None
+    reason: Optional[DeadLetterReason] = None
+    reminder_ids: Optional[List[UUID]] = Field(None, max_length=10_000)
+    user_id: Optional[UUID] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
+class DeadLetterReplay(DeadLetterSelection):
+    rate_per_second: Optional[float] = Field(
+        None, gt=0, le=1000, description="Calls per second (default DEAD_LETTER_REPLAY_RATE)"
+    )
+    limit: int = Field(10_000, ge=1, le=100_000, description="Dead letters to replay at most")
+
+
+class DeadLetterResponse(BaseModel):
+    id: int
+    kind: DeadLetterKind
+    reason: DeadLetterReason
+    reminder_id: Optional[UUID] = None
+    user_id: Optional[UUID] = None
+    error: Optional[str] = None
+    created_at: datetime
+    replay_count: int
+    replayed_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DeadLetterListResponse(BaseModel):
+    dead_letters: List[DeadLetterResponse]
+    by_reason: Dict[DeadLetterReason, int]  # Every match, not just this page
+    next_after_id: Optional[int] = None
+
+
+class DeadLetterReplayResponse(BaseModel):
+    matched: int
+    replayed: int
+    skipped: int
+    skipped_reasons: Dict[str, int]
+    rescheduled_from: Optional[datetime] = None
+    rescheduled_to: Optional[datetime] = None
@@ -1,9 +1,7 @@
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
-import phonenumbers
-import pytz
 from app.models.reminder import ReminderStatus, CallAttemptStatus
 
 
@@ -24,6 +22,9 @@ class ReminderBase(BaseModel):
     @field_validator("phone_number")
     @classmethod
     def validate_phone_number(cls, v: str) -> str:
+        # phonenumbers and pytz are imported on first validation to keep app startup fast
+        import phonenumbers
+
         try:
             parsed = phonenumbers.parse(v, None)
             if not phonenumbers.is_valid_number(parsed):
@@ -35,6 +36,8 @@ class ReminderBase(BaseModel):
     @field_validator("timezone")
     @classmethod
     def validate_timezone(cls, v: str) -> str:
+        import pytz
+
         if v not in pytz.all_timezones:
             raise ValueError(f"Invalid timezone: {v}. Must be a valid IANA timezone.")
         return v
@@ -74,8 +77,25 @@ class ReminderBase(BaseModel):
     )
 
 
+def _validate_recurrence_rule(v: Optional[str]) -> Optional[str]:
+    if v is None or not v.strip():
+        return None
+    from app.services.recurrence import RecurrenceRule
+
+    return str(RecurrenceRule.parse(v))
+
+
 class ReminderCreate(ReminderBase):
-    pass
+    recurrence_rule: Optional[str] = Field(
+        None,
+        max_length=255,
+        description="RRULE subset for repeating reminders (e.g., FREQ=WEEKLY;BYDAY=MO,WE)",
+    )
+
+    @field_validator("recurrence_rule")
+    @classmethod
+    def validate_recurrence_rule(cls, v: Optional[str]) -> Optional[str]:
+        return _validate_recurrence_rule(v)
 
 
 class ReminderUpdate(BaseModel):
@@ -84,17 +104,25 @@ class ReminderUpdate(BaseModel):
     phone_number: Optional[str] = Field(None, max_length=20)
     scheduled_for: Optional[datetime] = None
     timezone: Optional[str] = Field(None, max_length=50)
+    recurrence_rule: Optional[str] = Field(None, max_length=255)
 
     @field_validator("title", "message")
     @classmethod
     def strip_whitespace(cls, v: Optional[str]) -> Optional[str]:
         return v.strip() if v else v
 
+    @field_validator("recurrence_rule")
+    @classmethod
+    def validate_recurrence_rule(cls, v: Optional[str]) -> Optional[str]:
+        return _validate_recurrence_rule(v)
+
     @field_validator("phone_number")
     @classmethod
     def validate_phone_number(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
+        import phonenumbers
+
         try:
             parsed = phonenumbers.parse(v, None)
             if not phonenumbers.is_valid_number(parsed):
@@ -108,6 +136,8 @@ class ReminderUpdate(BaseModel):
     def validate_timezone(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
+        import pytz
+
         if v not in pytz.all_timezones:
             raise ValueError(f"Invalid timezone: {v}. Must be a valid IANA timezone.")
         return v
@@ -164,6 +194,57 @@ class ReminderRetry(BaseModel):
         return v
 
 
+class ReminderBulkSelection(BaseModel):
+    """Reminders a bulk operation applies to: explicit ids, filters, or both combined."""
+
+    ids: Optional[List[UUID]] = Field(None, max_length=10_000)
+    status: Optional[ReminderStatus] = None
+    user_id: Optional[UUID] = None
+    scheduled_from: Optional[datetime] = None
+    scheduled_to: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def require_selection(self) -> "ReminderBulkSelection":
+        # Refuse an empty selection rather than applying the operation to every reminder
+        if not self.ids and all(
+            value is None
+            for value in (self.status, self.user_id, self.scheduled_from, self.scheduled_to)
+        ):
+            raise ValueError("Provide ids or at least one filter")
+        return self
+
+
+class ReminderBulkReschedule(ReminderBulkSelection):
+    scheduled_for: Optional[datetime] = Field(None, description="New time for every reminder")
+    shift_seconds: Optional[int] = Field(None, description="Move every reminder by this offset")
+
+    @field_validator("scheduled_for")
+    @classmethod
+    def validate_future_date(cls, v: Optional[datetime]) -> Optional[datetime]:
+        return v if v is None else ReminderRetry.validate_future_date(v)
+
+    @model_validator(mode="after")
+    def require_one_change(self) -> "ReminderBulkReschedule":
+        if (self.scheduled_for is None) == (self.shift_seconds is None):
+            raise ValueError("Provide exactly one of scheduled_for or shift_seconds")
+        if self.shift_seconds == 0:
+            raise ValueError("shift_seconds must not be zero")
+        return self
+
+
+class BulkItemResult(BaseModel):
+    id: UUID
+    result: str
+    detail: Optional[str] = None
+    scheduled_for: Optional[datetime] = None
+
+
+class BulkOperationResponse(BaseModel):
+    succeeded: int
+    skipped: int
+    results: List[BulkItemResult]
+
+
 class CallAttemptResponse(BaseModel):
     id: UUID
     attempt_number: int
@@ -185,14 +266,21 @@ class ReminderResponse(BaseModel):
     phone_number: str
     scheduled_for: datetime
     timezone: str
+    recurrence_rule: Optional[str] = None
+    series_id: Optional[UUID] = None
+    occurrence_index: int = 0
     status: ReminderStatus
     vapi_call_id: Optional[str] = None
     failure_reason: Optional[str] = None
     retry_count: int
+    attempt_count: int = 0
+    last_attempt_at: Optional[datetime] = None
+    last_attempt_status: Optional[CallAttemptStatus] = None
     created_at: datetime
     updated_at: datetime
     completed_at: Optional[datetime] = None
     call_attempts: List[CallAttemptResponse] = []
+    archived: bool = False
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -212,6 +300,9 @@ class ReminderListItem(BaseModel):
     phone_number: str
     scheduled_for: datetime
     timezone: str
+    recurrence_rule: Optional[str] = None
+    series_id: Optional[UUID] = None
+    occurrence_index: int = 0
     status: ReminderStatus
     retry_count: int
     created_at: datetime
@@ -219,3 +310,29 @@ class ReminderListItem(BaseModel):
     call_attempts_count: int = 0
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ReminderCalendarBucket(BaseModel):
+    start: datetime  # Local start of the day or hour, with the caller's UTC offset
+    total: int
+    by_status: Dict[str, int]
+
+
+class ReminderCalendarResponse(BaseModel):
+    timezone: str
+    granularity: str
+    start: datetime
+    end: datetime
+    buckets: List[ReminderCalendarBucket]  # Only days or hours with reminders, in order
+
+
+class CallStatsSummary(BaseModel):
+    count: int
+    total_duration_seconds: int
+    total_cost: float
+
+
+class ReminderStatsResponse(BaseModel):
+    total: int
+    by_status: Dict[str, int]
+    calls: CallStatsSummary
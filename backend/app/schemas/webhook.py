@@ -0,0 +1,28 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+
+
+# Only the fields webhook handling reads are declared. Everything else in the payload
+# (transcripts, messages, recordings, analysis...) is skipped by the JSON parser without
+# becoming Python objects.
+
+
+class VapiCallMetadata(BaseModel):
+    reminder_id: Optional[str] = None
+    call_attempt_id: Optional[str] = None
+
+
+class VapiCall(BaseModel):
+    id: Optional[str] = None
+    status: Optional[str] = None
+    duration: Optional[float] = None
+    ended_reason: Optional[str] = Field(None, alias="endedReason")
+    cost: Optional[float] = None
+    metadata: Optional[VapiCallMetadata] = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class VapiWebhookEvent(BaseModel):
+    type: str = ""
+    call: Optional[VapiCall] = None
@@ -0,0 +1,163 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+import logging
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.orm import Session
+
+from app.models.reminder import Reminder
+
+logger = logging.getLogger(__name__)
+
+# strftime format of a bucket's local start, per granularity
+BUCKET_FORMATS = {"day": "%Y-%m-%d", "hour": "%Y-%m-%d %H:00:00"}
+# Widest range a single request may cover: a year of days or a month of hours
+MAX_RANGES = {"day": timedelta(days=366), "hour": timedelta(days=31)}
+
+
+def _timezone(name: str):
+    import pytz
+
+    try:
+        return pytz.timezone(name)
+    except pytz.UnknownTimeZoneError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid timezone: {name}. Must be a valid IANA timezone.",
+        )
+
+
+def _as_utc(value: datetime, tz) -> datetime:
+    # Naive bounds are wall-clock times in the caller's timezone
+    if value.tzinfo is None:
+        value = tz.localize(value)
+    return value.astimezone(timezone.utc)
+
+
+def offset_segments(tz, start: datetime, end: datetime) -> List[Tuple[datetime, int]]:
+    """(from, UTC offset in seconds) for each stretch of [start, end) over which tz keeps
+    the same offset, found by checking every day and bisecting down to the second."""
+
+    def offset(seconds: int) -> int:
+        moment = datetime.fromtimestamp(seconds, timezone.utc)
+        return int(moment.astimezone(tz).utcoffset().total_seconds())
+
+    first, last = int(start.timestamp()), int(end.timestamp())
+    segments = [(first, offset(first))]
+    day = first
+    while day < last:
+        following = min(day + 86400, last)
+        if offset(following) != segments[-1][1]:
+            low, high = day, following
+            while high - low > 1:
+                middle = (low + high) // 2
+                if offset(middle) == segments[-1][1]:
+                    low = middle
+                else:
+                    high = middle
+            segments.append((high, offset(high)))
+        day = following
+    return [(datetime.fromtimestamp(s, timezone.utc), o) for s, o in segments]
+
+
+def _local_bucket(db: Session, granularity: str, tz, start: datetime, end: datetime):
+    """SQL expressions for the local start of each reminder's bucket and the UTC offset,
+    in seconds, in force at its scheduled_for."""
+    if db.get_bind().dialect.name == "postgresql":
+        local = func.timezone(tz.zone, Reminder.scheduled_for)
+        offset = func.extract("epoch", local - func.timezone("UTC", Reminder.scheduled_for))
+        return func.date_trunc(granularity, local), offset
+
+    # SQLite has no timezone database: shift scheduled_for by the offset in force at the
+    # time, one CASE branch per DST change in the range, then truncate with strftime
+    segments = offset_segments(tz, start, end)
+
+    def per_segment(values):
+        if len(segments) == 1:
+            return values[0]
+        return case(
+            *[
+                (Reminder.scheduled_for < following, value)
+                for (following, _), value in zip(segments[1:], values)
+            ],
+            else_=values[-1],
+        )
+
+    offsets = [offset for _, offset in segments]
+    shift = per_segment([f"{offset:+d} seconds" for offset in offsets])
+    local = func.strftime(BUCKET_FORMATS[granularity], Reminder.scheduled_for, shift)
+    return local, per_segment([literal(offset) for offset in offsets])
+
+
+class CalendarService:
+    @staticmethod
+    def get_buckets(
+        db: Session,
+        start: datetime,
+        end: datetime,
+        timezone_name: str = "UTC",
+        granularity: str = "day",
+        user_id: Optional[UUID] = None,
+    ) -> Dict[str, Any]:
+        """Reminder counts by status for every day or hour of [start, end) in the caller's
+        timezone that has any, grouped in SQL over the scheduled_for index."""
+        tz = _timezone(timezone_name)
+        start, end = _as_utc(start, tz), _as_utc(end, tz)
+        if end <= start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="end must be after start"
+            )
+        if end - start > MAX_RANGES[granularity]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"A {granularity} calendar covers at most "
+                f"{MAX_RANGES[granularity].days} days",
+            )
+
+        local, offset = _local_bucket(db, granularity, tz, start, end)
+        # The hour repeated when clocks go back is two buckets, told apart by offset; a
+        # day is one bucket whatever happens within it
+        keys = [local.label("bucket")]
+        if granularity == "hour":
+            keys.append(offset.label("offset"))
+        filters = [Reminder.scheduled_for >= start, Reminder.scheduled_for < end]
+        if user_id is not None:
+            filters.append(Reminder.user_id == user_id)
+        rows = db.execute(
+            select(*keys, Reminder.status, func.count())
+            .where(*filters)
+            .group_by(*keys, Reminder.status)
+        ).all()
+
+        counts: Dict[Any, Dict[str, int]] = defaultdict(dict)
+        for row in rows:
+            counts[tuple(row[:-2])][row[-2].value] = row[-1]
+        buckets = []
+        for key, by_status in counts.items():
+            local_start = key[0]
+            if isinstance(local_start, str):
+                local_start = datetime.strptime(local_start, BUCKET_FORMATS[granularity])
+            if len(key) > 1:
+                utc_offset = timezone(timedelta(seconds=int(key[1])))
+                bucket_start = local_start.replace(tzinfo=utc_offset).astimezone(tz)
+            else:
+                bucket_start = tz.localize(local_start)
+            buckets.append(
+                {
+                    "start": bucket_start,
+                    "total": sum(by_status.values()),
+                    "by_status": by_status,
+                }
+            )
+        # Aware starts compare as instants, so the repeated hour's EDT half sorts first
+        buckets.sort(key=lambda bucket: bucket["start"])
+        return {
+            "timezone": tz.zone,
+            "granularity": granularity,
+            "start": start.astimezone(tz),
+            "end": end.astimezone(tz),
+            "buckets": buckets,
+        }
@@ -0,0 +1,259 @@
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set
+import logging
+import threading
+import time
+
+from sqlalchemy import func, or_, select, tuple_, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.database import SessionLocal
+from app.models.dead_letter import DeadLetterReason
+from app.models.reminder import IN_PROGRESS_ATTEMPT_STATUSES, Reminder, ReminderStatus
+from app.services.dead_letter_service import DeadLetterService
+from app.services.recurrence import RecurrenceService
+from app.services.reminder_cache import invalidate_reminders
+from app.services.stats_service import StatsService
+
+logger = logging.getLogger(__name__)
+
+EXPIRED_REASON = "Missed: came due while reminders were not being dispatched"
+
+
+def _epoch(value: datetime) -> float:
+    # SQLite hands timezone-aware columns back as naive UTC
+    return (value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value).timestamp()
+
+
+def _overdue_filters(overdue_before: datetime):
+    return (
+        Reminder.status == ReminderStatus.SCHEDULED,
+        Reminder.scheduled_for <= overdue_before,
+        or_(
+            Reminder.last_attempt_status.is_(None),
+            Reminder.last_attempt_status.notin_(IN_PROGRESS_ATTEMPT_STATUSES),
+        ),
+    )
+
+
+class CatchUpDispatcher:
+    """Drains reminders that came due while nothing was dispatching them.
+
+    Started once on startup with the boundary reschedule_all_pending used, so each
+    reminder is either on the timing wheel or in this backlog. Overdue reminders are
+    streamed in keyset pages, most late first, and handed to the scheduler's dispatch
+    pool at most `rate` per second with at most `concurrency` in flight, and only while
+    no on-time dispatch is waiting, so the backlog never delays live traffic. Reminders
+    more than `max_lateness` late, at startup or when their turn comes, are failed
+    instead of called.
+
+    `scheduler` provides submit_dispatch(reminder_id, user_id) -> Future, on_time_pending() and
+    schedule_reminders(reminders); `clock`/`sleep` are injectable for simulations.
+    """
+
+    def __init__(
+        self,
+        scheduler,
+        overdue_before: datetime,
+        max_lateness: timedelta,
+        rate: float,
+        concurrency: int,
+        batch_size: int = 1000,
+        session_factory: sessionmaker = SessionLocal,
+        clock: Callable[[], float] = time.time,
+        sleep: Optional[Callable[[float], Any]] = None,
+        idle_wait: float = 0.05,
+    ):
+        self.scheduler = scheduler
+        self.overdue_before = overdue_before
+        self.max_lateness = max_lateness
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.concurrency = max(1, concurrency)
+        self.batch_size = batch_size
+        self.session_factory = session_factory
+        self.clock = clock
+        self.idle_wait = idle_wait
+
+        self.state = "pending"
+        self.backlog = 0
+        self.dispatched = 0
+        self.expired = 0
+        self._drain_started: Optional[float] = None
+        self._next_at = 0.0
+        self._in_flight: Set[Future] = set()
+        self._stop = threading.Event()
+        self._sleep = sleep or self._stop.wait
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="CatchUp", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def status(self) -> Dict[str, Any]:
+        remaining = max(0, self.backlog - self.dispatched - self.expired)
+        rate = self.interval and 1.0 / self.interval
+        if self.dispatched and self._drain_started is not None:
+            elapsed = self.clock() - self._drain_started
+            if elapsed > 0:
+                rate = self.dispatched / elapsed
+        return {
+            "state": self.state,
+            "backlog": remaining,
+            "dispatched": self.dispatched,
+            "expired": self.expired,
+            "rate_per_second": round(rate, 2) if rate else None,
+            "eta_seconds": (round(remaining / rate, 1) if rate else None) if remaining else 0.0,
+        }
+
+    def _now(self) -> datetime:
+        return datetime.fromtimestamp(self.clock(), timezone.utc)
+
+    def run(self):
+        self.state = "draining"
+        try:
+            self._drain()
+            self.state = "stopped" if self._stop.is_set() else "done"
+        except Exception as e:
+            self.state = "failed"
+            logger.error("Catch-up dispatch failed: %s", e, exc_info=True)
+
+        logger.info(
+            "Catch-up %s: %d overdue reminders dispatched, %d too late and failed",
+            self.state,
+            self.dispatched,
+            self.expired,
+        )
+
+    def _drain(self):
+        filters = _overdue_filters(self.overdue_before)
+
+        db = self.session_factory()
+        try:
+            self.expired += self._expire(
+                db, filters, Reminder.scheduled_for < self._now() - self.max_lateness
+            )
+            self.backlog = self.expired + db.execute(
+                select(func.count()).select_from(Reminder).where(*filters)
+            ).scalar_one()
+        finally:
+            db.close()
+
+        if self.backlog:
+            logger.warning(
+                "%d reminders came due while not dispatching; catching up", self.backlog
+            )
+        self._drain_started = self.clock()
+
+        after = None
+        while not self._stop.is_set():
+            db = self.session_factory()
+            try:
+                query = (
+                    select(Reminder.id, Reminder.scheduled_for, Reminder.user_id)
+                    .where(*filters)
+                    .order_by(Reminder.scheduled_for, Reminder.id)
+                    .limit(self.batch_size)
+                )
+                if after is not None:
+                    query = query.where(
+                        tuple_(Reminder.scheduled_for, Reminder.id) > tuple_(*after)
+                    )
+                rows = db.execute(query).all()
+            finally:
+                db.close()
+            if not rows:
+                break
+
+            too_late = []
+            for row in rows:
+                deadline = _epoch(row.scheduled_for) + self.max_lateness.total_seconds()
+                if self.clock() > deadline:
+                    too_late.append(row.id)
+                    continue
+                if not self._wait_for_turn():
+                    break
+                if self.clock() > deadline:
+                    too_late.append(row.id)
+                    continue
+                future = self.scheduler.submit_dispatch(str(row.id), row.user_id)
+                self._in_flight.add(future)
+                self.dispatched += 1
+
+            if too_late:
+                db = self.session_factory()
+                try:
+                    self.expired += self._expire(db, filters, Reminder.id.in_(too_late))
+                finally:
+                    db.close()
+
+            after = (rows[-1].scheduled_for, rows[-1].id)
+            if len(rows) < self.batch_size:
+                break
+
+        wait(self._in_flight)
+
+    def _wait_for_turn(self) -> bool:
+        """Block until this backlog may dispatch one more reminder; False when stopping."""
+        while not self._stop.is_set():
+            if len(self._in_flight) >= self.concurrency:
+                _, self._in_flight = wait(
+                    self._in_flight, timeout=self.idle_wait, return_when=FIRST_COMPLETED
+                )
+                continue
+            # On-time reminders waiting for a dispatch worker go first
+            if self.scheduler.on_time_pending():
+                self._sleep(self.idle_wait)
+                continue
+            now = self.clock()
+            if self._next_at > now:
+                self._sleep(self._next_at - now)
+                continue
+            self._next_at = max(self._next_at, now) + self.interval
+            self._in_flight = {future for future in self._in_flight if not future.done()}
+            return True
+        return False
+
+    def _expire(self, db: Session, filters, condition) -> int:
+        rows = db.execute(
+            update(Reminder)
+            .where(*filters, condition)
+            .values(
+                status=ReminderStatus.FAILED,
+                failure_reason=EXPIRED_REASON,
+                updated_at=self._now(),
+            )
+            .returning(Reminder.id, Reminder.user_id, Reminder.recurrence_rule)
+            .execution_options(synchronize_session=False)
+        ).all()
+        if not rows:
+            return 0
+
+        StatsService.record_transitions(
+            db, ((row.user_id, ReminderStatus.SCHEDULED, ReminderStatus.FAILED) for row in rows)
+        )
+        DeadLetterService.record_dispatches(
+            db, ((row.id, row.user_id) for row in rows), DeadLetterReason.EXPIRED, EXPIRED_REASON
+        )
+        # A recurring series carries on from its next occurrence after now
+        next_occurrences: List[Reminder] = []
+        for row in rows:
+            if row.recurrence_rule:
+                following = RecurrenceService.materialize_next(
+                    db, db.get(Reminder, row.id), now=self._now()
+                )
+                if following is not None:
+                    next_occurrences.append(following)
+        db.commit()
+        invalidate_reminders(row.id for row in rows)
+
+        if next_occurrences:
+            self.scheduler.schedule_reminders(next_occurrences)
+        logger.warning("Failed %d reminders more than %s late", len(rows), self.max_lateness)
+        return len(rows)
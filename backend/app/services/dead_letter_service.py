@@ -0,0 +1,318 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+import logging
+import re
+
+from pydantic import ValidationError
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.orm import Session, defer
+
+from app.core.config import settings
+from app.models.dead_letter import DeadLetter, DeadLetterKind, DeadLetterReason
+from app.models.reminder import IN_PROGRESS_ATTEMPT_STATUSES, Reminder, ReminderStatus
+from app.schemas.dead_letter import DeadLetterReplay, DeadLetterSelection
+from app.schemas.webhook import VapiWebhookEvent
+from app.services.reminder_cache import invalidate_reminders
+from app.services.stats_service import StatsService
+from app.services.vapi_service import vapi_service
+
+logger = logging.getLogger(__name__)
+
+# Ids per IN (...) lookup, well under SQLite's variable limit
+CHUNK_SIZE = 1000
+# Webhook bodies loaded at a time during a replay
+WEBHOOK_BATCH_SIZE = 100
+
+_VAPI_ERROR = re.compile(r"Vapi API error: (\d{3})")
+_dead_letters = DeadLetter.__table__
+
+
+def classify_dispatch_error(error_message: Optional[str]) -> DeadLetterReason:
+    """Reason for a failed dispatch, from the error VapiService.trigger_call returned"""
+    message = error_message or ""
+    if message.startswith("Vapi API request timed out"):
+        return DeadLetterReason.TIMEOUT
+    if message.startswith("Could not reach Vapi API"):
+        return DeadLetterReason.UNREACHABLE
+    match = _VAPI_ERROR.match(message)
+    if match:
+        code = int(match.group(1))
+        if code == 429:
+            return DeadLetterReason.RATE_LIMITED
+        return DeadLetterReason.PROVIDER_ERROR if code >= 500 else DeadLetterReason.REJECTED
+    return DeadLetterReason.INTERNAL
+
+
+def dead_letter_filters(selection: DeadLetterSelection) -> list:
+    filters = []
+    if selection.kind is not None:
+        filters.append(DeadLetter.kind == selection.kind)
+    if selection.reason is not None:
+        filters.append(DeadLetter.reason == selection.reason)
+    if selection.reminder_ids:
+        filters.append(DeadLetter.reminder_id.in_(selection.reminder_ids))
+    if selection.user_id is not None:
+        filters.append(DeadLetter.user_id == selection.user_id)
+    if selection.created_from is not None:
+        filters.append(DeadLetter.created_at >= selection.created_from)
+    if selection.created_to is not None:
+        filters.append(DeadLetter.created_at < selection.created_to)
+    return filters
+
+
+def _uuid(value) -> Optional[UUID]:
+    try:
+        return UUID(str(value)) if value else None
+    except ValueError:
+        return None
+
+
+def _chunks(items: List, size: int = CHUNK_SIZE):
+    for offset in range(0, len(items), size):
+        yield items[offset : offset + size]
+
+
+class DeadLetterService:
+    @staticmethod
+    def record_dispatches(
+        db: Session,
+        reminders: Iterable[Tuple[UUID, Optional[UUID]]],
+        reason: DeadLetterReason,
+        error: Optional[str],
+    ):
+        """Add a dispatch dead letter per (reminder_id, user_id) to the caller's transaction"""
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "kind": DeadLetterKind.DISPATCH,
+                "reason": reason,
+                "reminder_id": reminder_id,
+                "user_id": user_id,
+                "error": error,
+                "created_at": now,
+                "replay_count": 0,
+            }
+            for reminder_id, user_id in reminders
+        ]
+        if rows:
+            db.execute(insert(DeadLetter), rows)
+
+    @staticmethod
+    def record_webhook(
+        db: Session,
+        body: bytes,
+        reason: DeadLetterReason,
+        error: Optional[str],
+        event: Optional[VapiWebhookEvent] = None,
+    ):
+        """Store a webhook that couldn't be applied, in its own transaction. Never raises:
+        losing the dead letter must not turn into an error response Vapi retries."""
+        metadata = event.call.metadata if event is not None and event.call else None
+        try:
+            db.add(
+                DeadLetter(
+                    kind=DeadLetterKind.WEBHOOK,
+                    reason=reason,
+                    reminder_id=_uuid(metadata.reminder_id) if metadata else None,
+                    error=error,
+                    payload=body,
+                    created_at=datetime.now(timezone.utc),
+                    replay_count=0,
+                )
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error("Failed to dead-letter webhook (%s): %s", reason.value, e)
+
+    @staticmethod
+    def get_dead_letters(
+        db: Session,
+        selection: DeadLetterSelection,
+        replayed: Optional[bool] = None,
+        after_id: Optional[int] = None,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """A page of matching dead letters, oldest first, plus counts by reason over every
+        match. Pass the returned next_after_id as after_id for the following page."""
+        filters = dead_letter_filters(selection)
+        if replayed is not None:
+            pending = DeadLetter.replayed_at.is_(None)
+            filters.append(~pending if replayed else pending)
+
+        query = select(DeadLetter).options(defer(DeadLetter.payload)).where(*filters)
+        if after_id is not None:
+            query = query.where(DeadLetter.id > after_id)
+        letters = db.execute(query.order_by(DeadLetter.id).limit(limit + 1)).scalars().all()
+
+        by_reason = db.execute(
+            select(DeadLetter.reason, func.count()).where(*filters).group_by(DeadLetter.reason)
+        ).all()
+        return {
+            "dead_letters": letters[:limit],
+            "by_reason": dict(by_reason),
+            "next_after_id": letters[limit - 1].id if len(letters) > limit else None,
+        }
+
+    @staticmethod
+    def replay(db: Session, request: DeadLetterReplay) -> Dict[str, Any]:
+        """Re-enqueue up to request.limit pending dead letters matching the request.
+
+        Failed reminders are rescheduled one every 1/rate seconds from now and dispatched
+        as usual, so replaying an outage's worth of calls doesn't hit Vapi all at once and
+        survives a restart. Webhook events are applied again right away, in arrival order.
+        A dead letter is marked replayed once its reminder is rescheduled or its event
+        applied; the rest stay pending and are counted under skipped_reasons.
+        """
+        rate = request.rate_per_second or settings.DEAD_LETTER_REPLAY_RATE
+        letters = db.execute(
+            select(DeadLetter.id, DeadLetter.kind, DeadLetter.reminder_id)
+            .where(*dead_letter_filters(request), DeadLetter.replayed_at.is_(None))
+            .order_by(DeadLetter.id)
+            .limit(request.limit)
+        ).all()
+
+        dispatches = [letter for letter in letters if letter.kind == DeadLetterKind.DISPATCH]
+        webhooks = [letter.id for letter in letters if letter.kind == DeadLetterKind.WEBHOOK]
+        skipped: Counter = Counter()
+        rescheduled = DeadLetterService._replay_dispatches(db, dispatches, rate, skipped)
+        replayed_webhooks = DeadLetterService._replay_webhooks(db, webhooks, skipped)
+
+        logger.info(
+            "Replayed %d dead letters: %d reminders rescheduled, %d webhooks applied",
+            len(letters) - sum(skipped.values()),
+            len(rescheduled),
+            replayed_webhooks,
+        )
+        return {
+            "matched": len(letters),
+            "replayed": len(letters) - sum(skipped.values()),
+            "skipped": sum(skipped.values()),
+            "skipped_reasons": dict(skipped),
+            "rescheduled_from": rescheduled[0].scheduled_for if rescheduled else None,
+            "rescheduled_to": rescheduled[-1].scheduled_for if rescheduled else None,
+        }
+
+    @staticmethod
+    def _replay_dispatches(db: Session, letters, rate: float, skipped: Counter) -> List:
+        # scheduler_service and webhook_service (through it) record dead letters with this
+        # module, so they are imported on use
+        from app.services.scheduler_service import get_scheduler
+
+        if not letters:
+            return []
+        reminder_ids = list(dict.fromkeys(letter.reminder_id for letter in letters))
+        found = {}
+        for chunk in _chunks(reminder_ids):
+            for row in db.execute(
+                select(
+                    Reminder.id, Reminder.user_id, Reminder.status, Reminder.last_attempt_status
+                ).where(Reminder.id.in_(chunk))
+            ):
+                found[row.id] = row
+
+        now = datetime.now(timezone.utc)
+        interval = 1.0 / rate
+        rescheduled = []
+        not_replayed = {}
+        for reminder_id in reminder_ids:
+            row = found.get(reminder_id)
+            if row is None:
+                not_replayed[reminder_id] = "reminder_not_found"
+            elif row.status != ReminderStatus.FAILED:
+                not_replayed[reminder_id] = f"reminder_{row.status.value}"
+            elif row.last_attempt_status in IN_PROGRESS_ATTEMPT_STATUSES:
+                not_replayed[reminder_id] = "call_in_progress"
+            else:
+                scheduled_for = now + timedelta(seconds=(len(rescheduled) + 1) * interval)
+                rescheduled.append(
+                    SimpleNamespace(id=row.id, user_id=row.user_id, scheduled_for=scheduled_for)
+                )
+        replayed_ids = []
+        for letter in letters:
+            reason = not_replayed.get(letter.reminder_id)
+            if reason:
+                skipped[reason] += 1
+            else:
+                replayed_ids.append(letter.id)
+
+        reminders = Reminder.__table__
+        if rescheduled:
+            db.execute(
+                update(reminders)
+                .where(
+                    reminders.c.id == bindparam("b_id"),
+                    reminders.c.status == ReminderStatus.FAILED,
+                )
+                .values(
+                    status=ReminderStatus.SCHEDULED,
+                    scheduled_for=bindparam("b_scheduled_for"),
+                    retry_count=reminders.c.retry_count + 1,
+                    updated_at=now,
+                ),
+                [{"b_id": r.id, "b_scheduled_for": r.scheduled_for} for r in rescheduled],
+            )
+            StatsService.record_transitions(
+                db,
+                ((r.user_id, ReminderStatus.FAILED, ReminderStatus.SCHEDULED) for r in rescheduled),
+            )
+        for chunk in _chunks(replayed_ids):
+            db.execute(
+                update(_dead_letters)
+                .where(_dead_letters.c.id.in_(chunk))
+                .values(replayed_at=now, replay_count=_dead_letters.c.replay_count + 1)
+            )
+        scheduler = get_scheduler()
+        scheduler.stage(db, [r.id for r in rescheduled])
+        db.commit()
+
+        if rescheduled:
+            invalidate_reminders(r.id for r in rescheduled)
+            scheduler.schedule_reminders(rescheduled)
+        return rescheduled
+
+    @staticmethod
+    def _replay_webhooks(db: Session, letter_ids: List[int], skipped: Counter) -> int:
+        from app.services.webhook_service import WebhookService
+
+        applied = []
+        errors = []
+        for chunk in _chunks(letter_ids, WEBHOOK_BATCH_SIZE):
+            payloads = db.execute(
+                select(DeadLetter.id, DeadLetter.payload)
+                .where(DeadLetter.id.in_(chunk))
+                .order_by(DeadLetter.id)
+            ).all()
+            for letter_id, payload in payloads:
+                try:
+                    event = vapi_service.decode_webhook(payload or b"")
+                except ValidationError as e:
+                    skipped[DeadLetterReason.INVALID_PAYLOAD.value] += 1
+                    errors.append({"b_id": letter_id, "b_error": str(e)})
+                    continue
+                result = WebhookService.process_vapi_webhook(db, event)
+                if result["status"] == "success":
+                    applied.append(letter_id)
+                else:
+                    skipped[result["status"]] += 1
+                    errors.append({"b_id": letter_id, "b_error": result.get("message")})
+
+        now = datetime.now(timezone.utc)
+        for chunk in _chunks(applied):
+            db.execute(
+                update(_dead_letters)
+                .where(_dead_letters.c.id.in_(chunk))
+                .values(replayed_at=now, replay_count=_dead_letters.c.replay_count + 1)
+            )
+        if errors:
+            db.execute(
+                update(_dead_letters)
+                .where(_dead_letters.c.id == bindparam("b_id"))
+                .values(error=bindparam("b_error"), replay_count=_dead_letters.c.replay_count + 1),
+                errors,
+            )
+        db.commit()
+        return len(applied)
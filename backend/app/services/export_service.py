@@ -0,0 +1,168 @@
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+from uuid import UUID
+import csv
+import enum
+import io
+import json
+import logging
+
+from app.db.database import SessionLocal
+from app.models.reminder import CallAttempt, Reminder
+from app.services.reminder_service import reminder_filters
+
+logger = logging.getLogger(__name__)
+
+REMINDER_FIELDS = (
+    "id",
+    "user_id",
+    "title",
+    "message",
+    "phone_number",
+    "scheduled_for",
+    "timezone",
+    "recurrence_rule",
+    "series_id",
+    "occurrence_index",
+    "status",
+    "failure_reason",
+    "retry_count",
+    "attempt_count",
+    "created_at",
+    "updated_at",
+    "completed_at",
+)
+ATTEMPT_FIELDS = (
+    "id",
+    "attempt_number",
+    "status",
+    "vapi_call_id",
+    "duration_seconds",
+    "failure_reason",
+    "initiated_at",
+    "completed_at",
+)
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+class ExportService:
+    """Streams reminders, joined with their call attempts, as CSV or NDJSON.
+
+    Rows come from a server-side cursor (`yield_per`) and are written out in chunks, so
+    memory stays flat however many reminders match. The generator opens and closes its
+    own session because it outlives the request handler.
+    """
+
+    @staticmethod
+    def _query(
+        status_filter: Optional[str],
+        search: Optional[str],
+        include_attempts: bool,
+        scheduled_from: Optional[datetime] = None,
+        scheduled_to: Optional[datetime] = None,
+    ):
+        statement = select(
+            *(getattr(Reminder, name).label(name) for name in REMINDER_FIELDS)
+        ).where(*reminder_filters(status_filter, search, scheduled_from, scheduled_to))
+
+        if not include_attempts:
+            return statement.order_by(Reminder.scheduled_for, Reminder.id)
+
+        return (
+            statement.add_columns(
+                *(getattr(CallAttempt, name).label(f"attempt_{name}") for name in ATTEMPT_FIELDS)
+            )
+            .outerjoin(CallAttempt, CallAttempt.reminder_id == Reminder.id)
+            .order_by(Reminder.scheduled_for, Reminder.id, CallAttempt.attempt_number)
+        )
+
+    @staticmethod
+    def stream(
+        export_format: str = "csv",
+        status_filter: Optional[str] = None,
+        search: Optional[str] = None,
+        include_attempts: bool = True,
+        session_factory: sessionmaker = SessionLocal,
+        batch_size: int = 1000,
+        scheduled_from: Optional[datetime] = None,
+        scheduled_to: Optional[datetime] = None,
+    ) -> Iterator[str]:
+        if export_format not in MEDIA_TYPES:
+            raise ValueError(f"Unsupported export format: {export_format}")
+
+        statement = ExportService._query(
+            status_filter, search, include_attempts, scheduled_from, scheduled_to
+        )
+        encode = ExportService._csv if export_format == "csv" else ExportService._ndjson
+
+        db = session_factory()
+        try:
+            rows = db.execute(statement.execution_options(yield_per=batch_size))
+            yield from encode(rows, include_attempts, batch_size)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _csv(rows, include_attempts: bool, batch_size: int) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        header = list(REMINDER_FIELDS)
+        if include_attempts:
+            header += [f"attempt_{name}" for name in ATTEMPT_FIELDS]
+        writer.writerow(header)
+
+        written = 0
+        for row in rows:
+            writer.writerow(["" if value is None else _plain(value) for value in row])
+            written += 1
+            if written % batch_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    @staticmethod
+    def _ndjson(rows, include_attempts: bool, batch_size: int) -> Iterator[str]:
+        # Rows arrive ordered by reminder, so each reminder's attempts are consecutive
+        lines = []
+        current: Optional[Dict[str, Any]] = None
+        reminder_width = len(REMINDER_FIELDS)
+
+        for row in rows:
+            if current is None or row.id != current["_id"]:
+                if current is not None:
+                    del current["_id"]
+                    lines.append(json.dumps(current, separators=(",", ":")))
+                    if len(lines) >= batch_size:
+                        yield "\n".join(lines) + "\n"
+                        lines = []
+                current = {name: _plain(value) for name, value in zip(REMINDER_FIELDS, row)}
+                current["_id"] = row.id
+                if include_attempts:
+                    current["call_attempts"] = []
+
+            if include_attempts and row.attempt_id is not None:
+                current["call_attempts"].append(
+                    {
+                        name: _plain(value)
+                        for name, value in zip(ATTEMPT_FIELDS, row[reminder_width:])
+                    }
+                )
+
+        if current is not None:
+            del current["_id"]
+            lines.append(json.dumps(current, separators=(",", ":")))
+        if lines:
+            yield "\n".join(lines) + "\n"
@@ -0,0 +1,154 @@
+from collections import Counter, deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_Task = Tuple[Future, Callable, tuple]
+
+
+def parse_weights(spec: str) -> Dict[str, int]:
+    """DISPATCH_USER_WEIGHTS ("<user_id>=4,<user_id>=2") as {user_id: weight}"""
+    weights = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        key, _, value = item.partition("=")
+        try:
+            weights[key.strip()] = max(1, int(value))
+        except ValueError:
+            logger.warning("Ignoring invalid dispatch weight %r", item)
+    return weights
+
+
+class FairDispatcher:
+    """Worker pool that shares its threads fairly between tenants (users).
+
+    Work is queued per tenant and handed to `workers` threads by deficit round-robin:
+    tenants with queued work take turns, each getting `weight` dispatches per turn (1
+    unless configured), so a tenant with 50k due reminders gets the same share of free
+    workers as one with a single reminder instead of everything queued ahead of it.
+    `max_per_tenant` additionally caps how many workers one tenant may occupy at once
+    (0 = no cap). Within a tenant, work runs in submission order.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_per_tenant: int = 0,
+        weights: Optional[Dict[str, int]] = None,
+        thread_name_prefix: str = "dispatch",
+    ):
+        self.workers = workers
+        self.max_per_tenant = max_per_tenant
+        self.weights = weights or {}
+        self.thread_name_prefix = thread_name_prefix
+
+        self._queues: Dict[Hashable, Deque[_Task]] = {}
+        # Tenants with queued work, in turn order; the head is the tenant being served
+        self._turns: Deque[Hashable] = deque()
+        self._deficit: Counter = Counter()
+        self._running: Counter = Counter()
+        self._queued = 0
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        with self._cond:
+            self._stopping = False
+        self._threads = [
+            threading.Thread(
+                target=self._work, name=f"{self.thread_name_prefix}_{i}", daemon=True
+            )
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work; queued work still runs before the workers exit."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+
+    def submit(self, tenant: Any, fn: Callable, *args) -> Future:
+        future: Future = Future()
+        key = str(tenant) if tenant is not None else None
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("cannot schedule new dispatches after shutdown")
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+                self._turns.append(key)
+            queue.append((future, fn, args))
+            self._queued += 1
+            self._cond.notify()
+        return future
+
+    def pending(self) -> int:
+        """Queued work not yet picked up by a worker"""
+        return self._queued
+
+    def running(self, tenant: Any = None) -> int:
+        return self._running[str(tenant) if tenant is not None else None]
+
+    def _weight(self, key) -> int:
+        return self.weights.get(key, 1)
+
+    def _next(self) -> Optional[Tuple[Hashable, _Task]]:
+        # Tenants at their cap keep their place but are skipped until a call finishes
+        for _ in range(len(self._turns)):
+            key = self._turns[0]
+            if self.max_per_tenant and self._running[key] >= self.max_per_tenant:
+                self._turns.rotate(-1)
+                continue
+
+            if self._deficit[key] < 1:
+                self._deficit[key] += self._weight(key)
+            queue = self._queues[key]
+            task = queue.popleft()
+            self._deficit[key] -= 1
+            self._running[key] += 1
+            self._queued -= 1
+
+            if not queue:
+                # An idle tenant doesn't bank credit for later
+                self._turns.popleft()
+                del self._queues[key]
+                del self._deficit[key]
+            elif self._deficit[key] < 1:
+                self._turns.rotate(-1)
+            return key, task
+        return None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                picked = self._next()
+                while picked is None:
+                    if self._stopping and not self._queued:
+                        return
+                    self._cond.wait()
+                    picked = self._next()
+
+            key, (future, fn, args) = picked
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            with self._cond:
+                self._running[key] -= 1
+                if not self._running[key]:
+                    del self._running[key]
+                # A freed slot may unblock a capped tenant another worker is waiting on
+                self._cond.notify_all()
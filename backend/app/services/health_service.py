@@ -0,0 +1,147 @@
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional
+import logging
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.db.database import get_engine
+from app.services.scheduler_service import ReminderScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """Keeps a periodically refreshed health snapshot so probes never touch the database
+    or the job store themselves."""
+
+    def __init__(
+        self,
+        reminder_scheduler: Optional[ReminderScheduler],
+        db_engine: Engine,
+        refresh_interval: float = 15.0,
+        db_timeout: float = 2.0,
+    ):
+        self.reminder_scheduler = reminder_scheduler
+        self.db_engine = db_engine
+        self.refresh_interval = refresh_interval
+        self.db_timeout = db_timeout
+
+        self._snapshot: Dict[str, Any] = {
+            "status": "starting",
+            "checked_at": None,
+            "database": {"status": "unknown"},
+            "scheduler": {"status": "unknown", "scheduled_jobs": None},
+        }
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._ping_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="health-ping")
+        self._pending_ping: Optional[Future] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="HealthMonitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.db_timeout + 1)
+            self._thread = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self._snapshot
+
+    def is_ready(self) -> bool:
+        snapshot = self._snapshot
+        if snapshot["status"] != "healthy" or snapshot["checked_at"] is None:
+            return False
+        age = (datetime.now(timezone.utc) - snapshot["checked_at"]).total_seconds()
+        return age <= self.refresh_interval * 3
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.refresh_interval)
+
+    def refresh(self) -> Dict[str, Any]:
+        database = self._check_database()
+        scheduler_status = self._check_scheduler()
+
+        healthy = database["status"] == "connected" and scheduler_status["status"] in (
+            "running",
+            "external",
+        )
+
+        # Swap the whole dict so readers never see a half-updated snapshot
+        self._snapshot = {
+            "status": "healthy" if healthy else "degraded",
+            "checked_at": datetime.now(timezone.utc),
+            "database": database,
+            "scheduler": scheduler_status,
+        }
+        return self._snapshot
+
+    def _ping(self) -> None:
+        with self.db_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    def _check_database(self) -> Dict[str, Any]:
+        # A ping stuck on a dead connection keeps its worker busy; don't pile up more behind it
+        if self._pending_ping is None or self._pending_ping.done():
+            self._pending_ping = self._ping_executor.submit(self._ping)
+
+        started = datetime.now(timezone.utc)
+        try:
+            self._pending_ping.result(timeout=self.db_timeout)
+        except FutureTimeoutError:
+            return {"status": "timeout", "timeout_seconds": self.db_timeout}
+        except Exception as e:
+            logger.warning("Health check database ping failed: %s", e)
+            return {"status": "error", "error": str(e)}
+
+        latency = (datetime.now(timezone.utc) - started).total_seconds()
+        return {"status": "connected", "latency_ms": round(latency * 1000, 2)}
+
+    def _check_scheduler(self) -> Dict[str, Any]:
+        if self.reminder_scheduler is None:
+            # Dispatch runs in the standalone worker (SCHEDULER_MODE=worker)
+            return {"status": "external"}
+
+        alive = self.reminder_scheduler.is_alive()
+
+        scheduled_jobs = None
+        if alive:
+            try:
+                scheduled_jobs = self.reminder_scheduler.count_scheduled_jobs()
+            except Exception as e:
+                logger.warning("Health check job count failed: %s", e)
+
+        last_dispatch_at = self.reminder_scheduler.last_dispatch_at
+        return {
+            "status": "running" if alive else "stopped",
+            "scheduled_jobs": scheduled_jobs,
+            "in_memory_due": self.reminder_scheduler.count_in_memory(),
+            "last_dispatch_at": last_dispatch_at.isoformat() if last_dispatch_at else None,
+            "dispatch_lag_seconds": self.reminder_scheduler.last_dispatch_lag_seconds,
+            # Backlog left from downtime, with its drain rate and ETA (None if never needed)
+            "catch_up": self.reminder_scheduler.catch_up_status(),
+        }
+
+
+@lru_cache()
+def get_health_monitor() -> HealthMonitor:
+    """Process-wide monitor, built on first use (lifespan or the first probe) so importing
+    the app doesn't create engines or the scheduler"""
+    return HealthMonitor(
+        ReminderScheduler() if settings.SCHEDULER_MODE != "worker" else None,
+        get_engine(),
+        refresh_interval=settings.HEALTH_REFRESH_SECONDS,
+        db_timeout=settings.HEALTH_DB_TIMEOUT_SECONDS,
+    )
@@ -0,0 +1,212 @@
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session, sessionmaker
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.logging_config import log_context
+from app.db.database import SessionLocal
+from app.models.reminder import CallAttempt, IN_PROGRESS_ATTEMPT_STATUSES
+from app.services.vapi_service import vapi_service
+from app.services.webhook_service import WebhookService
+
+logger = logging.getLogger(__name__)
+
+NEVER_PLACED_REASON = "Call was never confirmed by Vapi"
+UNAVAILABLE_REASON = "Call status unavailable from Vapi"
+
+
+class RateLimiter:
+    """Spaces out the start of async calls to at most `rate` per second (0 = unlimited)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def _fetch_calls(
+    vapi_call_ids: Sequence[Optional[str]], concurrency: int, rate: float
+) -> List[Optional[Dict[str, Any]]]:
+    """Look up many calls at once, at most `concurrency` in flight and `rate` started per
+    second, over one shared HTTP client. Results line up with the input; None where the
+    id is missing or Vapi couldn't answer."""
+    import httpx
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = RateLimiter(rate)
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+
+        async def fetch(vapi_call_id):
+            if not vapi_call_id:
+                return None
+            async with semaphore:
+                await limiter.wait()
+                return await vapi_service.get_call_status(vapi_call_id, client=client)
+
+        return await asyncio.gather(*(fetch(vapi_call_id) for vapi_call_id in vapi_call_ids))
+
+
+def _failed_event(row, reason: str) -> Dict[str, Any]:
+    return {
+        "event_type": "call.failed",
+        "vapi_call_id": row.vapi_call_id,
+        "reminder_id": str(row.reminder_id),
+        "call_attempt_id": str(row.id),
+        "status": "ended",
+        "duration_seconds": None,
+        "end_reason": reason,
+        "cost": None,
+    }
+
+
+class ReconciliationService:
+    @staticmethod
+    def find_stale_attempts(
+        db: Session,
+        older_than: datetime,
+        give_up_before: datetime,
+        limit: int,
+        after=None,
+    ):
+        """In-flight attempts started before `older_than`, oldest first, continuing after
+        the (initiated_at, id) cursor `after`. Served by idx_call_attempts_status_initiated."""
+        attempts = CallAttempt.__table__
+        query = (
+            select(
+                attempts.c.id,
+                attempts.c.reminder_id,
+                attempts.c.vapi_call_id,
+                attempts.c.initiated_at,
+                (attempts.c.initiated_at < give_up_before).label("expired"),
+            )
+            .where(
+                attempts.c.status.in_(IN_PROGRESS_ATTEMPT_STATUSES),
+                attempts.c.initiated_at < older_than,
+            )
+            .order_by(attempts.c.initiated_at, attempts.c.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(tuple_(attempts.c.initiated_at, attempts.c.id) > tuple_(*after))
+        return db.execute(query).all()
+
+    @staticmethod
+    def apply_results(db: Session, rows, calls) -> Dict[str, int]:
+        """Apply what Vapi said about each stale attempt through the webhook handlers.
+
+        Ended calls get the event their lost webhook would have carried. Attempts that
+        never got a call id fail outright; calls Vapi can't report on fail once they're
+        past the give-up age. Calls still in progress are left alone.
+        """
+        counts = {"resolved": 0, "in_flight": 0, "unknown": 0, "abandoned": 0, "errors": 0}
+
+        for row, call in zip(rows, calls):
+            if call is not None:
+                event = vapi_service.parse_call_status(call, str(row.reminder_id), str(row.id))
+                if event is None:
+                    counts["in_flight"] += 1
+                    continue
+                outcome = "resolved"
+            elif not row.vapi_call_id:
+                event, outcome = _failed_event(row, NEVER_PLACED_REASON), "abandoned"
+            elif row.expired:
+                event, outcome = _failed_event(row, UNAVAILABLE_REASON), "abandoned"
+            else:
+                counts["unknown"] += 1
+                continue
+
+            with log_context(
+                vapi_call_id=row.vapi_call_id,
+                reminder_id=str(row.reminder_id),
+                call_attempt_id=str(row.id),
+            ):
+                try:
+                    result = WebhookService.apply_call_event(db, event)
+                except Exception as e:
+                    db.rollback()
+                    logger.error("Failed to reconcile call attempt %s: %s", row.id, e)
+                    result = {"status": "error"}
+
+            counts[outcome if result["status"] == "success" else "errors"] += 1
+
+        return counts
+
+    @staticmethod
+    def reconcile_stale_attempts(
+        now: Optional[datetime] = None,
+        session_factory: sessionmaker = SessionLocal,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        max_batches: Optional[int] = None,
+    ) -> Dict[str, int]:
+        now = now or datetime.now(timezone.utc)
+        older_than = now - timedelta(minutes=settings.RECONCILE_STALE_AFTER_MINUTES)
+        give_up_before = now - timedelta(minutes=settings.RECONCILE_GIVE_UP_MINUTES)
+        batch_size = batch_size or settings.RECONCILE_BATCH_SIZE
+        concurrency = concurrency or settings.RECONCILE_CONCURRENCY
+        rate = settings.RECONCILE_RATE_PER_SECOND if rate is None else rate
+
+        totals = {"resolved": 0, "in_flight": 0, "unknown": 0, "abandoned": 0, "errors": 0}
+        after = None
+        batches = 0
+        # No transaction stays open while Vapi is being asked: read, close, fetch, then apply
+        while max_batches is None or batches < max_batches:
+            db = session_factory()
+            try:
+                rows = ReconciliationService.find_stale_attempts(
+                    db, older_than, give_up_before, batch_size, after
+                )
+            finally:
+                db.close()
+            if not rows:
+                break
+
+            calls = asyncio.run(
+                _fetch_calls([row.vapi_call_id for row in rows], concurrency, rate)
+            )
+
+            db = session_factory()
+            try:
+                counts = ReconciliationService.apply_results(db, rows, calls)
+            finally:
+                db.close()
+
+            for key, value in counts.items():
+                totals[key] += value
+            after = (rows[-1].initiated_at, rows[-1].id)
+            batches += 1
+            if len(rows) < batch_size:
+                break
+
+        if totals["resolved"] or totals["abandoned"] or totals["errors"]:
+            logger.info(
+                "Reconciled stale calls: %d resolved, %d abandoned, %d still in flight, "
+                "%d unknown, %d errors",
+                totals["resolved"],
+                totals["abandoned"],
+                totals["in_flight"],
+                totals["unknown"],
+                totals["errors"],
+            )
+        return totals
+
+
+def run_call_reconciler():
+    if settings.RECONCILE_STALE_AFTER_MINUTES > 0:
+        ReconciliationService.reconcile_stale_attempts()
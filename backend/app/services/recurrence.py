@@ -0,0 +1,234 @@
+"""RRULE subset for recurring reminders.
+
+Supported parts: FREQ=DAILY|WEEKLY|MONTHLY, INTERVAL, BYDAY (WEEKLY only), COUNT and
+UNTIL. Occurrences keep the wall-clock time of the first one in the reminder's own
+timezone, so a 09:00 America/New_York reminder stays at 09:00 across DST changes.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.models.reminder import Reminder, ReminderStatus
+from app.services.stats_service import StatsService
+
+logger = logging.getLogger(__name__)
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    freq: str
+    interval: int = 1
+    byday: Tuple[int, ...] = ()
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+
+    @classmethod
+    def parse(cls, text: str) -> "RecurrenceRule":
+        """Parse "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10"; raises ValueError on anything else."""
+        body = text.strip()
+        if body.upper().startswith("RRULE:"):
+            body = body[len("RRULE:") :]
+
+        parts = {}
+        for part in filter(None, body.split(";")):
+            key, sep, value = part.partition("=")
+            key = key.strip().upper()
+            if not sep or not value.strip():
+                raise ValueError(f"Malformed recurrence rule part: {part!r}")
+            if key in parts:
+                raise ValueError(f"Duplicate recurrence rule part: {key}")
+            parts[key] = value.strip().upper()
+
+        unsupported = set(parts) - {"FREQ", "INTERVAL", "BYDAY", "COUNT", "UNTIL"}
+        if unsupported:
+            raise ValueError(f"Unsupported recurrence rule parts: {', '.join(sorted(unsupported))}")
+
+        freq = parts.get("FREQ")
+        if freq not in FREQUENCIES:
+            raise ValueError(f"FREQ must be one of {', '.join(FREQUENCIES)}")
+
+        interval = _positive_int(parts.get("INTERVAL", "1"), "INTERVAL")
+        count = _positive_int(parts["COUNT"], "COUNT") if "COUNT" in parts else None
+        if count is not None and "UNTIL" in parts:
+            raise ValueError("COUNT and UNTIL cannot be combined")
+
+        byday: Tuple[int, ...] = ()
+        if "BYDAY" in parts:
+            if freq != "WEEKLY":
+                raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+            try:
+                byday = tuple(sorted({WEEKDAYS.index(day) for day in parts["BYDAY"].split(",")}))
+            except ValueError:
+                raise ValueError(f"BYDAY must list days from {','.join(WEEKDAYS)}")
+
+        until = _parse_until(parts["UNTIL"]) if "UNTIL" in parts else None
+
+        return cls(freq=freq, interval=interval, byday=byday, count=count, until=until)
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until.strftime('%Y%m%dT%H%M%SZ')}")
+        return ";".join(parts)
+
+    def _next_local(self, current: datetime) -> datetime:
+        """The occurrence after `current`, both naive wall-clock times."""
+        if self.freq == "DAILY":
+            return current + timedelta(days=self.interval)
+
+        if self.freq == "WEEKLY":
+            if not self.byday:
+                return current + timedelta(weeks=self.interval)
+            weekday = current.weekday()
+            later = [day for day in self.byday if day > weekday]
+            if later:
+                return current + timedelta(days=later[0] - weekday)
+            week_start = current - timedelta(days=weekday)
+            return week_start + timedelta(weeks=self.interval, days=self.byday[0])
+
+        # MONTHLY: same day of month, skipping months that don't have it (RFC 5545)
+        year, month = current.year, current.month
+        while True:
+            month += self.interval
+            year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+            try:
+                return current.replace(year=year, month=month)
+            except ValueError:
+                continue
+
+    def next_occurrence(
+        self, current: datetime, tz_name: str, occurrence_index: int, after: datetime
+    ) -> Optional[Tuple[datetime, int]]:
+        """First occurrence following `current` (aware) that is later than `after`.
+
+        Returns (UTC datetime, its occurrence index) or None once COUNT/UNTIL is exhausted.
+        Occurrences missed while the service was down are skipped, but still count
+        towards COUNT.
+        """
+        import pytz
+
+        tz = pytz.timezone(tz_name)
+        local = current.astimezone(tz).replace(tzinfo=None)
+        index = occurrence_index
+
+        while True:
+            local = self._next_local(local)
+            index += 1
+            if self.count is not None and index >= self.count:
+                return None
+            # Non-existent wall times (spring forward) move forward by the gap
+            candidate = tz.normalize(tz.localize(local, is_dst=False)).astimezone(timezone.utc)
+            if self.until is not None and candidate > self.until:
+                return None
+            if candidate > after:
+                return candidate, index
+
+
+class RecurrenceService:
+    @staticmethod
+    def materialize_next(
+        db: Session, reminder: Reminder, now: Optional[datetime] = None
+    ) -> Optional[Reminder]:
+        """Add the occurrence after `reminder` to the session once it has finished.
+
+        Only one occurrence of a series exists as SCHEDULED at a time; the caller commits
+        and hands the returned reminder to the scheduler. Returns None for one-off
+        reminders, exhausted series, or when the next occurrence already exists.
+        """
+        if not reminder.recurrence_rule:
+            return None
+
+        now = now or datetime.now(timezone.utc)
+        current = reminder.scheduled_for
+        if current.tzinfo is None:
+            # SQLite hands timezone-aware columns back as naive UTC
+            current = current.replace(tzinfo=timezone.utc)
+
+        try:
+            rule = RecurrenceRule.parse(reminder.recurrence_rule)
+        except ValueError as e:
+            logger.error("Reminder %s has an invalid recurrence rule: %s", reminder.id, e)
+            return None
+
+        following = rule.next_occurrence(
+            current, reminder.timezone, reminder.occurrence_index or 0, max(now, current)
+        )
+        if following is None:
+            logger.info("Recurring series for reminder %s is complete", reminder.id)
+            return None
+
+        if reminder.series_id is None:
+            reminder.series_id = reminder.id
+
+        already_materialized = (
+            db.query(Reminder.id)
+            .filter(
+                Reminder.series_id == reminder.series_id,
+                Reminder.occurrence_index > (reminder.occurrence_index or 0),
+            )
+            .first()
+        )
+        if already_materialized:
+            return None
+
+        scheduled_for, occurrence_index = following
+        next_reminder = Reminder(
+            user_id=reminder.user_id,
+            title=reminder.title,
+            message=reminder.message,
+            phone_number=reminder.phone_number,
+            scheduled_for=scheduled_for,
+            timezone=reminder.timezone,
+            recurrence_rule=reminder.recurrence_rule,
+            series_id=reminder.series_id,
+            occurrence_index=occurrence_index,
+            status=ReminderStatus.SCHEDULED,
+            retry_count=0,
+            created_at=now,
+            updated_at=now,
+        )
+        db.add(next_reminder)
+        StatsService.record_transition(db, reminder.user_id, None, ReminderStatus.SCHEDULED)
+
+        logger.info(
+            "Next occurrence %d of series %s materialized for %s",
+            occurrence_index,
+            reminder.series_id,
+            scheduled_for.isoformat(),
+        )
+        return next_reminder
+
+
+def _positive_int(value: str, name: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a positive integer")
+    if number < 1:
+        raise ValueError(f"{name} must be a positive integer")
+    return number
+
+
+def _parse_until(value: str) -> datetime:
+    for fmt in ("%Y%m%dT%H%M%SZ", "%Y%m%d"):
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if fmt == "%Y%m%d":
+            # A date-only UNTIL includes the whole day
+            parsed = datetime.combine(parsed.date(), datetime.max.time())
+        return parsed.replace(tzinfo=timezone.utc)
+    raise ValueError("UNTIL must look like 20260131 or 20260131T090000Z")
@@ -0,0 +1,240 @@
+from collections import OrderedDict
+from functools import lru_cache
+from select import select as wait_readable
+from typing import Any, Dict, Iterable, Optional, Tuple
+import logging
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+CACHE_CHANNEL = "reminder_cache"
+# NOTIFY payloads are limited to 8000 bytes; 36-character ids plus separators
+_IDS_PER_NOTIFY = 200
+
+_Entry = Tuple[Any, float, bytes]
+
+
+class ReminderCache:
+    """Bounded LRU of serialized reminder detail responses, keyed by reminder id.
+
+    Each entry remembers the reminder's version (its updated_at) and expires after
+    `ttl` seconds. Readers pass the version they just read so an entry written by an
+    older row is never served, and writers drop the ids they changed once committed.
+    A reader takes a `token()` before loading and hands it to `put`, which refuses the
+    body if the reminder was invalidated in between.
+
+    With `channel` on Postgres, invalidations are also broadcast with NOTIFY and every
+    process LISTENs for them; while that connection is up the cache is `trusted` and hits
+    skip the version lookup entirely. Any other process's write then reaches this cache
+    within a round trip, and the TTL bounds the rest.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        channel: bool = False,
+        session_factory: sessionmaker = SessionLocal,
+        clock=time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.channel = channel
+        self.session_factory = session_factory
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # Sequence number of each id's latest invalidation, for the last `maxsize` ids;
+        # _forgotten is the newest one dropped from it (or of the last clear)
+        self._sequence = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._forgotten = 0
+        self._lock = threading.Lock()
+        self._trusted = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    @property
+    def trusted(self) -> bool:
+        """True while cross-process invalidations are being received"""
+        return self._trusted
+
+    def get(self, reminder_id, version=None) -> Optional[bytes]:
+        """The cached body, unless missing, expired or (when given) of another version"""
+        key = str(reminder_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or entry[1] <= self.clock()
+                or (version is not None and entry[0] != version)
+            ):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def token(self) -> int:
+        """Take before reading a reminder whose body will be put"""
+        return self._sequence
+
+    def put(self, reminder_id, version, body: bytes, token: Optional[int] = None):
+        if not self.enabled:
+            return
+        key = str(reminder_id)
+        with self._lock:
+            if token is not None and self._invalidated.get(key, self._forgotten) > token:
+                # Invalidated since the body was read: it may predate that write
+                return
+            self._entries[key] = (version, self.clock() + self.ttl, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, reminder_ids: Iterable[Any]):
+        """Drop entries from this process only"""
+        with self._lock:
+            self._sequence += 1
+            for reminder_id in reminder_ids:
+                key = str(reminder_id)
+                self._entries.pop(key, None)
+                self._invalidated[key] = self._sequence
+                self._invalidated.move_to_end(key)
+            while len(self._invalidated) > max(self.maxsize, 1):
+                self._forgotten = self._invalidated.popitem(last=False)[1]
+
+    def invalidate(self, reminder_ids: Iterable[Any]):
+        """Drop entries here and, with the channel enabled, in every other process"""
+        if not self.enabled:
+            return
+        keys = [str(reminder_id) for reminder_id in reminder_ids]
+        if not keys:
+            return
+        self.discard(keys)
+        if self.channel:
+            self._publish(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sequence += 1
+            self._invalidated.clear()
+            self._forgotten = self._sequence
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "trusted": self._trusted,
+        }
+
+    def _publish(self, keys):
+        try:
+            with self.session_factory() as db:
+                if db.get_bind().dialect.name != "postgresql":
+                    return
+                for i in range(0, len(keys), _IDS_PER_NOTIFY):
+                    payload = ",".join(keys[i : i + _IDS_PER_NOTIFY])
+                    db.execute(
+                        text("SELECT pg_notify(:channel, :payload)"),
+                        {"channel": CACHE_CHANNEL, "payload": payload},
+                    )
+                db.commit()
+        except Exception as e:
+            # Other processes fall back on the TTL for these ids
+            logger.warning("Failed to publish %d reminder cache invalidations: %s", len(keys), e)
+
+    def start(self):
+        if not (self.enabled and self.channel):
+            return
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ReminderCache", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        self._trusted = False
+
+    def _listen(self):
+        with self.session_factory() as db:
+            engine = db.get_bind()
+        if engine.dialect.name != "postgresql":
+            logger.info("Reminder cache invalidation channel needs Postgres; checking versions")
+            return None
+        try:
+            connection = engine.raw_connection()
+            # Keep the autocommit connection out of the pool for good
+            connection.detach()
+            connection.driver_connection.autocommit = True
+            cursor = connection.cursor()
+            cursor.execute(f"LISTEN {CACHE_CHANNEL}")
+            cursor.close()
+            logger.info("Listening for reminder cache invalidations on %s", CACHE_CHANNEL)
+            return connection
+        except Exception as e:
+            logger.warning("LISTEN unavailable, reminder cache checks versions: %s", e)
+            return None
+
+    def _run(self):
+        while not self._stop.is_set():
+            listener = self._listen()
+            if listener is None:
+                self._stop.wait(5)
+                continue
+            # Anything published while we weren't listening is lost: start from empty
+            self.clear()
+            self._trusted = True
+            try:
+                driver_connection = listener.driver_connection
+                while not self._stop.is_set():
+                    readable, _, _ = wait_readable([driver_connection], [], [], 1.0)
+                    if not readable:
+                        continue
+                    driver_connection.poll()
+                    while driver_connection.notifies:
+                        notify = driver_connection.notifies.pop(0)
+                        self.discard(notify.payload.split(","))
+            except Exception as e:
+                logger.warning("Lost reminder cache invalidation channel: %s", e)
+                listener.invalidate()
+                listener = None
+            finally:
+                self._trusted = False
+                if listener is not None:
+                    listener.close()
+
+
+@lru_cache()
+def get_reminder_cache() -> ReminderCache:
+    """The process-wide detail cache (REMINDER_CACHE_SIZE=0 disables it)"""
+    return ReminderCache(
+        settings.REMINDER_CACHE_SIZE,
+        settings.REMINDER_CACHE_TTL_SECONDS,
+        channel=settings.REMINDER_CACHE_CHANNEL,
+    )
+
+
+def invalidate_reminders(reminder_ids: Iterable[Any]):
+    """Call after committing a change to these reminders"""
+    get_reminder_cache().invalidate(reminder_ids)
@@ -0,0 +1,207 @@
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from apscheduler.job import Job
+from apscheduler.jobstores.base import BaseJobStore, ConflictingIdError, JobLookupError
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.util import ref_to_obj
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+
+from app.db.database import get_engine
+from app.models.reminder_job import ReminderJob
+
+# Reminders per statement in bulk operations, well under SQLite's variable limit
+BULK_CHUNK_SIZE = 1000
+JOB_ID_PREFIX = "reminder_"
+PROMOTE_FUNC_REF = "app.services.scheduler_service:promote_reminder"
+
+_jobs = ReminderJob.__table__
+
+
+def job_id(reminder_id) -> str:
+    return f"{JOB_ID_PREFIX}{reminder_id}"
+
+
+def _reminder_id(value) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _timestamp(value: datetime) -> float:
+    # SQLite hands timezone-aware columns back as naive UTC
+    return (value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value).timestamp()
+
+
+class ReminderJobStore(BaseJobStore):
+    """APScheduler job store that only holds reminder promotion jobs.
+
+    Every job the scheduler keeps for a reminder is "call promote_reminder(<id>) at
+    <time>", so a row is just (reminder_id, promote_at) in the reminder_jobs table and the
+    Job object is rebuilt from it, instead of pickling and unpickling the whole job as
+    SQLAlchemyJobStore does. Anything else is rejected; periodic jobs belong in a memory
+    store. Besides the BaseJobStore interface, add_reminders/remove_reminders write many
+    jobs in one transaction.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None):
+        super().__init__()
+        self._engine = engine
+        self._prepared: Optional[Engine] = None
+        self._promote = None
+
+    @property
+    def engine(self) -> Engine:
+        # Resolved on use so the store can be built before the application's engine is
+        engine = self._engine or get_engine()
+        if self._prepared is not engine:
+            _jobs.create(engine, checkfirst=True)
+            self._prepared = engine
+        return engine
+
+    def start(self, scheduler, alias):
+        super().start(scheduler, alias)
+        self.engine  # Creates the table if migrations haven't
+
+    # APScheduler interface
+
+    def lookup_job(self, job_id: str) -> Optional[Job]:
+        reminder_id = self._parse_job_id(job_id)
+        if reminder_id is None:
+            return None
+        with self.engine.connect() as connection:
+            promote_at = connection.execute(
+                select(_jobs.c.promote_at).where(_jobs.c.reminder_id == reminder_id)
+            ).scalar()
+        return None if promote_at is None else self._build_job(reminder_id, promote_at)
+
+    def get_due_jobs(self, now: datetime) -> List[Job]:
+        return self._get_jobs(_jobs.c.promote_at <= _timestamp(now))
+
+    def get_next_run_time(self) -> Optional[datetime]:
+        with self.engine.connect() as connection:
+            promote_at = connection.execute(select(func.min(_jobs.c.promote_at))).scalar()
+        return None if promote_at is None else datetime.fromtimestamp(promote_at, timezone.utc)
+
+    def get_all_jobs(self) -> List[Job]:
+        return self._get_jobs()
+
+    def add_job(self, job: Job):
+        reminder_id, promote_at = self._row(job)
+        with self.engine.begin() as connection:
+            try:
+                connection.execute(
+                    insert(_jobs).values(reminder_id=reminder_id, promote_at=promote_at)
+                )
+            except IntegrityError:
+                raise ConflictingIdError(job.id)
+
+    def update_job(self, job: Job):
+        reminder_id, promote_at = self._row(job)
+        with self.engine.begin() as connection:
+            result = connection.execute(
+                _jobs.update()
+                .where(_jobs.c.reminder_id == reminder_id)
+                .values(promote_at=promote_at)
+            )
+            if result.rowcount == 0:
+                raise JobLookupError(job.id)
+
+    def remove_job(self, job_id: str):
+        reminder_id = self._parse_job_id(job_id)
+        if reminder_id is None or not self.remove_reminders([reminder_id]):
+            raise JobLookupError(job_id)
+
+    def remove_all_jobs(self):
+        with self.engine.begin() as connection:
+            connection.execute(delete(_jobs))
+
+    # Bulk operations
+
+    def add_reminders(self, jobs: Iterable[Tuple[object, datetime]]) -> int:
+        """Add or replace the promotion job of each (reminder_id, promote_at) pair."""
+        rows = {}
+        for reminder_id, promote_at in jobs:
+            rows[_reminder_id(reminder_id)] = _timestamp(promote_at)
+        reminder_ids = list(rows)
+        with self.engine.begin() as connection:
+            for offset in range(0, len(reminder_ids), BULK_CHUNK_SIZE):
+                chunk = reminder_ids[offset : offset + BULK_CHUNK_SIZE]
+                connection.execute(delete(_jobs).where(_jobs.c.reminder_id.in_(chunk)))
+                connection.execute(
+                    insert(_jobs),
+                    [{"reminder_id": key, "promote_at": rows[key]} for key in chunk],
+                )
+        return len(reminder_ids)
+
+    def remove_reminders(self, reminder_ids: Iterable) -> int:
+        """Drop the promotion jobs of these reminders; returns how many existed."""
+        reminder_ids = [_reminder_id(reminder_id) for reminder_id in reminder_ids]
+        removed = 0
+        with self.engine.begin() as connection:
+            for offset in range(0, len(reminder_ids), BULK_CHUNK_SIZE):
+                chunk = reminder_ids[offset : offset + BULK_CHUNK_SIZE]
+                removed += connection.execute(
+                    delete(_jobs).where(_jobs.c.reminder_id.in_(chunk))
+                ).rowcount
+        return removed
+
+    def count(self) -> int:
+        with self.engine.connect() as connection:
+            return connection.execute(select(func.count()).select_from(_jobs)).scalar_one()
+
+    # Helpers
+
+    @staticmethod
+    def _parse_job_id(job_id: str) -> Optional[UUID]:
+        if not job_id.startswith(JOB_ID_PREFIX):
+            return None
+        try:
+            return UUID(job_id[len(JOB_ID_PREFIX) :])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _row(job: Job) -> Tuple[UUID, float]:
+        reminder_id = ReminderJobStore._parse_job_id(job.id)
+        if job.func_ref != PROMOTE_FUNC_REF or reminder_id is None:
+            raise ValueError(f"ReminderJobStore only holds reminder promotions, not {job.id!r}")
+        if job.next_run_time is None:
+            raise ValueError(f"Reminder promotion {job.id!r} can't be paused")
+        return reminder_id, _timestamp(job.next_run_time)
+
+    def _build_job(self, reminder_id: UUID, promote_at: float) -> Job:
+        # Job.__setstate__ without resolving the function reference for every job
+        if self._promote is None:
+            self._promote = ref_to_obj(PROMOTE_FUNC_REF)
+        key = str(reminder_id)
+        run_at = datetime.fromtimestamp(promote_at, timezone.utc)
+        job = Job.__new__(Job)
+        job.id = JOB_ID_PREFIX + key
+        job.func_ref = PROMOTE_FUNC_REF
+        job.func = self._promote
+        job.trigger = DateTrigger(run_date=run_at, timezone=timezone.utc)
+        job.executor = "default"
+        job.args = (key,)
+        job.kwargs = {}
+        job.name = f"Reminder {key}"
+        # Same as the scheduler's job defaults: a late promotion still dispatches
+        job.misfire_grace_time = None
+        job.coalesce = False
+        job.max_instances = 3
+        job.next_run_time = run_at
+        job._scheduler = self._scheduler
+        job._jobstore_alias = self._alias
+        return job
+
+    def _get_jobs(self, *conditions) -> List[Job]:
+        query = select(_jobs.c.reminder_id, _jobs.c.promote_at).order_by(_jobs.c.promote_at)
+        if conditions:
+            query = query.where(*conditions)
+        with self.engine.connect() as connection:
+            rows = connection.execute(query).all()
+        return [self._build_job(reminder_id, promote_at) for reminder_id, promote_at in rows]
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} (table={_jobs.name})>"
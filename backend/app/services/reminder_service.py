@@ -1,20 +1,139 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
-from typing import List, Optional
-from uuid import UUID
-from datetime import datetime
-from app.models.reminder import Reminder, ReminderStatus
-from app.schemas.reminder import ReminderCreate, ReminderUpdate
-from app.services.scheduler_service import scheduler
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import String, delete, exists, func, or_, select, update
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta, timezone
+from app.db.database import get_read_engines
+from app.models.reminder import IN_PROGRESS_ATTEMPT_STATUSES, Reminder, ReminderStatus
+from app.schemas.reminder import (
+    ReminderBulkReschedule,
+    ReminderBulkSelection,
+    ReminderCreate,
+    ReminderListItem,
+    ReminderResponse,
+    ReminderUpdate,
+)
+from app.services.reminder_cache import get_reminder_cache, invalidate_reminders
+from app.services.retention_service import RetentionService
+from app.services.scheduler_service import get_scheduler
+from app.services.stats_service import StatsService
 from fastapi import HTTPException, status
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+BULK_CANCEL_REASON = "Cancelled"
+# Same lower bound the schemas apply to a single reminder's scheduled_for
+MIN_LEAD_TIME = timedelta(seconds=30)
+# Exactly the columns a ReminderListItem is built from. attempt_count is kept in step with
+# call_attempts by the dispatcher, so the count needs no join.
+LIST_ITEM_COLUMNS = [
+    getattr(Reminder, name)
+    for name in ReminderListItem.model_fields
+    if name != "call_attempts_count"
+] + [Reminder.attempt_count.label("call_attempts_count")]
+
+
+def reminder_filters(
+    status_filter: Optional[str] = None,
+    search: Optional[str] = None,
+    scheduled_from: Optional[datetime] = None,
+    scheduled_to: Optional[datetime] = None,
+) -> list:
+    """WHERE clauses for the list endpoint's status, search and scheduled_for range
+    parameters."""
+    filters = []
+    if status_filter and status_filter != "all":
+        filters.append(Reminder.status == status_filter)
+    if search:
+        search_pattern = f"%{search}%"
+        filters.append(
+            or_(Reminder.title.ilike(search_pattern), Reminder.message.ilike(search_pattern))
+        )
+    if scheduled_from is not None:
+        filters.append(Reminder.scheduled_for >= scheduled_from)
+    if scheduled_to is not None:
+        filters.append(Reminder.scheduled_for < scheduled_to)
+    return filters
+
+
+def _not_in_progress(model=Reminder):
+    return or_(
+        model.last_attempt_status.is_(None),
+        model.last_attempt_status.notin_(IN_PROGRESS_ATTEMPT_STATUSES),
+    )
+
+
+def _selection_filters(selection: ReminderBulkSelection, model=Reminder) -> list:
+    filters = []
+    if selection.ids:
+        filters.append(model.id.in_(selection.ids))
+    if selection.status is not None:
+        filters.append(model.status == selection.status)
+    if selection.user_id is not None:
+        filters.append(model.user_id == selection.user_id)
+    if selection.scheduled_from is not None:
+        filters.append(model.scheduled_for >= selection.scheduled_from)
+    if selection.scheduled_to is not None:
+        filters.append(model.scheduled_for < selection.scheduled_to)
+    return filters
+
+
+def _shifted_scheduled_for(db: Session, seconds: int):
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite keeps DateTime as 'YYYY-MM-DD HH:MM:SS.ffffff' text; shift the seconds
+        # and carry the fractional part over unchanged so the stored format is preserved
+        return func.strftime(
+            "%Y-%m-%d %H:%M:%S", Reminder.scheduled_for, f"{seconds:+d} seconds", type_=String
+        ).concat(func.substr(Reminder.scheduled_for, 20))
+    return Reminder.scheduled_for + timedelta(seconds=seconds)
+
+
+def _bulk_response(
+    db: Session,
+    selection: ReminderBulkSelection,
+    results: List[Dict[str, Any]],
+    allowed_statuses: Optional[Set[ReminderStatus]] = None,
+    unmatched_detail: str = "Does not match the selection",
+    skipped: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Adds a skipped entry, with the reason, for every requested id the statement missed
+    and that isn't already among `skipped`."""
+    skipped = list(skipped or ())
+    done = {result["id"] for result in results + skipped}
+    missing = [
+        reminder_id for reminder_id in dict.fromkeys(selection.ids or ()) if reminder_id not in done
+    ]
+
+    if missing:
+        found = {
+            row.id: row
+            for row in db.execute(
+                select(Reminder.id, Reminder.status, Reminder.last_attempt_status).where(
+                    Reminder.id.in_(missing)
+                )
+            )
+        }
+        for reminder_id in missing:
+            row = found.get(reminder_id)
+            if row is None:
+                skipped.append({"id": reminder_id, "result": "not_found"})
+                continue
+            if allowed_statuses and row.status not in allowed_statuses:
+                detail = f"Reminder status is '{row.status.value}'"
+            elif row.last_attempt_status in IN_PROGRESS_ATTEMPT_STATUSES:
+                detail = "Call in progress"
+            else:
+                detail = unmatched_detail
+            skipped.append({"id": reminder_id, "result": "skipped", "detail": detail})
+
+    return {"succeeded": len(results), "skipped": len(skipped), "results": results + skipped}
+
+
 class ReminderService:
     @staticmethod
-    def get_reminders(
+    def get_reminder_items(
         db: Session,
         skip: int = 0,
         limit: int = 20,
@@ -22,34 +141,63 @@ class ReminderService:
         search: Optional[str] = None,
         sort_by: str = "scheduled_for",
         sort_order: str = "asc",
-    ) -> tuple[List[Reminder], int]:
-        query = db.query(Reminder)
-
-        if status_filter and status_filter != "all":
-            query = query.filter(Reminder.status == status_filter)
-
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(Reminder.title.ilike(search_pattern), Reminder.message.ilike(search_pattern))
-            )
-
-        total = query.count()
+        scheduled_from: Optional[datetime] = None,
+        scheduled_to: Optional[datetime] = None,
+    ) -> tuple[List[Any], int]:
+        """A page of the list endpoint and the total: plain rows of LIST_ITEM_COLUMNS rather
+        than Reminder instances, so nothing goes through the identity map or change
+        tracking."""
+        filters = reminder_filters(status_filter, search, scheduled_from, scheduled_to)
+        total = db.execute(
+            select(func.count()).select_from(Reminder).where(*filters)
+        ).scalar_one()
 
         sort_column = getattr(Reminder, sort_by, Reminder.scheduled_for)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
-        else:
-            query = query.order_by(sort_column.asc())
-
-        reminders = query.offset(skip).limit(limit).all()
+        order = sort_column.desc() if sort_order == "desc" else sort_column.asc()
+        rows = db.execute(
+            select(*LIST_ITEM_COLUMNS).where(*filters).order_by(order).offset(skip).limit(limit)
+        ).all()
+        return rows, total
 
-        return reminders, total
+    @staticmethod
+    def get_stats(db: Session, user_id: Optional[UUID] = None) -> dict:
+        return StatsService.get_stats(db, user_id)
 
     @staticmethod
     def get_reminder_by_id(db: Session, reminder_id: UUID) -> Optional[Reminder]:
         return db.query(Reminder).filter(Reminder.id == reminder_id).first()
 
+    @staticmethod
+    def get_reminder_detail(db: Session, reminder_id: UUID) -> Optional[bytes]:
+        """The reminder's ReminderResponse as JSON, from the detail cache when it holds the
+        current version; None if there is no live reminder with this id.
+
+        Only primary-bound sessions fill the cache, and with read replicas configured the
+        version is always checked: a lagging replica must neither cache an old body nor
+        be served over a newer one."""
+        cache = get_reminder_cache()
+        replicas = get_read_engines()
+        token = cache.token()
+        version = None
+        if cache.enabled and (replicas or not cache.trusted):
+            # A primary-key lookup of one column instead of the reminder and its attempts
+            version = db.execute(
+                select(Reminder.updated_at).where(Reminder.id == reminder_id)
+            ).scalar_one_or_none()
+            if version is None:
+                return None
+        body = cache.get(reminder_id, version) if cache.enabled else None
+        if body is not None:
+            return body
+
+        reminder = ReminderService.get_reminder_by_id(db, reminder_id)
+        if not reminder:
+            return None
+        body = ReminderResponse.model_validate(reminder).model_dump_json().encode()
+        if db.get_bind() not in replicas:
+            cache.put(reminder_id, reminder.updated_at, body, token)
+        return body
+
     @staticmethod
     def create_reminder(db: Session, reminder_data: ReminderCreate) -> Reminder:
         existing = (
@@ -67,12 +215,16 @@ class ReminderService:
                 detail="A reminder already exists for this exact time. Please choose a different time.",
             )
 
+        reminder_id = uuid4()
         db_reminder = Reminder(
+            id=reminder_id,
             title=reminder_data.title,
             message=reminder_data.message,
             phone_number=reminder_data.phone_number,
             scheduled_for=reminder_data.scheduled_for,
             timezone=reminder_data.timezone,
+            recurrence_rule=reminder_data.recurrence_rule,
+            series_id=reminder_id if reminder_data.recurrence_rule else None,
             status=ReminderStatus.SCHEDULED,
             retry_count=0,
             created_at=datetime.now(),
@@ -80,6 +232,9 @@ class ReminderService:
         )
 
         db.add(db_reminder)
+        StatsService.record_transition(db, db_reminder.user_id, None, ReminderStatus.SCHEDULED)
+        scheduler = get_scheduler()
+        scheduler.stage(db, [reminder_id])
         db.commit()
         db.refresh(db_reminder)
 
@@ -128,9 +283,16 @@ class ReminderService:
         for field, value in update_data.items():
             setattr(db_reminder, field, value)
 
+        if db_reminder.recurrence_rule and db_reminder.series_id is None:
+            db_reminder.series_id = db_reminder.id
+
         db_reminder.updated_at = datetime.now()
 
+        scheduler = get_scheduler()
+        if time_changed:
+            scheduler.stage(db, [reminder_id])
         db.commit()
+        invalidate_reminders([reminder_id])
         db.refresh(db_reminder)
 
         if time_changed:
@@ -146,18 +308,30 @@ class ReminderService:
         db_reminder = ReminderService.get_reminder_by_id(db, reminder_id)
 
         if not db_reminder:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reminder not found")
-
-        if db_reminder.call_attempts:
-            latest_attempt = db_reminder.call_attempts[-1]
-            if latest_attempt.status in ["initiated", "ringing"]:
+            archived = RetentionService.get_archived_reminder(db, reminder_id)
+            if not archived:
                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Cannot delete reminder while call is in progress. Please wait for the call to complete.",
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Reminder not found"
                 )
 
+            StatsService.record_transition(db, archived.user_id, archived.status, None)
+            db.delete(archived)
+            db.commit()
+            logger.info(f"Archived reminder {reminder_id} deleted")
+            return True
+
+        if db_reminder.last_attempt_status in IN_PROGRESS_ATTEMPT_STATUSES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot delete reminder while call is in progress. Please wait for the call to complete.",
+            )
+
+        StatsService.record_transition(db, db_reminder.user_id, db_reminder.status, None)
         db.delete(db_reminder)
+        scheduler = get_scheduler()
+        scheduler.stage(db, [reminder_id])
         db.commit()
+        invalidate_reminders([reminder_id])
 
         if scheduler.cancel_reminder(db_reminder.id):
             logger.info(f"Reminder {db_reminder.id} deleted and job cancelled successfully")
@@ -181,12 +355,18 @@ class ReminderService:
                 detail=f"Cannot retry reminder with status '{db_reminder.status}'. Only 'failed' reminders can be retried.",
             )
 
+        StatsService.record_transition(
+            db, db_reminder.user_id, db_reminder.status, ReminderStatus.SCHEDULED
+        )
         db_reminder.scheduled_for = new_scheduled_time
         db_reminder.status = ReminderStatus.SCHEDULED
         db_reminder.retry_count += 1
         db_reminder.updated_at = datetime.now()
 
+        scheduler = get_scheduler()
+        scheduler.stage(db, [reminder_id])
         db.commit()
+        invalidate_reminders([reminder_id])
         db.refresh(db_reminder)
 
         if scheduler.schedule_reminder(db_reminder):
@@ -195,3 +375,138 @@ class ReminderService:
             logger.error(f"Reminder {db_reminder.id} retried but failed to reschedule")
 
         return db_reminder
+
+    @staticmethod
+    def bulk_cancel(db: Session, selection: ReminderBulkSelection) -> Dict[str, Any]:
+        """Mark every selected scheduled reminder as failed ("Cancelled") in one UPDATE, so
+        it can still be retried later."""
+        rows = db.execute(
+            update(Reminder)
+            .where(
+                *_selection_filters(selection),
+                Reminder.status == ReminderStatus.SCHEDULED,
+                _not_in_progress(),
+            )
+            .values(
+                status=ReminderStatus.FAILED,
+                failure_reason=BULK_CANCEL_REASON,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .returning(Reminder.id, Reminder.user_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        StatsService.record_transitions(
+            db, ((row.user_id, ReminderStatus.SCHEDULED, ReminderStatus.FAILED) for row in rows)
+        )
+        scheduler = get_scheduler()
+        scheduler.stage(db, [row.id for row in rows])
+        db.commit()
+        invalidate_reminders(row.id for row in rows)
+
+        scheduler.cancel_reminders([row.id for row in rows])
+        logger.info("Bulk cancelled %d reminders", len(rows))
+
+        return _bulk_response(
+            db,
+            selection,
+            [{"id": row.id, "result": "cancelled"} for row in rows],
+            allowed_statuses={ReminderStatus.SCHEDULED},
+        )
+
+    @staticmethod
+    def bulk_reschedule(db: Session, selection: ReminderBulkReschedule) -> Dict[str, Any]:
+        """Move the selected scheduled reminders by shift_seconds, or one reminder to
+        scheduled_for. Reminders that would land on the exact time of another of their
+        user's scheduled reminders are left alone and reported as conflicts, as create and
+        update refuse that time."""
+        now = datetime.now(timezone.utc)
+
+        def moving(model) -> list:
+            filters = [
+                *_selection_filters(selection, model),
+                model.status == ReminderStatus.SCHEDULED,
+                _not_in_progress(model),
+            ]
+            if selection.shift_seconds is not None:
+                # Leave out reminders the shift would move into the past
+                earliest = now + MIN_LEAD_TIME - timedelta(seconds=selection.shift_seconds)
+                filters.append(model.scheduled_for > earliest)
+            return filters
+
+        filters = moving(Reminder)
+        if selection.shift_seconds is not None:
+            new_time = _shifted_scheduled_for(db, selection.shift_seconds)
+        else:
+            new_time = selection.scheduled_for.astimezone(timezone.utc)
+            if len(db.execute(select(Reminder.id).where(*filters).limit(2)).all()) > 1:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="scheduled_for would put every selected reminder at the same "
+                    "time. Select a single reminder or use shift_seconds.",
+                )
+
+        # Reminders moving together keep their spacing, so only ones staying put can clash
+        other, mover = aliased(Reminder), aliased(Reminder)
+        conflict = exists().where(
+            other.status == ReminderStatus.SCHEDULED,
+            other.user_id.is_not_distinct_from(Reminder.user_id),
+            other.scheduled_for == new_time,
+            other.id.notin_(select(mover.id).where(*moving(mover))),
+        )
+        conflicts = [
+            {
+                "id": reminder_id,
+                "result": "conflict",
+                "detail": "A reminder already exists for this exact time",
+            }
+            for reminder_id in db.scalars(select(Reminder.id).where(*filters, conflict))
+        ]
+
+        rows = db.execute(
+            update(Reminder)
+            .where(*filters, ~conflict)
+            .values(scheduled_for=new_time, updated_at=now)
+            .returning(Reminder.id, Reminder.scheduled_for)
+            .execution_options(synchronize_session=False)
+        ).all()
+        scheduler = get_scheduler()
+        scheduler.stage(db, [row.id for row in rows])
+        db.commit()
+        invalidate_reminders(row.id for row in rows)
+
+        scheduler.schedule_reminders(rows)
+        logger.info("Bulk rescheduled %d reminders", len(rows))
+
+        return _bulk_response(
+            db,
+            selection,
+            [
+                {"id": row.id, "result": "rescheduled", "scheduled_for": row.scheduled_for}
+                for row in rows
+            ],
+            allowed_statuses={ReminderStatus.SCHEDULED},
+            unmatched_detail="Does not match the selection or would move into the past",
+            skipped=conflicts,
+        )
+
+    @staticmethod
+    def bulk_delete(db: Session, selection: ReminderBulkSelection) -> Dict[str, Any]:
+        """Delete the selected live reminders (archived ones are untouched) in one DELETE;
+        call attempts go with them through ON DELETE CASCADE."""
+        rows = db.execute(
+            delete(Reminder)
+            .where(*_selection_filters(selection), _not_in_progress())
+            .returning(Reminder.id, Reminder.user_id, Reminder.status)
+            .execution_options(synchronize_session=False)
+        ).all()
+        StatsService.record_transitions(db, ((row.user_id, row.status, None) for row in rows))
+        cancelled = [row.id for row in rows if row.status == ReminderStatus.SCHEDULED]
+        scheduler = get_scheduler()
+        scheduler.stage(db, cancelled)
+        db.commit()
+        invalidate_reminders(row.id for row in rows)
+
+        scheduler.cancel_reminders(cancelled)
+        logger.info("Bulk deleted %d reminders", len(rows))
+
+        return _bulk_response(db, selection, [{"id": row.id, "result": "deleted"} for row in rows])
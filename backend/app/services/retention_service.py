@@ -0,0 +1,113 @@
+from sqlalchemy import DateTime, delete, insert, literal, select
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+import logging
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.archive import ArchivedCallAttempt, ArchivedReminder
+from app.models.reminder import CallAttempt, Reminder, ReminderStatus
+from app.services.reminder_cache import invalidate_reminders
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = (ReminderStatus.COMPLETED, ReminderStatus.FAILED)
+
+
+def _copy_columns(archive_table, live_table, archived_at: datetime):
+    names = [column.name for column in archive_table.columns if column.name != "archived_at"]
+    source = [live_table.c[name] for name in names]
+    if "archived_at" in archive_table.c:
+        names.append("archived_at")
+        source.append(literal(archived_at, DateTime(timezone=True)).label("archived_at"))
+    return names, source
+
+
+class RetentionService:
+    @staticmethod
+    def _finished_before(older_than: datetime, batch_size: int):
+        # Served by idx_reminders_status_updated rather than a scan of the whole table
+        return (
+            select(Reminder.id)
+            .where(Reminder.status.in_(FINISHED_STATUSES), Reminder.updated_at < older_than)
+            .order_by(Reminder.updated_at)
+            .limit(batch_size)
+        )
+
+    @staticmethod
+    def archive_batch(db: Session, older_than: datetime, batch_size: int) -> int:
+        reminder_ids = db.scalars(RetentionService._finished_before(older_than, batch_size)).all()
+
+        if not reminder_ids:
+            return 0
+
+        archived_at = datetime.now(timezone.utc)
+        reminders = Reminder.__table__
+        attempts = CallAttempt.__table__
+
+        names, source = _copy_columns(ArchivedReminder.__table__, reminders, archived_at)
+        db.execute(
+            insert(ArchivedReminder.__table__).from_select(
+                names, select(*source).where(reminders.c.id.in_(reminder_ids))
+            )
+        )
+
+        names, source = _copy_columns(ArchivedCallAttempt.__table__, attempts, archived_at)
+        db.execute(
+            insert(ArchivedCallAttempt.__table__).from_select(
+                names, select(*source).where(attempts.c.reminder_id.in_(reminder_ids))
+            )
+        )
+
+        db.execute(delete(attempts).where(attempts.c.reminder_id.in_(reminder_ids)))
+        db.execute(delete(reminders).where(reminders.c.id.in_(reminder_ids)))
+        db.commit()
+        invalidate_reminders(reminder_ids)
+
+        return len(reminder_ids)
+
+    @staticmethod
+    def archive_finished_reminders(
+        older_than: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        if older_than is None:
+            older_than = datetime.now(timezone.utc) - timedelta(
+                days=settings.RETENTION_ARCHIVE_AFTER_DAYS
+            )
+        batch_size = batch_size or settings.RETENTION_BATCH_SIZE
+
+        total = 0
+        batches = 0
+        # One short transaction per batch so the archiver never holds long locks on reminders
+        while max_batches is None or batches < max_batches:
+            db = SessionLocal()
+            try:
+                archived = RetentionService.archive_batch(db, older_than, batch_size)
+            except Exception as e:
+                db.rollback()
+                logger.error("Retention archiver batch failed: %s", e)
+                break
+            finally:
+                db.close()
+
+            total += archived
+            batches += 1
+            if archived < batch_size:
+                break
+
+        if total:
+            logger.info("Archived %d finished reminders older than %s", total, older_than)
+        return total
+
+    @staticmethod
+    def get_archived_reminder(db: Session, reminder_id: UUID) -> Optional[ArchivedReminder]:
+        return db.query(ArchivedReminder).filter(ArchivedReminder.id == reminder_id).first()
+
+
+def run_retention_archiver():
+    if settings.RETENTION_ARCHIVE_AFTER_DAYS > 0:
+        RetentionService.archive_finished_reminders()
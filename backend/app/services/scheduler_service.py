@@ -1,25 +1,74 @@
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-from apscheduler.executors.pool import ThreadPoolExecutor
-from apscheduler.triggers.date import DateTrigger
+from sqlalchemy import cast, insert, literal, or_, select, update
 from sqlalchemy.orm import Session
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, Optional
 import logging
 import asyncio
-from uuid import UUID
+import threading
+import time
+from uuid import UUID, uuid4
 
 from app.core.config import settings
+from app.core.logging_config import log_context
 from app.db.database import SessionLocal
-from app.models.reminder import Reminder, ReminderStatus, CallAttempt, CallAttemptStatus
+from app.models.reminder import (
+    IN_PROGRESS_ATTEMPT_STATUSES,
+    CallAttempt,
+    CallAttemptStatus,
+    Reminder,
+    ReminderStatus,
+)
+from app.models.dead_letter import DeadLetterReason
+from app.services.catch_up import CatchUpDispatcher
+from app.services.dead_letter_service import DeadLetterService, classify_dispatch_error
+from app.services.fair_dispatch import FairDispatcher, parse_weights
+from app.services.recurrence import RecurrenceService
+from app.services.reminder_cache import invalidate_reminders
+from app.services.scheduler_signals import SignalingScheduler
+from app.services.stats_service import StatsService
+from app.services.status_writer import get_status_writer
+from app.services.timing_wheel import TimingWheel
 from app.services.vapi_service import vapi_service
 
+# APScheduler (and tzlocal behind it) is imported where the scheduler is built, so API
+# processes that never construct a ReminderScheduler don't pay for it
+if TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    from app.services.reminder_jobstore import ReminderJobStore
+
 logger = logging.getLogger(__name__)
 
+# Reminders per job store statement in bulk operations, well under SQLite's variable limit
+BULK_CHUNK_SIZE = 1000
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands timezone-aware columns back as naive UTC
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
 
 class ReminderScheduler:
+    """Hybrid scheduler.
+
+    Reminders due further out than DISPATCH_WINDOW_SECONDS are persisted as APScheduler
+    jobs (one reminder_jobs row each) that only *promote* them shortly before they are
+    due. Promoted reminders live in an in-memory timing wheel, ticked every
+    DISPATCH_TICK_SECONDS by a dedicated thread, which hands them to the dispatch pool.
+    The wheel is rebuilt from the database on start.
+    """
+
     _instance: Optional["ReminderScheduler"] = None
-    _scheduler: Optional[BackgroundScheduler] = None
+    _scheduler: Optional["BackgroundScheduler"] = None
+    _jobstore: Optional["ReminderJobStore"] = None
+    _wheel: Optional[TimingWheel] = None
+    _wheel_thread: Optional[threading.Thread] = None
+    _dispatch_pool: Optional[FairDispatcher] = None
+    _catch_up: Optional[CatchUpDispatcher] = None
+    _on_time_pending = 0
+    last_dispatch_at: Optional[datetime] = None
+    last_dispatch_lag_seconds: Optional[float] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -28,47 +77,126 @@ class ReminderScheduler:
 
     def __init__(self):
         if self._scheduler is None:
-            jobstores = {"default": SQLAlchemyJobStore(url=settings.DATABASE_URL)}
+            from apscheduler.executors.pool import ThreadPoolExecutor
+            from apscheduler.jobstores.memory import MemoryJobStore
+            from apscheduler.schedulers.background import BackgroundScheduler
+
+            from app.services.reminder_jobstore import ReminderJobStore
+
+            # Periodic housekeeping jobs are re-registered on every start, so they don't
+            # need to be persisted alongside reminder jobs
+            self._jobstore = ReminderJobStore()
+            jobstores = {
+                "default": self._jobstore,
+                "maintenance": MemoryJobStore(),
+            }
 
             executors = {"default": ThreadPoolExecutor(10)}
 
-            job_defaults = {"coalesce": False, "max_instances": 3, "misfire_grace_time": 60}
+            # A late promotion still dispatches (late) instead of being dropped
+            job_defaults = {"coalesce": False, "max_instances": 3, "misfire_grace_time": None}
 
             self._scheduler = BackgroundScheduler(
                 jobstores=jobstores, executors=executors, job_defaults=job_defaults, timezone="UTC"
             )
 
-            logger.info("ReminderScheduler initialized with SQLAlchemy job store")
+            self._wheel = TimingWheel(tick=settings.DISPATCH_TICK_SECONDS, start=time.time())
+            self._wheel_lock = threading.Lock()
+            self._wheel_stop = threading.Event()
+            self._pending_lock = threading.Lock()
+
+            logger.info("ReminderScheduler initialized with reminder job store")
 
     def start(self):
         if self._scheduler and not self._scheduler.running:
+            # Due reminders share the dispatch workers fairly between users
+            self._dispatch_pool = FairDispatcher(
+                workers=settings.DISPATCH_WORKERS,
+                max_per_tenant=settings.DISPATCH_MAX_PER_USER,
+                weights=parse_weights(settings.DISPATCH_USER_WEIGHTS),
+            )
+            self._dispatch_pool.start()
+            self._wheel_stop.clear()
+            self._wheel_thread = threading.Thread(
+                target=self._run_wheel, name="TimingWheel", daemon=True
+            )
+            self._wheel_thread.start()
+            get_status_writer().start()
             self._scheduler.start()
             logger.info("ReminderScheduler started")
 
     def shutdown(self):
         if self._scheduler and self._scheduler.running:
+            if self._catch_up:
+                self._catch_up.stop()
+            self._wheel_stop.set()
+            self._wheel_thread.join()
             self._scheduler.shutdown(wait=True)
+            self._dispatch_pool.shutdown(wait=True)
+            get_status_writer().stop()
             logger.info("ReminderScheduler shutdown complete")
 
+    def _run_wheel(self):
+        tick = self._wheel.tick
+        # Wake on tick boundaries so entries fire at most one tick after their deadline
+        while not self._wheel_stop.wait(tick - time.time() % tick):
+            with self._wheel_lock:
+                due = self._wheel.advance(time.time())
+            if due:
+                with self._pending_lock:
+                    self._on_time_pending += len(due)
+            for reminder_id, user_id in due:
+                self._dispatch_pool.submit(user_id, self._dispatch_on_time, reminder_id)
+
+    def _dispatch_on_time(self, reminder_id: str):
+        with self._pending_lock:
+            self._on_time_pending -= 1
+        execute_reminder(reminder_id)
+
+    def on_time_pending(self) -> int:
+        """Due reminders from the wheel still waiting for a dispatch worker"""
+        return self._on_time_pending
+
+    def submit_dispatch(self, reminder_id: str, user_id=None):
+        return self._dispatch_pool.submit(user_id, execute_reminder, reminder_id)
+
+    def add_to_wheel(self, reminder_id, run_at: datetime, user_id=None):
+        # The wheel entry carries the user so dispatch can be shared fairly between users
+        with self._wheel_lock:
+            self._wheel.insert(str(reminder_id), _as_utc(run_at).timestamp(), user_id)
+
+    def _remove_from_wheel(self, reminder_id) -> bool:
+        with self._wheel_lock:
+            return self._wheel.cancel(str(reminder_id))
+
+    def stage(self, db: Session, reminder_ids: Iterable) -> int:
+        """Nothing to write: this process schedules in memory once the change commits"""
+        return 0
+
     def schedule_reminder(self, reminder: Reminder) -> bool:
-        try:
-            job_id = f"reminder_{reminder.id}"
+        from apscheduler.triggers.date import DateTrigger
 
-            if self._scheduler.get_job(job_id):
-                self._scheduler.remove_job(job_id)
-                logger.info(f"Removed existing job for reminder {reminder.id}")
-
-            self._scheduler.add_job(
-                func=execute_reminder,
-                trigger=DateTrigger(run_date=reminder.scheduled_for),
-                args=[str(reminder.id)],
-                id=job_id,
-                name=f"Reminder: {reminder.title}",
-                replace_existing=True,
-            )
+        try:
+            if self._scheduler.running:
+                self._place([reminder])
+            else:
+                # Until start() APScheduler queues jobs itself instead of writing to the store
+                run_at = _as_utc(reminder.scheduled_for)
+                promote_at = run_at - timedelta(seconds=settings.DISPATCH_WINDOW_SECONDS)
+                if promote_at <= datetime.now(timezone.utc):
+                    self.add_to_wheel(reminder.id, run_at, getattr(reminder, "user_id", None))
+                else:
+                    self._remove_from_wheel(reminder.id)
+                    self._scheduler.add_job(
+                        func=promote_reminder,
+                        trigger=DateTrigger(run_date=promote_at),
+                        args=[str(reminder.id)],
+                        id=f"reminder_{reminder.id}",
+                        replace_existing=True,
+                    )
 
             logger.info(
-                f"Scheduled reminder {reminder.id} - '{reminder.title}' "
+                f"Scheduled reminder {reminder.id} - '{getattr(reminder, 'title', '')}' "
                 f"for {reminder.scheduled_for.isoformat()}"
             )
 
@@ -78,12 +206,97 @@ class ReminderScheduler:
             logger.error(f"Failed to schedule reminder {reminder.id}: {str(e)}")
             return False
 
+    def schedule_reminders(self, reminders: Iterable) -> int:
+        """Bulk schedule_reminder for rows with `id` and `scheduled_for`.
+
+        Existing jobs are replaced in one job store transaction, instead of a
+        lookup/remove/add round trip per reminder.
+        """
+        reminders = list(reminders)
+        if not reminders:
+            return 0
+        if not self._scheduler.running:
+            return sum(self.schedule_reminder(reminder) for reminder in reminders)
+
+        self._place(reminders)
+        logger.info("Scheduled %d reminders in bulk", len(reminders))
+        return len(reminders)
+
+    def _place(self, reminders):
+        """Puts reminders due within the dispatch window on the wheel and the rest in the
+        job store, dropping whatever either held for them before."""
+        now = datetime.now(timezone.utc)
+        window = timedelta(seconds=settings.DISPATCH_WINDOW_SECONDS)
+        near, far = [], []
+        with self._wheel_lock:
+            for reminder in reminders:
+                key = str(reminder.id)
+                run_at = _as_utc(reminder.scheduled_for)
+                promote_at = run_at - window
+                if promote_at <= now:
+                    self._wheel.insert(key, run_at.timestamp(), getattr(reminder, "user_id", None))
+                    near.append(reminder.id)
+                else:
+                    self._wheel.cancel(key)
+                    far.append((reminder.id, promote_at))
+
+        if near:
+            self._jobstore.remove_reminders(near)
+        if far:
+            self._jobstore.add_reminders(far)
+            self._scheduler.wakeup()
+
+    def cancel_reminders(self, reminder_ids: Iterable) -> int:
+        """Bulk cancel_reminder; returns how many wheel entries and jobs were removed."""
+        if not self._scheduler.running:
+            return sum(self.cancel_reminder(reminder_id) for reminder_id in reminder_ids)
+
+        remaining = []
+        cancelled = 0
+        with self._wheel_lock:
+            for reminder_id in reminder_ids:
+                if self._wheel.cancel(str(reminder_id)):
+                    cancelled += 1
+                else:
+                    remaining.append(reminder_id)
+
+        if remaining:
+            cancelled += self._jobstore.remove_reminders(remaining)
+
+        logger.info("Cancelled %d scheduled reminders in bulk", cancelled)
+        return cancelled
+
+    def add_maintenance_job(self, func, job_id: str, minutes: float):
+        from apscheduler.triggers.interval import IntervalTrigger
+
+        self._scheduler.add_job(
+            func=func,
+            trigger=IntervalTrigger(minutes=minutes),
+            id=job_id,
+            jobstore="maintenance",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
+        logger.info("Registered maintenance job %s every %s minutes", job_id, minutes)
+
     def cancel_reminder(self, reminder_id: UUID) -> bool:
         try:
             job_id = f"reminder_{reminder_id}"
 
-            if self._scheduler.get_job(job_id):
+            if self._remove_from_wheel(reminder_id):
+                logger.info(f"Cancelled in-memory dispatch for reminder {reminder_id}")
+                return True
+
+            if self._scheduler.running:
+                removed = self._jobstore.remove_reminders([reminder_id]) > 0
+            elif self._scheduler.get_job(job_id):
                 self._scheduler.remove_job(job_id)
+                removed = True
+            else:
+                removed = False
+
+            if removed:
                 logger.info(f"Cancelled scheduled job for reminder {reminder_id}")
                 return True
             else:
@@ -95,21 +308,21 @@ class ReminderScheduler:
             return False
 
     def reschedule_all_pending(self):
+        now = datetime.now(timezone.utc)
         db = SessionLocal()
         try:
-            pending_reminders = (
-                db.query(Reminder)
-                .filter(
+            pending_reminders = db.execute(
+                select(Reminder.id, Reminder.scheduled_for, Reminder.user_id).where(
                     Reminder.status == ReminderStatus.SCHEDULED,
-                    Reminder.scheduled_for > datetime.now(timezone.utc),
+                    Reminder.scheduled_for > now,
                 )
-                .all()
-            )
+            ).all()
 
             scheduled_count = 0
-            for reminder in pending_reminders:
-                if self.schedule_reminder(reminder):
-                    scheduled_count += 1
+            for offset in range(0, len(pending_reminders), BULK_CHUNK_SIZE):
+                scheduled_count += self.schedule_reminders(
+                    pending_reminders[offset : offset + BULK_CHUNK_SIZE]
+                )
 
             logger.info(
                 f"Rescheduled {scheduled_count} out of {len(pending_reminders)} "
@@ -121,100 +334,288 @@ class ReminderScheduler:
         finally:
             db.close()
 
+        self.start_catch_up(now)
+
+    def start_catch_up(self, overdue_before: datetime):
+        """Dispatch, in the background, reminders due at or before `overdue_before` that
+        were never called because nothing was dispatching when they came due."""
+        if settings.CATCH_UP_MAX_LATENESS_MINUTES <= 0 or not self._scheduler.running:
+            return
+        if self._catch_up and self._catch_up.state in ("pending", "draining"):
+            return
+        self._catch_up = CatchUpDispatcher(
+            self,
+            overdue_before,
+            max_lateness=timedelta(minutes=settings.CATCH_UP_MAX_LATENESS_MINUTES),
+            rate=settings.CATCH_UP_RATE_PER_SECOND,
+            concurrency=min(settings.CATCH_UP_CONCURRENCY, settings.DISPATCH_WORKERS),
+            batch_size=settings.CATCH_UP_BATCH_SIZE,
+            idle_wait=settings.DISPATCH_TICK_SECONDS,
+        )
+        self._catch_up.start()
+
+    def catch_up_status(self) -> Optional[dict]:
+        return self._catch_up.status() if self._catch_up else None
+
     def get_scheduled_jobs(self):
         if self._scheduler:
             return self._scheduler.get_jobs()
         return []
 
+    def count_scheduled_jobs(self) -> int:
+        # COUNT on the jobs table instead of get_jobs(), which builds every job
+        return self._jobstore.count()
 
-scheduler = ReminderScheduler()
-
+    def count_in_memory(self) -> int:
+        return len(self._wheel) if self._wheel else 0
 
-def execute_reminder(reminder_id: str):
-    db = SessionLocal()
-    try:
-        reminder = db.query(Reminder).filter(Reminder.id == UUID(reminder_id)).first()
+    def is_alive(self) -> bool:
+        if not self._scheduler or not self._scheduler.running:
+            return False
+        thread = getattr(self._scheduler, "_thread", None)
+        return (
+            thread is not None
+            and thread.is_alive()
+            and self._wheel_thread is not None
+            and self._wheel_thread.is_alive()
+        )
 
-        if not reminder:
-            logger.error(f"Reminder {reminder_id} not found during execution")
-            return
+    def record_dispatch(self, scheduled_for: datetime):
+        now = datetime.now(timezone.utc)
+        self.last_dispatch_at = now
+        self.last_dispatch_lag_seconds = (now - _as_utc(scheduled_for)).total_seconds()
 
-        if reminder.status != ReminderStatus.SCHEDULED:
-            logger.warning(
-                f"Reminder {reminder_id} has status '{reminder.status}', skipping execution"
-            )
-            return
 
-        logger.info(f"Executing reminder {reminder_id} - '{reminder.title}'")
+def get_scheduler():
+    """Scheduler the API hands reminder changes to: the in-process ReminderScheduler, or a
+    signal writer when dispatch runs in `python -m app.worker` (SCHEDULER_MODE=worker)."""
+    if settings.SCHEDULER_MODE == "worker":
+        return SignalingScheduler()
+    return ReminderScheduler()
 
-        existing_attempts = len(reminder.call_attempts) if reminder.call_attempts else 0
-        attempt_number = existing_attempts + 1
 
-        call_attempt = CallAttempt(
-            reminder_id=reminder.id,
-            attempt_number=attempt_number,
-            status=CallAttemptStatus.INITIATED,
-            initiated_at=datetime.now(timezone.utc),
+def promote_reminder(reminder_id: str):
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(Reminder.status, Reminder.scheduled_for, Reminder.user_id)
+            .filter(Reminder.id == UUID(reminder_id))
+            .first()
         )
+        if row and row.status == ReminderStatus.SCHEDULED:
+            ReminderScheduler().add_to_wheel(reminder_id, row.scheduled_for, row.user_id)
+            logger.debug("Promoted reminder %s to in-memory dispatch", reminder_id)
+    except Exception as e:
+        logger.error("Failed to promote reminder %s: %s", reminder_id, e)
+    finally:
+        db.close()
 
-        db.add(call_attempt)
-        db.commit()
-        db.refresh(call_attempt)
 
-        logger.info(
-            f"Call attempt {call_attempt.id} created for reminder {reminder_id}. "
-            f"Triggering Vapi call to {reminder.phone_number}"
-        )
+def _schedule_next_occurrence(next_occurrence: Optional[Reminder]):
+    # Runs inside the dispatching process, so the local scheduler owns the new occurrence
+    if next_occurrence is not None and not ReminderScheduler().schedule_reminder(next_occurrence):
+        logger.error("Next occurrence %s created but failed to schedule", next_occurrence.id)
+
 
-        success, vapi_call_id, error_message = asyncio.run(
-            vapi_service.trigger_call(reminder, call_attempt.id)
+def execute_reminder(reminder_id: str):
+    with log_context(reminder_id=reminder_id):
+        _execute_reminder(reminder_id)
+
+
+_CLAIM_COLUMNS = (
+    "id",
+    "user_id",
+    "title",
+    "message",
+    "phone_number",
+    "scheduled_for",
+    "attempt_count",
+)
+
+
+def _claim(db: Session, reminder_id: UUID, now: datetime):
+    """Atomically take a due reminder and open its next call attempt.
+
+    One UPDATE ... RETURNING bumps the attempt counter of a still-scheduled reminder with
+    no call in flight, and the attempt row is inserted in the same transaction; on
+    Postgres both run as a single statement. Returns the claimed reminder's columns plus
+    `attempt_id`, or None when there is nothing to dispatch.
+    """
+    reminders = Reminder.__table__
+    attempts = CallAttempt.__table__
+    attempt_id = uuid4()
+
+    claim = (
+        update(reminders)
+        .where(
+            reminders.c.id == reminder_id,
+            reminders.c.status == ReminderStatus.SCHEDULED,
+            or_(
+                reminders.c.last_attempt_status.is_(None),
+                reminders.c.last_attempt_status.notin_(IN_PROGRESS_ATTEMPT_STATUSES),
+            ),
+        )
+        .values(
+            attempt_count=reminders.c.attempt_count + 1,
+            last_attempt_at=now,
+            last_attempt_status=CallAttemptStatus.INITIATED,
+            updated_at=now,
+        )
+        .returning(*(reminders.c[name] for name in _CLAIM_COLUMNS))
+    )
+
+    if db.get_bind().dialect.name == "postgresql":
+        claimed = claim.cte("claimed")
+        opened = (
+            insert(attempts)
+            .from_select(
+                ["id", "reminder_id", "attempt_number", "status", "initiated_at"],
+                select(
+                    literal(attempt_id, attempts.c.id.type),
+                    claimed.c.id,
+                    claimed.c.attempt_count,
+                    # Explicit cast so Postgres doesn't resolve the literal as text
+                    cast(
+                        literal(CallAttemptStatus.INITIATED, attempts.c.status.type),
+                        attempts.c.status.type,
+                    ),
+                    literal(now, attempts.c.initiated_at.type),
+                ),
+            )
+            .returning(attempts.c.id, attempts.c.reminder_id)
+            .cte("opened")
         )
+        row = db.execute(
+            select(*claimed.c, opened.c.id.label("attempt_id")).join_from(
+                claimed, opened, opened.c.reminder_id == claimed.c.id
+            )
+        ).first()
+    else:
+        row = db.execute(claim).first()
+        if row is not None:
+            db.execute(
+                insert(attempts).values(
+                    id=attempt_id,
+                    reminder_id=row.id,
+                    attempt_number=row.attempt_count,
+                    status=CallAttemptStatus.INITIATED,
+                    initiated_at=now,
+                )
+            )
+            row = SimpleNamespace(**row._mapping, attempt_id=attempt_id)
+
+    db.commit()
+    if row is not None:
+        invalidate_reminders([row.id])
+    return row
+
+
+def _fail_attempt(db: Session, reminder: Reminder, attempt_id, reason: str, now: datetime):
+    """Close the attempt a claim opened, so the reminder's dead letter can be replayed and
+    retry or delete don't take the call as still in flight."""
+    db.execute(
+        update(CallAttempt.__table__)
+        .where(CallAttempt.__table__.c.id == attempt_id)
+        .values(status=CallAttemptStatus.FAILED, failure_reason=reason, completed_at=now)
+    )
+    reminder.last_attempt_status = CallAttemptStatus.FAILED
+
+
+def _record_failure(db: Session, claimed, error_message: Optional[str]):
+    now = datetime.now(timezone.utc)
+    reason = error_message or "Failed to initiate Vapi call"
+
+    reminder = db.get(Reminder, claimed.id)
+    _fail_attempt(db, reminder, claimed.attempt_id, reason, now)
+    StatsService.record_transition(db, reminder.user_id, reminder.status, ReminderStatus.FAILED)
+    reminder.status = ReminderStatus.FAILED
+    reminder.failure_reason = error_message
+    reminder.updated_at = now
+    next_occurrence = RecurrenceService.materialize_next(db, reminder)
+    DeadLetterService.record_dispatches(
+        db, [(claimed.id, claimed.user_id)], classify_dispatch_error(error_message), reason
+    )
+
+    db.commit()
+    invalidate_reminders([claimed.id])
+    _schedule_next_occurrence(next_occurrence)
+
+
+def _execute_reminder(reminder_id: str):
+    db = SessionLocal()
+    claimed = None
+    try:
+        claimed = _claim(db, UUID(reminder_id), datetime.now(timezone.utc))
 
-        if success and vapi_call_id:
-            call_attempt.vapi_call_id = vapi_call_id
-            call_attempt.status = CallAttemptStatus.RINGING
-            reminder.vapi_call_id = vapi_call_id
-            reminder.last_attempt_at = datetime.now(timezone.utc)
-            reminder.updated_at = datetime.now(timezone.utc)
+        if claimed is None:
+            logger.warning(
+                "Reminder %s is missing, no longer scheduled or already being called, "
+                "skipping execution",
+                reminder_id,
+            )
+            return
 
-            db.commit()
+        logger.info("Executing reminder %s", reminder_id)
+        ReminderScheduler().record_dispatch(claimed.scheduled_for)
 
-            logger.info(
-                f"Vapi call initiated successfully for reminder {reminder_id}. "
-                f"Vapi Call ID: {vapi_call_id}. "
-                f"Call status will be updated via webhook."
+        with log_context(call_attempt_id=claimed.attempt_id):
+            logger.debug(
+                "Call attempt %s created for reminder %s", claimed.attempt_id, reminder_id
             )
 
-        else:
-            call_attempt.status = CallAttemptStatus.FAILED
-            call_attempt.failure_reason = error_message or "Failed to initiate Vapi call"
-            call_attempt.completed_at = datetime.now(timezone.utc)
+            success, vapi_call_id, error_message = asyncio.run(
+                vapi_service.trigger_call(claimed, claimed.attempt_id)
+            )
+
+            if success and vapi_call_id:
+                get_status_writer().mark_ringing(
+                    db, claimed.id, claimed.attempt_id, vapi_call_id, datetime.now(timezone.utc)
+                )
 
-            reminder.status = ReminderStatus.FAILED
-            reminder.failure_reason = error_message
-            reminder.last_attempt_at = datetime.now(timezone.utc)
-            reminder.updated_at = datetime.now(timezone.utc)
+                logger.info(
+                    "Vapi call %s initiated for reminder %s, awaiting webhook",
+                    vapi_call_id,
+                    reminder_id,
+                    extra={"vapi_call_id": vapi_call_id},
+                )
 
-            db.commit()
+            else:
+                _record_failure(db, claimed, error_message)
 
-            logger.error(f"Failed to trigger Vapi call for reminder {reminder_id}: {error_message}")
+                logger.error(
+                    "Failed to trigger Vapi call for reminder %s: %s", reminder_id, error_message
+                )
 
     except Exception as e:
-        logger.error(f"Failed to execute reminder {reminder_id}: {str(e)}")
+        logger.error("Failed to execute reminder %s: %s", reminder_id, e)
 
         try:
+            db.rollback()
+            now = datetime.now(timezone.utc)
             reminder = db.query(Reminder).filter(Reminder.id == UUID(reminder_id)).first()
 
             if reminder:
+                # The claim already committed an INITIATED attempt
+                if claimed is not None:
+                    _fail_attempt(db, reminder, claimed.attempt_id, str(e), now)
+                StatsService.record_transition(
+                    db, reminder.user_id, reminder.status, ReminderStatus.FAILED
+                )
                 reminder.status = ReminderStatus.FAILED
-                reminder.last_attempt_at = datetime.now(timezone.utc)
-                reminder.updated_at = datetime.now(timezone.utc)
+                reminder.failure_reason = str(e)
+                reminder.updated_at = now
+                next_occurrence = RecurrenceService.materialize_next(db, reminder)
+                DeadLetterService.record_dispatches(
+                    db, [(reminder.id, reminder.user_id)], DeadLetterReason.INTERNAL, str(e)
+                )
                 db.commit()
+                invalidate_reminders([reminder.id])
+                _schedule_next_occurrence(next_occurrence)
 
-                logger.info(f"Marked reminder {reminder_id} as failed")
+                logger.info("Marked reminder %s as failed", reminder_id)
 
         except Exception as nested_error:
-            logger.error(f"Failed to mark reminder {reminder_id} as failed: {str(nested_error)}")
+            logger.error("Failed to mark reminder %s as failed: %s", reminder_id, nested_error)
 
     finally:
         db.close()
@@ -0,0 +1,177 @@
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.orm import Session, sessionmaker
+from select import select as wait_readable
+from typing import Iterable, Optional
+import logging
+import threading
+
+from app.db.database import SessionLocal
+from app.models.reminder import Reminder, ReminderStatus
+from app.models.signal import SchedulerSignal
+
+logger = logging.getLogger(__name__)
+
+SIGNAL_CHANNEL = "scheduler_signals"
+
+
+class SignalingScheduler:
+    """Stand-in for ReminderScheduler in API processes when dispatch runs in the worker.
+
+    Changes reach the worker as scheduler_signals rows that callers `stage` in the same
+    transaction as the change itself (a transactional outbox): both commit or neither
+    does. On Postgres a NOTIFY, delivered at that commit, wakes the worker immediately;
+    elsewhere the worker picks the rows up on its next poll. The schedule and cancel
+    methods are then no-ops, since the signal went out with the commit.
+    """
+
+    def stage(self, db: Session, reminder_ids: Iterable) -> int:
+        """Add a signal per reminder to the caller's transaction; call before db.commit()"""
+        rows = [{"reminder_id": reminder_id} for reminder_id in reminder_ids]
+        if rows:
+            db.execute(insert(SchedulerSignal), rows)
+            if db.get_bind().dialect.name == "postgresql":
+                db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": SIGNAL_CHANNEL})
+        return len(rows)
+
+    def schedule_reminder(self, reminder: Reminder) -> bool:
+        return True
+
+    def cancel_reminder(self, reminder_id) -> bool:
+        return True
+
+    def schedule_reminders(self, reminders) -> int:
+        return len(list(reminders))
+
+    def cancel_reminders(self, reminder_ids) -> int:
+        return len(list(reminder_ids))
+
+
+class SignalConsumer:
+    """Applies scheduler_signals rows to the worker's ReminderScheduler.
+
+    Waits on LISTEN when the database is Postgres and polls every `poll_interval` seconds
+    otherwise (and as a safety net if the listening connection drops).
+    """
+
+    def __init__(
+        self,
+        reminder_scheduler,
+        session_factory: sessionmaker = SessionLocal,
+        poll_interval: float = 2.0,
+        batch_size: int = 500,
+    ):
+        self.reminder_scheduler = reminder_scheduler
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="SignalConsumer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def drain(self) -> int:
+        applied = 0
+        while True:
+            count = self.process_batch()
+            applied += count
+            if count < self.batch_size:
+                return applied
+
+    def process_batch(self) -> int:
+        db = self.session_factory()
+        try:
+            rows = db.execute(
+                select(SchedulerSignal.id, SchedulerSignal.reminder_id)
+                .order_by(SchedulerSignal.id)
+                .limit(self.batch_size)
+            ).all()
+            if not rows:
+                return 0
+
+            reminder_ids = {row.reminder_id for row in rows}
+            scheduled = db.execute(
+                select(Reminder.id, Reminder.scheduled_for, Reminder.user_id).where(
+                    Reminder.id.in_(reminder_ids), Reminder.status == ReminderStatus.SCHEDULED
+                )
+            ).all()
+            self.reminder_scheduler.schedule_reminders(scheduled)
+            self.reminder_scheduler.cancel_reminders(
+                reminder_ids - {reminder.id for reminder in scheduled}
+            )
+
+            # Delete by id rather than "id <= max": a lower id may still be uncommitted
+            db.execute(
+                delete(SchedulerSignal).where(SchedulerSignal.id.in_([row.id for row in rows]))
+            )
+            db.commit()
+            logger.debug("Applied %s scheduler signals", len(rows))
+            return len(rows)
+        finally:
+            db.close()
+
+    def _listen(self):
+        with self.session_factory() as db:
+            engine = db.get_bind()
+        if engine.dialect.name != "postgresql":
+            return None
+        try:
+            connection = engine.raw_connection()
+            # Keep the autocommit connection out of the pool for good
+            connection.detach()
+            connection.driver_connection.autocommit = True
+            cursor = connection.cursor()
+            cursor.execute(f"LISTEN {SIGNAL_CHANNEL}")
+            cursor.close()
+            logger.info("Listening for scheduler signals on channel %s", SIGNAL_CHANNEL)
+            return connection
+        except Exception as e:
+            logger.warning("LISTEN unavailable, polling for scheduler signals: %s", e)
+            return None
+
+    def _wait(self, listener) -> bool:
+        """Block until notified or the poll interval passes; returns False if the listening
+        connection broke."""
+        if listener is None:
+            self._stop.wait(self.poll_interval)
+            return True
+        try:
+            driver_connection = listener.driver_connection
+            readable, _, _ = wait_readable([driver_connection], [], [], self.poll_interval)
+            if readable:
+                driver_connection.poll()
+                driver_connection.notifies.clear()
+            return True
+        except Exception as e:
+            logger.warning("Lost LISTEN connection, falling back to polling: %s", e)
+            return False
+
+    def _run(self):
+        listener = self._listen()
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.drain()
+                except Exception as e:
+                    logger.error("Failed to apply scheduler signals: %s", e)
+                    self._stop.wait(self.poll_interval)
+
+                if not self._wait(listener):
+                    listener.invalidate()
+                    listener = self._listen()
+        finally:
+            if listener is not None:
+                listener.close()
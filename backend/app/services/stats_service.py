@@ -0,0 +1,185 @@
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+import logging
+
+from app.models.archive import ArchivedReminder
+from app.models.reminder import Reminder, ReminderStatus
+from app.models.stats import ReminderStat
+
+logger = logging.getLogger(__name__)
+
+
+def _user_filter(user_id: Optional[UUID]):
+    return ReminderStat.user_id.is_(None) if user_id is None else ReminderStat.user_id == user_id
+
+
+class StatsService:
+    """Maintains reminder_stats incrementally.
+
+    Every helper only issues statements on the caller's session, so the counters commit or
+    roll back together with the status change that produced them. Reads always SUM() per
+    status, which keeps them correct even if two writers raced and inserted duplicate rows.
+    """
+
+    @staticmethod
+    def _apply(
+        db: Session,
+        user_id: Optional[UUID],
+        status: ReminderStatus,
+        reminders: int = 0,
+        calls: int = 0,
+        duration_seconds: int = 0,
+        cost: float = 0.0,
+    ):
+        result = db.execute(
+            update(ReminderStat)
+            .where(_user_filter(user_id), ReminderStat.status == status)
+            .values(
+                reminder_count=ReminderStat.reminder_count + reminders,
+                call_count=ReminderStat.call_count + calls,
+                total_call_duration_seconds=ReminderStat.total_call_duration_seconds
+                + duration_seconds,
+                total_call_cost=ReminderStat.total_call_cost + cost,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        if result.rowcount == 0:
+            db.add(
+                ReminderStat(
+                    user_id=user_id,
+                    status=status,
+                    reminder_count=reminders,
+                    call_count=calls,
+                    total_call_duration_seconds=duration_seconds,
+                    total_call_cost=cost,
+                )
+            )
+            db.flush()
+
+    @staticmethod
+    def record_transition(
+        db: Session,
+        user_id: Optional[UUID],
+        old_status: Optional[ReminderStatus],
+        new_status: Optional[ReminderStatus],
+    ):
+        if old_status == new_status:
+            return
+        if old_status is not None:
+            StatsService._apply(db, user_id, old_status, reminders=-1)
+        if new_status is not None:
+            StatsService._apply(db, user_id, new_status, reminders=1)
+
+    @staticmethod
+    def record_transitions(
+        db: Session,
+        changes: Iterable[
+            Tuple[Optional[UUID], Optional[ReminderStatus], Optional[ReminderStatus]]
+        ],
+    ):
+        """record_transition for many (user_id, old, new) changes, with one counter
+        update per user and status instead of one per reminder."""
+        deltas: Counter = Counter()
+        for user_id, old_status, new_status in changes:
+            if old_status == new_status:
+                continue
+            if old_status is not None:
+                deltas[(user_id, old_status)] -= 1
+            if new_status is not None:
+                deltas[(user_id, new_status)] += 1
+
+        for (user_id, status), delta in deltas.items():
+            if delta:
+                StatsService._apply(db, user_id, status, reminders=delta)
+
+    @staticmethod
+    def record_call(
+        db: Session,
+        user_id: Optional[UUID],
+        status: ReminderStatus,
+        duration_seconds: Optional[int] = None,
+        cost: Optional[float] = None,
+    ):
+        # Call rollups are cumulative usage: deleting a reminder doesn't un-spend its calls
+        StatsService._apply(
+            db,
+            user_id,
+            status,
+            calls=1,
+            duration_seconds=int(duration_seconds or 0),
+            cost=float(cost or 0.0),
+        )
+
+    @staticmethod
+    def get_stats(db: Session, user_id: Optional[UUID] = None) -> Dict[str, Any]:
+        query = select(
+            ReminderStat.status,
+            func.sum(ReminderStat.reminder_count),
+            func.sum(ReminderStat.call_count),
+            func.sum(ReminderStat.total_call_duration_seconds),
+            func.sum(ReminderStat.total_call_cost),
+        ).group_by(ReminderStat.status)
+
+        if user_id is not None:
+            query = query.where(ReminderStat.user_id == user_id)
+
+        by_status = {status.value: 0 for status in ReminderStatus}
+        calls = {"count": 0, "total_duration_seconds": 0, "total_cost": 0.0}
+
+        for status, reminder_count, call_count, duration, cost in db.execute(query):
+            by_status[status.value] = int(reminder_count or 0)
+            calls["count"] += int(call_count or 0)
+            calls["total_duration_seconds"] += int(duration or 0)
+            calls["total_cost"] += float(cost or 0.0)
+
+        return {"total": sum(by_status.values()), "by_status": by_status, "calls": calls}
+
+    @staticmethod
+    def check_consistency(db: Session, repair: bool = False) -> List[Dict[str, Any]]:
+        # Archived reminders still count; the archiver only moves them to colder storage
+        actual: Dict[Any, int] = {}
+        for model in (Reminder, ArchivedReminder):
+            for user_id, status, count in db.execute(
+                select(model.user_id, model.status, func.count()).group_by(
+                    model.user_id, model.status
+                )
+            ):
+                actual[(user_id, status)] = actual.get((user_id, status), 0) + count
+
+        recorded = {
+            (user_id, status): int(count or 0)
+            for user_id, status, count in db.execute(
+                select(
+                    ReminderStat.user_id, ReminderStat.status, func.sum(ReminderStat.reminder_count)
+                ).group_by(ReminderStat.user_id, ReminderStat.status)
+            )
+        }
+
+        mismatches = []
+        for user_id, status in sorted(set(actual) | set(recorded), key=str):
+            expected = actual.get((user_id, status), 0)
+            found = recorded.get((user_id, status), 0)
+            if expected == found:
+                continue
+
+            mismatches.append(
+                {
+                    "user_id": str(user_id) if user_id else None,
+                    "status": status.value,
+                    "expected": expected,
+                    "recorded": found,
+                }
+            )
+            if repair:
+                StatsService._apply(db, user_id, status, reminders=expected - found)
+
+        if mismatches:
+            logger.warning("Found %d reminder_stats mismatches", len(mismatches))
+            if repair:
+                db.commit()
+
+        return mismatches
@@ -0,0 +1,166 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+import logging
+import queue
+import threading
+import time
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.database import SessionLocal
+from app.models.reminder import CallAttempt, CallAttemptStatus, Reminder
+from app.services.reminder_cache import invalidate_reminders
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+# Tries at a whole batch before it is written row by row
+BATCH_ATTEMPTS = 2
+
+_attempts = CallAttempt.__table__
+_reminders = Reminder.__table__
+
+# Only move attempts that are still INITIATED: a fast webhook may already have finished them
+_MARK_ATTEMPTS_RINGING = (
+    update(_attempts)
+    .where(_attempts.c.id == bindparam("b_attempt_id"))
+    .where(_attempts.c.status == CallAttemptStatus.INITIATED)
+    .values(status=CallAttemptStatus.RINGING, vapi_call_id=bindparam("b_vapi_call_id"))
+)
+_MARK_REMINDERS_RINGING = (
+    update(_reminders)
+    .where(_reminders.c.id == bindparam("b_reminder_id"))
+    .where(_reminders.c.last_attempt_status == CallAttemptStatus.INITIATED)
+    .values(
+        vapi_call_id=bindparam("b_vapi_call_id"),
+        last_attempt_status=CallAttemptStatus.RINGING,
+        updated_at=bindparam("b_at"),
+    )
+)
+
+
+class StatusWriter:
+    """Batches the "call accepted by Vapi" writes of concurrent dispatches.
+
+    Dispatch threads enqueue their result and move on; a background thread applies every
+    queued result in one transaction with one executemany per statement, so N concurrent
+    dispatches cost one commit instead of N. Until start() (or after stop()) results are
+    written immediately on the caller's session.
+
+    A batch that fails is retried, then written one row per transaction, so a transient
+    error or a single bad row doesn't leave placed calls looking never placed to the
+    reconciler.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker = SessionLocal,
+        max_batch: int = 500,
+        max_delay: float = 0.05,
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.written = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="StatusWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def mark_ringing(
+        self,
+        db: Session,
+        reminder_id: UUID,
+        attempt_id: UUID,
+        vapi_call_id: str,
+        at: datetime,
+    ):
+        row = {
+            "b_reminder_id": reminder_id,
+            "b_attempt_id": attempt_id,
+            "b_vapi_call_id": vapi_call_id,
+            "b_at": at,
+        }
+        if self.is_running():
+            self._queue.put(row)
+        else:
+            self._apply(db, [row])
+
+    def _apply(self, db: Session, rows: List[Dict[str, Any]]):
+        db.execute(_MARK_ATTEMPTS_RINGING, rows)
+        db.execute(_MARK_REMINDERS_RINGING, rows)
+        db.commit()
+        invalidate_reminders(row["b_reminder_id"] for row in rows)
+        self.batches += 1
+        self.written += len(rows)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            rows = [item]
+            # Give concurrent dispatches a moment to join this batch
+            while len(rows) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=self.max_delay)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                rows.append(item)
+
+            self._write(rows)
+
+    def _try_apply(self, rows: List[Dict[str, Any]]) -> bool:
+        db = self.session_factory()
+        try:
+            self._apply(db, rows)
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.warning("Failed to record %d dispatch results: %s", len(rows), e)
+            return False
+        finally:
+            db.close()
+
+    def _write(self, rows: List[Dict[str, Any]]):
+        for attempt in range(BATCH_ATTEMPTS):
+            if attempt:
+                time.sleep(self.max_delay)
+            if self._try_apply(rows):
+                return
+        if len(rows) == 1:
+            failed = rows
+        else:
+            failed = [row for row in rows if not self._try_apply([row])]
+        for row in failed:
+            logger.error(
+                "Dropped dispatch result for reminder %s (call %s)",
+                row["b_reminder_id"],
+                row["b_vapi_call_id"],
+            )
+
+
+@lru_cache()
+def get_status_writer() -> StatusWriter:
+    return StatusWriter()
@@ -0,0 +1,96 @@
+import math
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+class TimingWheel:
+    """Hierarchical timing wheel with O(1) insert and cancel.
+
+    Time is quantized into ticks of `tick` seconds. Level 0 has `slots` buckets of one tick
+    each; every further level covers `slots` times the span of the level below. Entries are
+    placed in the coarsest level that still separates them from "now" and are cascaded
+    down as the wheel turns, so advancing costs O(entries due + cascaded) per tick
+    regardless of how many entries are waiting. Deadlines beyond the top level go to an
+    overflow bucket that is redistributed each time the top level wraps.
+
+    The wheel is not thread-safe; callers serialize access.
+    """
+
+    def __init__(self, tick: float = 0.05, slots: int = 64, levels: int = 4, start: float = 0.0):
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self._spans = [slots**level for level in range(levels + 1)]
+        self._wheels: List[List[Dict[Hashable, Tuple[int, Any]]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._overflow: Dict[Hashable, Tuple[int, Any]] = {}
+        self._ready: Dict[Hashable, Tuple[int, Any]] = {}
+        # key -> bucket currently holding it, so cancel never scans
+        self._index: Dict[Hashable, Dict[Hashable, Tuple[int, Any]]] = {}
+        self._current = int(start / tick)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index
+
+    def _bucket_for(self, due_tick: int) -> Dict[Hashable, Tuple[int, Any]]:
+        delta = due_tick - self._current
+        if delta <= 0:
+            return self._ready
+        for level in range(self.levels):
+            if delta < self._spans[level + 1]:
+                return self._wheels[level][(due_tick // self._spans[level]) % self.slots]
+        return self._overflow
+
+    def _place(self, key: Hashable, due_tick: int, payload: Any):
+        bucket = self._bucket_for(due_tick)
+        bucket[key] = (due_tick, payload)
+        self._index[key] = bucket
+
+    def insert(self, key: Hashable, deadline: float, payload: Any = None):
+        self.cancel(key)
+        self._place(key, math.ceil(deadline / self.tick - 1e-9), payload)
+
+    def cancel(self, key: Hashable) -> bool:
+        bucket = self._index.pop(key, None)
+        if bucket is None:
+            return False
+        del bucket[key]
+        return True
+
+    def _cascade(self, bucket: Dict[Hashable, Tuple[int, Any]]):
+        entries = list(bucket.items())
+        bucket.clear()
+        for key, (due_tick, payload) in entries:
+            self._place(key, due_tick, payload)
+
+    def advance(self, now: float) -> List[Tuple[Hashable, Any]]:
+        """Move the wheel to `now` and return (key, payload) for every entry that is due."""
+        target = int(now / self.tick + 1e-9)
+        expired: List[Tuple[Hashable, Any]] = []
+
+        while self._current < target:
+            self._current += 1
+
+            # Refill lower levels top-down before expiring level 0 for this tick
+            if self._current % self._spans[self.levels] == 0 and self._overflow:
+                self._cascade(self._overflow)
+            for level in range(self.levels - 1, 0, -1):
+                if self._current % self._spans[level] == 0:
+                    slot = (self._current // self._spans[level]) % self.slots
+                    self._cascade(self._wheels[level][slot])
+
+            bucket = self._wheels[0][self._current % self.slots]
+            if bucket:
+                self._ready.update(bucket)
+                bucket.clear()
+
+        if self._ready:
+            for key, (_, payload) in self._ready.items():
+                del self._index[key]
+                expired.append((key, payload))
+            self._ready.clear()
+
+        return expired
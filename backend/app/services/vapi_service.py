@@ -1,13 +1,17 @@
-import httpx
+from datetime import datetime
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from uuid import UUID
 
 from app.core.config import settings
 from app.models.reminder import Reminder
+from app.schemas.webhook import VapiWebhookEvent
 
 logger = logging.getLogger(__name__)
 
+# endedReason values (or fragments) meaning the reminder was not delivered
+FAILED_END_REASON_MARKERS = ("error", "failed", "did-not-answer", "busy")
+
 
 class VapiService:
     def __init__(self):
@@ -21,6 +25,9 @@ class VapiService:
     async def trigger_call(
         self, reminder: Reminder, call_attempt_id: UUID
     ) -> tuple[bool, Optional[str], Optional[str]]:
+        # Imported on first call: the API process only needs httpx once it dispatches
+        import httpx
+
         try:
             assistant_config = self._build_assistant_config(reminder)
 
@@ -41,9 +48,7 @@ class VapiService:
                 payload["assistantId"] = settings.VAPI_ASSISTANT_ID
                 del payload["assistant"]
 
-            logger.info(
-                f"Triggering Vapi call for reminder {reminder.id} to {reminder.phone_number}"
-            )
+            logger.debug("Triggering Vapi call for reminder %s", reminder.id)
 
             async with httpx.AsyncClient(timeout=30.0) as client:
                 response = await client.post(
@@ -54,10 +59,11 @@ class VapiService:
                     call_data = response.json()
                     vapi_call_id = call_data.get("id")
 
-                    logger.info(
-                        f"Vapi call initiated successfully. "
-                        f"Vapi Call ID: {vapi_call_id}, "
-                        f"Reminder ID: {reminder.id}"
+                    logger.debug(
+                        "Vapi accepted call %s for reminder %s",
+                        vapi_call_id,
+                        reminder.id,
+                        extra={"vapi_call_id": vapi_call_id},
                     )
 
                     return True, vapi_call_id, None
@@ -65,19 +71,26 @@ class VapiService:
                 else:
                     error_msg = f"Vapi API error: {response.status_code} - {response.text}"
                     logger.error(
-                        f"Failed to trigger Vapi call for reminder {reminder.id}: {error_msg}"
+                        "Failed to trigger Vapi call for reminder %s: %s", reminder.id, error_msg
                     )
                     return False, None, error_msg
 
         except httpx.TimeoutException:
             error_msg = "Vapi API request timed out"
-            logger.error(f"Timeout triggering call for reminder {reminder.id}")
+            logger.error("Timeout triggering call for reminder %s", reminder.id)
+            return False, None, error_msg
+
+        except httpx.TransportError as e:
+            error_msg = f"Could not reach Vapi API: {e!r}"
+            logger.error("Failed to reach Vapi for reminder %s: %s", reminder.id, error_msg)
             return False, None, error_msg
 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
             logger.error(
-                f"Failed to trigger Vapi call for reminder {reminder.id}: {error_msg}",
+                "Failed to trigger Vapi call for reminder %s: %s",
+                reminder.id,
+                error_msg,
                 exc_info=True,
             )
             return False, None, error_msg
@@ -125,21 +138,30 @@ Keep the call brief and friendly. If they don't answer, leave a voicemail with t
 
         return config
 
-    async def get_call_status(self, vapi_call_id: str) -> Optional[Dict[str, Any]]:
+    async def get_call_status(self, vapi_call_id: str, client=None) -> Optional[Dict[str, Any]]:
+        """Fetch a call from Vapi; pass an httpx.AsyncClient to reuse its connections
+        across many lookups."""
+        import httpx
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            if client is None:
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await client.get(
+                        f"{self.api_url}/call/{vapi_call_id}", headers=self.headers
+                    )
+            else:
                 response = await client.get(
                     f"{self.api_url}/call/{vapi_call_id}", headers=self.headers
                 )
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(
-                        f"Failed to get Vapi call status for {vapi_call_id}: "
-                        f"{response.status_code} - {response.text}"
-                    )
-                    return None
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(
+                    f"Failed to get Vapi call status for {vapi_call_id}: "
+                    f"{response.status_code} - {response.text}"
+                )
+                return None
 
         except Exception as e:
             logger.error(
@@ -147,38 +169,70 @@ Keep the call brief and friendly. If they don't answer, leave a voicemail with t
             )
             return None
 
-    def parse_webhook_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
-        event_type = event_data.get("type", "")
-        call_data = event_data.get("call", {})
-
-        metadata = call_data.get("metadata", {})
-        reminder_id = metadata.get("reminder_id")
-        call_attempt_id = metadata.get("call_attempt_id")
-
-        vapi_call_id = call_data.get("id")
-        status = call_data.get("status", "")
-        duration = call_data.get("duration")
-        end_reason = call_data.get("endedReason", "")
-        cost = call_data.get("cost")
+    @staticmethod
+    def decode_webhook(body: Union[bytes, str]) -> VapiWebhookEvent:
+        """Decode a raw webhook body straight into the fields we use; raises
+        pydantic.ValidationError for malformed JSON or mistyped fields."""
+        return VapiWebhookEvent.model_validate_json(body)
+
+    def parse_webhook_event(
+        self, event: Union[VapiWebhookEvent, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        if not isinstance(event, VapiWebhookEvent):
+            event = VapiWebhookEvent.model_validate(event)
+        event_type = event.type
+        call = event.call
+        metadata = call.metadata if call else None
+        reminder_id = metadata.reminder_id if metadata else None
+        vapi_call_id = call.id if call else None
 
         parsed = {
             "event_type": event_type,
             "vapi_call_id": vapi_call_id,
             "reminder_id": reminder_id,
-            "call_attempt_id": call_attempt_id,
-            "status": status,
-            "duration_seconds": duration,
-            "end_reason": end_reason,
-            "cost": cost,
-            "raw_data": event_data,
+            "call_attempt_id": metadata.call_attempt_id if metadata else None,
+            "status": (call.status if call else None) or "",
+            "duration_seconds": call.duration if call else None,
+            "end_reason": (call.ended_reason if call else None) or "",
+            "cost": call.cost if call else None,
         }
 
-        logger.info(
-            f"Parsed Vapi webhook event: {event_type} for call {vapi_call_id}, "
-            f"reminder {reminder_id}"
+        logger.debug(
+            "Parsed Vapi webhook event %s for call %s, reminder %s",
+            event_type,
+            vapi_call_id,
+            reminder_id,
         )
 
         return parsed
 
+    def parse_call_status(
+        self, call_data: Dict[str, Any], reminder_id: str, call_attempt_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Turn a call fetched with get_call_status into the event its final webhook would
+        have produced, or None while the call is still going."""
+        if call_data.get("status") != "ended":
+            return None
+
+        end_reason = call_data.get("endedReason") or ""
+        failed = any(marker in end_reason for marker in FAILED_END_REASON_MARKERS)
+
+        duration = call_data.get("duration")
+        if duration is None and call_data.get("startedAt") and call_data.get("endedAt"):
+            started = datetime.fromisoformat(call_data["startedAt"].replace("Z", "+00:00"))
+            ended = datetime.fromisoformat(call_data["endedAt"].replace("Z", "+00:00"))
+            duration = max(0, int((ended - started).total_seconds()))
+
+        return {
+            "event_type": "call.failed" if failed else "call.ended",
+            "vapi_call_id": call_data.get("id"),
+            "reminder_id": reminder_id,
+            "call_attempt_id": call_attempt_id,
+            "status": "ended",
+            "duration_seconds": duration,
+            "end_reason": end_reason,
+            "cost": call_data.get("cost"),
+        }
+
 
 vapi_service = VapiService()
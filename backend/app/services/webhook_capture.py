@@ -0,0 +1,118 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import glob
+import gzip
+import heapq
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+_COMPACT = (",", ":")
+
+
+class WebhookCapture:
+    """Appends raw webhook bodies with their arrival time to gzip-compressed NDJSON.
+
+    The request path only enqueues the bytes it already read; a background thread encodes
+    and writes them. When the queue is full events are dropped (and counted) rather than
+    slowing webhook handling down. Each process writes its own file, so captures from
+    several uvicorn workers never interleave inside one gzip stream.
+    """
+
+    def __init__(self, directory: str, max_queue: int = 10_000, flush_interval: float = 1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.path: Optional[str] = None
+        self.captured = 0
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        self.path = os.path.join(self.directory, f"webhooks-{stamp}-{os.getpid()}.ndjson.gz")
+        self._thread = threading.Thread(target=self._run, name="WebhookCapture", daemon=True)
+        self._thread.start()
+        logger.info("Capturing Vapi webhooks to %s", self.path)
+
+    def stop(self):
+        if self._thread:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+            logger.info(
+                "Webhook capture stopped: %s captured, %s dropped", self.captured, self.dropped
+            )
+
+    def record(self, body: bytes, received_at: float):
+        try:
+            self._queue.put_nowait((received_at, body))
+        except queue.Full:
+            self.dropped += 1
+
+    @staticmethod
+    def _encode(received_at: float, body: bytes) -> bytes:
+        try:
+            event = json.loads(body)
+        except ValueError:
+            # Keep malformed bodies too; they are often what an incident is about
+            record = {"t": received_at, "raw": body.decode("utf-8", "replace")}
+        else:
+            record = {"t": received_at, "event": event}
+        return json.dumps(record, separators=_COMPACT).encode() + b"\n"
+
+    def _run(self):
+        with gzip.open(self.path, "ab") as out:
+            last_flush = time.monotonic()
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP:
+                    return
+                if item is not None:
+                    try:
+                        out.write(self._encode(*item))
+                        self.captured += 1
+                    except Exception as e:
+                        logger.warning("Failed to capture webhook: %s", e)
+
+                if time.monotonic() - last_flush >= self.flush_interval:
+                    out.flush()
+                    last_flush = time.monotonic()
+
+
+def read_capture(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield captured records from one or more files (or globs) in arrival order."""
+    files: List[str] = []
+    for path in paths:
+        files.extend(sorted(glob.glob(path)) or [path])
+
+    def records(path):
+        with gzip.open(path, "rt") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    yield from heapq.merge(*(records(path) for path in files), key=lambda record: record["t"])
+
+
+@lru_cache()
+def get_webhook_capture() -> Optional[WebhookCapture]:
+    """The process-wide capture, or None unless WEBHOOK_CAPTURE_DIR is set"""
+    if not settings.WEBHOOK_CAPTURE_DIR:
+        return None
+    return WebhookCapture(settings.WEBHOOK_CAPTURE_DIR, max_queue=settings.WEBHOOK_CAPTURE_QUEUE)
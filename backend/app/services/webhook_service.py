@@ -1,10 +1,17 @@
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from uuid import UUID
 import logging
 
+from app.core.logging_config import log_context
 from app.models.reminder import Reminder, CallAttempt, ReminderStatus, CallAttemptStatus
+from app.schemas.webhook import VapiWebhookEvent
+from app.services.recurrence import RecurrenceService
+from app.services.reminder_cache import invalidate_reminders
+from app.services.scheduler_service import get_scheduler
+from app.services.stats_service import StatsService
 from app.services.vapi_service import vapi_service
 
 logger = logging.getLogger(__name__)
@@ -12,83 +19,149 @@ logger = logging.getLogger(__name__)
 
 class WebhookService:
     @staticmethod
-    def process_vapi_webhook(db: Session, event_data: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            parsed = vapi_service.parse_webhook_event(event_data)
+    def process_vapi_webhook(
+        db: Session, event: Union[VapiWebhookEvent, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Apply a webhook, decoded by VapiService.decode_webhook or as a plain dict"""
+        if not isinstance(event, VapiWebhookEvent):
+            try:
+                event = VapiWebhookEvent.model_validate(event)
+            except ValidationError as e:
+                logger.error("Invalid Vapi webhook: %s", e)
+                return {"status": "error", "message": str(e)}
+
+        call = event.call
+        metadata = call.metadata if call else None
+        with log_context(
+            vapi_call_id=call.id if call else None,
+            reminder_id=metadata.reminder_id if metadata else None,
+            call_attempt_id=metadata.call_attempt_id if metadata else None,
+        ):
+            return WebhookService._process_vapi_webhook(db, event)
 
-            event_type = parsed["event_type"]
-            vapi_call_id = parsed["vapi_call_id"]
-            reminder_id_str = parsed["reminder_id"]
-            call_attempt_id_str = parsed["call_attempt_id"]
+    @staticmethod
+    def _process_vapi_webhook(db: Session, event: VapiWebhookEvent) -> Dict[str, Any]:
+        try:
+            parsed = vapi_service.parse_webhook_event(event)
 
-            if not vapi_call_id:
+            if not parsed["vapi_call_id"]:
                 logger.warning("Webhook received without vapi_call_id")
                 return {"status": "ignored", "message": "No vapi_call_id in webhook"}
 
-            logger.info(f"Processing Vapi webhook: {event_type} for call {vapi_call_id}")
+            return WebhookService.apply_call_event(db, parsed)
 
-            call_attempt = None
+        except Exception as e:
+            logger.error("Error processing Vapi webhook: %s", e, exc_info=True)
+            db.rollback()
+            return {"status": "error", "message": str(e)}
 
-            if call_attempt_id_str:
-                try:
-                    call_attempt = (
-                        db.query(CallAttempt)
-                        .filter(CallAttempt.id == UUID(call_attempt_id_str))
-                        .first()
-                    )
-                except ValueError:
-                    pass
+    @staticmethod
+    def apply_call_event(db: Session, parsed: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a parsed call event (see VapiService.parse_webhook_event) to its attempt
+        and reminder and commit. Shared by the webhook endpoint and the call reconciler."""
+        event_type = parsed["event_type"]
+        vapi_call_id = parsed["vapi_call_id"]
+        call_attempt_id_str = parsed["call_attempt_id"]
+
+        logger.debug("Processing Vapi webhook %s for call %s", event_type, vapi_call_id)
+
+        call_attempt = None
 
-            if not call_attempt:
+        if call_attempt_id_str:
+            try:
                 call_attempt = (
-                    db.query(CallAttempt).filter(CallAttempt.vapi_call_id == vapi_call_id).first()
+                    db.query(CallAttempt)
+                    .filter(CallAttempt.id == UUID(call_attempt_id_str))
+                    .first()
                 )
+            except ValueError:
+                pass
 
-            if not call_attempt:
-                logger.warning(f"CallAttempt not found for vapi_call_id: {vapi_call_id}")
-                return {
-                    "status": "not_found",
-                    "message": f"CallAttempt not found for call {vapi_call_id}",
-                }
+        if not call_attempt and vapi_call_id:
+            call_attempt = (
+                db.query(CallAttempt).filter(CallAttempt.vapi_call_id == vapi_call_id).first()
+            )
 
-            reminder = call_attempt.reminder
-
-            if not reminder:
-                logger.error(f"Reminder not found for call_attempt {call_attempt.id}")
-                return {"status": "error", "message": "Reminder not found"}
+        if not call_attempt:
+            logger.warning("CallAttempt not found for vapi_call_id: %s", vapi_call_id)
+            return {
+                "status": "not_found",
+                "message": f"CallAttempt not found for call {vapi_call_id}",
+            }
 
-            if event_type == "call.started":
-                WebhookService._handle_call_started(call_attempt, reminder, parsed)
+        reminder = call_attempt.reminder
 
-            elif event_type == "call.ended":
-                WebhookService._handle_call_ended(call_attempt, reminder, parsed)
+        if not reminder:
+            logger.error("Reminder not found for call_attempt %s", call_attempt.id)
+            return {"status": "error", "message": "Reminder not found"}
 
-            elif event_type == "call.failed":
-                WebhookService._handle_call_failed(call_attempt, reminder, parsed)
+        previous_status = reminder.status
+        next_occurrence = None
+        attempt_already_final = call_attempt.status in (
+            CallAttemptStatus.COMPLETED,
+            CallAttemptStatus.FAILED,
+        )
 
-            else:
-                logger.info(
-                    f"Received {event_type} event for call {vapi_call_id} - no action needed"
+        if event_type == "call.started":
+            WebhookService._handle_call_started(call_attempt, reminder, parsed)
+
+        elif event_type == "call.ended":
+            WebhookService._handle_call_ended(call_attempt, reminder, parsed)
+            if not attempt_already_final:
+                StatsService.record_call(
+                    db,
+                    reminder.user_id,
+                    reminder.status,
+                    parsed["duration_seconds"],
+                    parsed["cost"],
+                )
+                next_occurrence = RecurrenceService.materialize_next(db, reminder)
+
+        elif event_type == "call.failed":
+            WebhookService._handle_call_failed(call_attempt, reminder, parsed)
+            if not attempt_already_final:
+                StatsService.record_call(db, reminder.user_id, reminder.status)
+                next_occurrence = RecurrenceService.materialize_next(db, reminder)
+
+        else:
+            logger.debug(
+                "Received %s event for call %s - no action needed", event_type, vapi_call_id
+            )
+
+        if call_attempt.attempt_number == reminder.attempt_count:
+            reminder.last_attempt_status = call_attempt.status
+        # The detail response includes the attempts, so a change to either row is a new
+        # version; events that changed nothing leave the version and the cache alone
+        changed = db.is_modified(call_attempt) or db.is_modified(reminder)
+        if changed:
+            reminder.updated_at = datetime.now(timezone.utc)
+
+        StatsService.record_transition(db, reminder.user_id, previous_status, reminder.status)
+        scheduler = get_scheduler()
+        if next_occurrence is not None:
+            db.flush()
+            scheduler.stage(db, [next_occurrence.id])
+        db.commit()
+        if changed:
+            invalidate_reminders([reminder.id])
+
+        if next_occurrence is not None:
+            if not scheduler.schedule_reminder(next_occurrence):
+                logger.error(
+                    "Next occurrence %s created but failed to schedule", next_occurrence.id
                 )
 
-            db.commit()
-
-            return {
-                "status": "success",
-                "message": f"Processed {event_type} for call {vapi_call_id}",
-                "reminder_id": str(reminder.id),
-                "call_attempt_id": str(call_attempt.id),
-            }
-
-        except Exception as e:
-            logger.error(f"Error processing Vapi webhook: {str(e)}", exc_info=True)
-            db.rollback()
-            return {"status": "error", "message": str(e)}
+        return {
+            "status": "success",
+            "message": f"Processed {event_type} for call {vapi_call_id}",
+            "reminder_id": str(reminder.id),
+            "call_attempt_id": str(call_attempt.id),
+        }
 
     @staticmethod
     def _handle_call_started(call_attempt: CallAttempt, reminder: Reminder, parsed: Dict[str, Any]):
         call_attempt.status = CallAttemptStatus.ANSWERED
-        logger.info(f"Call started for reminder {reminder.id}, " f"call_attempt {call_attempt.id}")
+        logger.info("Call started for reminder %s, call_attempt %s", reminder.id, call_attempt.id)
 
     @staticmethod
     def _handle_call_ended(call_attempt: CallAttempt, reminder: Reminder, parsed: Dict[str, Any]):
@@ -103,8 +176,9 @@ class WebhookService:
         reminder.updated_at = datetime.now(timezone.utc)
 
         logger.info(
-            f"Call completed for reminder {reminder.id}. "
-            f"Duration: {call_attempt.duration_seconds}s"
+            "Call completed for reminder %s. Duration: %ss",
+            reminder.id,
+            call_attempt.duration_seconds,
         )
 
     @staticmethod
@@ -118,7 +192,7 @@ class WebhookService:
         reminder.updated_at = datetime.now(timezone.utc)
 
         logger.warning(
-            f"Call failed for reminder {reminder.id}. " f"Reason: {call_attempt.failure_reason}"
+            "Call failed for reminder %s. Reason: %s", reminder.id, call_attempt.failure_reason
         )
 
 
@@ -0,0 +1,34 @@
+"""Compare reminder_stats against live counts from reminders.
+
+Usage: python -m app.tools.check_stats [--repair]
+"""
+import argparse
+import json
+import sys
+
+from app.db.database import SessionLocal
+from app.services.stats_service import StatsService
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repair", action="store_true", help="Apply corrective deltas")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        mismatches = StatsService.check_consistency(db, repair=args.repair)
+    finally:
+        db.close()
+
+    for mismatch in mismatches:
+        print(json.dumps(mismatch))
+
+    if not mismatches:
+        print("reminder_stats is consistent")
+        return 0
+    return 0 if args.repair else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
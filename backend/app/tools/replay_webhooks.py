@@ -0,0 +1,241 @@
+"""Replay captured Vapi webhooks (WEBHOOK_CAPTURE_DIR) into WebhookService.
+
+Usage: python -m app.tools.replay_webhooks CAPTURE [CAPTURE ...] [--speed 1] [--concurrency 4]
+       [--url http://localhost:8000/api/webhooks/vapi] [--unordered] [--show-diffs 20]
+
+CAPTURE may be a file or a glob; several files (one per API worker) are merged by arrival
+time. --speed 1 replays at the captured pace, 10 at 10x, 0 as fast as possible. Events of
+the same call always go to the same worker in capture order unless --unordered is given.
+Without --url events go straight into WebhookService against DATABASE_URL (point it at a
+restored snapshot); with --url they are POSTed to a running API.
+
+Prints throughput, lag behind the replay schedule, processing time, handler results and
+the reminder / call attempt state changes the replay caused, as JSON.
+"""
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import SessionLocal
+from app.models.reminder import CallAttempt, Reminder
+from app.services.webhook_capture import read_capture
+from app.services.webhook_service import webhook_service
+
+_IN_CHUNK = 500
+
+
+def _percentiles_ms(samples: Sequence[float]) -> Dict[str, Optional[float]]:
+    ordered = sorted(samples)
+    result: Dict[str, Optional[float]] = {}
+    for point in (50, 95, 99):
+        index = min(len(ordered) - 1, int(len(ordered) * point / 100))
+        result[f"p{point}"] = round(ordered[index] * 1000, 2) if ordered else None
+    result["max"] = round(ordered[-1] * 1000, 2) if ordered else None
+    return result
+
+
+def _uuid(value) -> Optional[UUID]:
+    try:
+        return UUID(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _touched(events: Iterable[Dict[str, Any]]):
+    reminder_ids, attempt_ids, call_ids = set(), set(), set()
+    for event in events:
+        call = event.get("call") or {}
+        metadata = call.get("metadata") or {}
+        if call.get("id"):
+            call_ids.add(call["id"])
+        if _uuid(metadata.get("reminder_id")):
+            reminder_ids.add(_uuid(metadata["reminder_id"]))
+        if _uuid(metadata.get("call_attempt_id")):
+            attempt_ids.add(_uuid(metadata["call_attempt_id"]))
+    return reminder_ids, attempt_ids, call_ids
+
+
+def snapshot_state(session_factory: sessionmaker, events: List[Dict[str, Any]]) -> Dict:
+    """Status of every reminder and call attempt the events refer to"""
+    reminder_ids, attempt_ids, call_ids = _touched(events)
+    state: Dict[str, Dict] = {"reminders": {}, "call_attempts": {}}
+
+    db = session_factory()
+    try:
+        attempts = db.query(CallAttempt.id, CallAttempt.reminder_id, CallAttempt.status)
+        for criteria in [CallAttempt.id.in_(chunk) for chunk in _chunks(attempt_ids)] + [
+            CallAttempt.vapi_call_id.in_(chunk) for chunk in _chunks(call_ids)
+        ]:
+            for row in attempts.filter(criteria):
+                state["call_attempts"][str(row.id)] = row.status.value
+                reminder_ids.add(row.reminder_id)
+
+        for chunk in _chunks(reminder_ids):
+            for row in db.query(Reminder.id, Reminder.status).filter(Reminder.id.in_(chunk)):
+                state["reminders"][str(row.id)] = row.status.value
+    finally:
+        db.close()
+    return state
+
+
+def _chunks(values):
+    values = list(values)
+    return [values[i : i + _IN_CHUNK] for i in range(0, len(values), _IN_CHUNK)]
+
+
+def diff_state(before: Dict[str, Dict], after: Dict[str, Dict]):
+    transitions: Dict[str, Counter] = {}
+    changed = []
+    for kind in ("reminders", "call_attempts"):
+        counter: Counter = Counter()
+        for key in before[kind].keys() | after[kind].keys():
+            old, new = before[kind].get(key, "missing"), after[kind].get(key, "missing")
+            if old != new:
+                counter[f"{old} -> {new}"] += 1
+                changed.append({"kind": kind, "id": key, "before": old, "after": new})
+        transitions[kind] = counter
+    return transitions, changed
+
+
+def replay(
+    records: Iterable[Dict[str, Any]],
+    session_factory: sessionmaker = SessionLocal,
+    speed: float = 1.0,
+    concurrency: int = 4,
+    url: Optional[str] = None,
+    ordered: bool = True,
+    compare_state: bool = True,
+    show_diffs: int = 20,
+) -> Dict[str, Any]:
+    records = list(records)
+    events = [record for record in records if "event" in record]
+    if not events:
+        return {"events": 0, "malformed": len(records)}
+
+    payloads = [record["event"] for record in events]
+    before = snapshot_state(session_factory, payloads) if compare_state else None
+
+    client = None
+    if url:
+        import httpx
+
+        client = httpx.Client(timeout=30.0)
+
+    queues: List[queue.Queue] = [queue.Queue() for _ in range(concurrency)]
+    lags: List[float] = []
+    durations: List[float] = []
+    results: Counter = Counter()
+    lock = threading.Lock()
+
+    def handle(event: Dict[str, Any]) -> str:
+        if client is not None:
+            response = client.post(url, json=event)
+            return response.json().get("status", f"http_{response.status_code}")
+        db = session_factory()
+        try:
+            return webhook_service.process_vapi_webhook(db, event)["status"]
+        finally:
+            db.close()
+
+    def work(inbox: queue.Queue):
+        while True:
+            item = inbox.get()
+            if item is None:
+                return
+            due, event = item
+            started = time.perf_counter()
+            try:
+                status = handle(event)
+            except Exception as e:
+                status = f"exception: {type(e).__name__}"
+            finished = time.perf_counter()
+            with lock:
+                lags.append(max(0.0, started - due))
+                durations.append(finished - started)
+                results[status] += 1
+
+    workers = [
+        threading.Thread(target=work, args=(inbox,), name=f"replay-{i}", daemon=True)
+        for i, inbox in enumerate(queues)
+    ]
+    for worker in workers:
+        worker.start()
+
+    first = events[0]["t"]
+    started = time.perf_counter()
+    for i, record in enumerate(events):
+        due = started + (record["t"] - first) / speed if speed > 0 else time.perf_counter()
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        if ordered:
+            call_id = str((record["event"].get("call") or {}).get("id"))
+            inbox = queues[zlib.crc32(call_id.encode()) % concurrency]
+        else:
+            inbox = queues[i % concurrency]
+        inbox.put((due, record["event"]))
+
+    for inbox in queues:
+        inbox.put(None)
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    if client is not None:
+        client.close()
+
+    report: Dict[str, Any] = {
+        "events": len(events),
+        "malformed": len(records) - len(events),
+        "captured_span_seconds": round(events[-1]["t"] - first, 3),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_per_second": round(len(events) / elapsed, 1) if elapsed else None,
+        "lag_ms": _percentiles_ms(lags),
+        "processing_ms": _percentiles_ms(durations),
+        "results": dict(results),
+    }
+    if compare_state:
+        transitions, changed = diff_state(before, snapshot_state(session_factory, payloads))
+        report["state_changes"] = {kind: dict(counter) for kind, counter in transitions.items()}
+        report["changed"] = changed[:show_diffs]
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("captures", nargs="+", help="Capture files or globs")
+    parser.add_argument("--speed", type=float, default=1.0, help="1 = real time, 0 = unpaced")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--url", help="POST to a running API instead of calling the service")
+    parser.add_argument("--unordered", action="store_true", help="Don't keep per-call order")
+    parser.add_argument("--no-state", action="store_true", help="Skip the before/after diff")
+    parser.add_argument("--show-diffs", type=int, default=20)
+    args = parser.parse_args()
+
+    report = replay(
+        read_capture(args.captures),
+        speed=args.speed,
+        concurrency=args.concurrency,
+        url=args.url,
+        ordered=not args.unordered,
+        compare_state=not args.no_state,
+        show_diffs=args.show_diffs,
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
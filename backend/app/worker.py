@@ -0,0 +1,56 @@
+"""Standalone dispatcher process: python -m app.worker
+
+Owns the APScheduler job store, the in-memory timing wheel and periodic housekeeping, so
+the API can run with SCHEDULER_MODE=worker and any number of uvicorn workers. API
+processes only write reminders and signal changes through scheduler_signals. Run exactly
+one worker per database.
+"""
+import logging
+import signal
+import threading
+
+from app.core.config import settings
+from app.core.logging_config import setup_logging, shutdown_logging
+from app.services.reconciliation_service import run_call_reconciler
+from app.services.retention_service import run_retention_archiver
+from app.services.scheduler_service import ReminderScheduler
+from app.services.scheduler_signals import SignalConsumer
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    setup_logging()
+    logger.info("Starting Call Me Reminder dispatcher worker (%s)", settings.ENVIRONMENT)
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    scheduler = ReminderScheduler()
+    scheduler.start()
+    scheduler.reschedule_all_pending()
+    scheduler.add_maintenance_job(
+        run_retention_archiver, "retention_archiver", settings.RETENTION_INTERVAL_MINUTES
+    )
+    scheduler.add_maintenance_job(
+        run_call_reconciler, "call_reconciler", settings.RECONCILE_INTERVAL_MINUTES
+    )
+
+    consumer = SignalConsumer(scheduler, poll_interval=settings.SCHEDULER_SIGNAL_POLL_SECONDS)
+    consumer.start()
+    logger.info("Dispatcher worker ready")
+
+    while not stop.wait(1.0):
+        if not consumer.is_alive():
+            logger.error("Signal consumer stopped unexpectedly, restarting it")
+            consumer.start()
+
+    logger.info("Shutting down dispatcher worker...")
+    consumer.stop()
+    scheduler.shutdown()
+    shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
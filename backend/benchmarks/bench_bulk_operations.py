@@ -0,0 +1,122 @@
+"""Bulk cancel / reschedule / delete vs the per-reminder endpoints' code paths.
+
+Seeds three groups of --items scheduled reminders, registers them with a running
+ReminderScheduler (reminder job store on the same database), then:
+
+  per-item  update_reminder and delete_reminder once per reminder, as a client looping
+            over the single-reminder endpoints does (fetch, commit, job store round trip)
+  bulk      bulk_reschedule / bulk_delete over an id list: one UPDATE/DELETE ... RETURNING
+            and one batched job store change
+  cancel    bulk_cancel over the third group
+
+Also times reschedule_all_pending, which now registers jobs in batches.
+
+Usage: python -m benchmarks.bench_bulk_operations [--items 10000] [--database-url ...]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import make_engine, seed_reminders
+
+from app.models import ReminderStatus
+
+
+def timed_once(label, items, fn):
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    print(f"   {label:34s} {elapsed:8.2f}s  {items / elapsed:10.0f} items/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench_bulk.db"
+    # The scheduler's job store lives in the configured database, so point settings at it
+    # before anything reads them
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["SCHEDULER_MODE"] = "embedded"
+
+    from app.schemas.reminder import ReminderBulkReschedule, ReminderBulkSelection, ReminderUpdate
+    from app.services.reminder_service import ReminderService
+    from app.services.scheduler_service import ReminderScheduler
+
+    engine, Session = make_engine(database_url)
+    groups = [
+        seed_reminders(
+            engine,
+            args.items,
+            statuses=(ReminderStatus.SCHEDULED,),
+            weights=(1,),
+            # Days out so every reminder is an APScheduler job rather than a wheel entry;
+            # 2s apart so per-item +1s moves never hit the exact-time conflict check
+            start=datetime.now(timezone.utc) + timedelta(days=2),
+            spacing=timedelta(seconds=2),
+        )
+        for _ in range(3)
+    ]
+    per_item, bulk, cancel = groups
+
+    scheduler = ReminderScheduler()
+    scheduler.start()
+    try:
+        print(f"{args.items} reminders per operation ({engine.dialect.name})")
+        timed_once(
+            "reschedule_all_pending (startup)", args.items * 3, scheduler.reschedule_all_pending
+        )
+        print(f"   jobs in store: {scheduler.count_scheduled_jobs()}")
+
+        with Session() as db:
+
+            def reschedule_each():
+                for reminder_id in per_item:
+                    when = ReminderService.get_reminder_by_id(db, reminder_id).scheduled_for
+                    # SQLite hands timezone-aware columns back as naive UTC
+                    when = when if when.tzinfo else when.replace(tzinfo=timezone.utc)
+                    ReminderService.update_reminder(
+                        db, reminder_id, ReminderUpdate(scheduled_for=when + timedelta(seconds=1))
+                    )
+
+            def delete_each():
+                for reminder_id in per_item:
+                    ReminderService.delete_reminder(db, reminder_id)
+
+            timed_once("per-item reschedule", args.items, reschedule_each)
+            result = timed_once(
+                "bulk reschedule",
+                args.items,
+                lambda: ReminderService.bulk_reschedule(
+                    db, ReminderBulkReschedule(ids=bulk, shift_seconds=1)
+                ),
+            )
+            assert result["succeeded"] == args.items, result["skipped"]
+
+            result = timed_once(
+                "bulk cancel",
+                args.items,
+                lambda: ReminderService.bulk_cancel(db, ReminderBulkSelection(ids=cancel)),
+            )
+            assert result["succeeded"] == args.items
+
+            timed_once("per-item delete", args.items, delete_each)
+            result = timed_once(
+                "bulk delete",
+                args.items,
+                lambda: ReminderService.bulk_delete(db, ReminderBulkSelection(ids=bulk)),
+            )
+            assert result["succeeded"] == args.items
+
+        print(f"   jobs left in store: {scheduler.count_scheduled_jobs()}")
+    finally:
+        scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Calendar counts and time-range pages over a year of reminders.
+
+Usage: python -m benchmarks.bench_calendar [--rows 1000000] [--timezone America/New_York]
+       [--database-url sqlite:///bench.db]
+
+Seeds --rows reminders spread evenly over a year, then times, in the caller's timezone:
+
+  month by day     GET /api/reminders/calendar for a month containing a DST change
+  week by hour     the same for a week, per hour
+  python buckets   the month's (scheduled_for, status) pairs fetched and bucketed in Python,
+                   what a client pulling every reminder would have to do
+  range page       the first list page of a day's reminders, with its total, through the
+                   scheduled_from/scheduled_to filters
+"""
+import argparse
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import make_engine, seed_reminders, timed
+
+from sqlalchemy import select
+
+from app.models import Reminder
+from app.services.calendar_service import CalendarService
+from app.services.reminder_service import ReminderService
+
+YEAR = timedelta(days=365)
+
+
+def python_buckets(db, start, end, tz):
+    rows = db.execute(
+        select(Reminder.scheduled_for, Reminder.status).where(
+            Reminder.scheduled_for >= start, Reminder.scheduled_for < end
+        )
+    )
+    return Counter(
+        (when.replace(tzinfo=timezone.utc).astimezone(tz).date(), status) for when, status in rows
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--timezone", default="America/New_York")
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    import pytz
+
+    tz = pytz.timezone(args.timezone)
+    engine, Session = make_engine(args.database_url, "bench_calendar")
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    seed_reminders(engine, args.rows, start=start, spacing=YEAR / args.rows)
+
+    month = (datetime(2026, 10, 15), datetime(2026, 11, 15))
+    week = (datetime(2026, 10, 29), datetime(2026, 11, 5))
+    day = (
+        tz.localize(datetime(2026, 6, 1)).astimezone(timezone.utc),
+        tz.localize(datetime(2026, 6, 2)).astimezone(timezone.utc),
+    )
+    month_utc = tuple(tz.localize(bound).astimezone(timezone.utc) for bound in month)
+    print(f"{args.rows} reminders over a year, bucketed in {args.timezone} ({engine.dialect.name})")
+
+    with Session() as db:
+        calendar = CalendarService.get_buckets(db, *month, args.timezone)
+        in_month = sum(bucket["total"] for bucket in calendar["buckets"])
+        assert sum(python_buckets(db, *month_utc, tz).values()) == in_month
+
+        cases = (
+            ("month by day", lambda: CalendarService.get_buckets(db, *month, args.timezone)),
+            (
+                "week by hour",
+                lambda: CalendarService.get_buckets(db, *week, args.timezone, "hour"),
+            ),
+            ("python buckets", lambda: python_buckets(db, *month_utc, tz)),
+            (
+                "range page",
+                lambda: ReminderService.get_reminder_items(
+                    db, scheduled_from=day[0], scheduled_to=day[1]
+                ),
+            ),
+        )
+        print(f"   month: {len(calendar['buckets'])} buckets, {in_month} reminders")
+        for name, run in cases:
+            print(f"   {name:<16} {timed(run):9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
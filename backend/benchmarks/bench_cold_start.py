@@ -0,0 +1,62 @@
+"""Cold start: process spawn to first healthy response.
+
+For each run a fresh `uvicorn app.main:app` is started against a fresh SQLite file (or
+--database-url) and polled until /health/live answers 200, then until /health/ready does.
+Also reports the bare `import app.main` time in a fresh interpreter.
+
+Usage: python -m benchmarks.bench_cold_start [--runs 5] [--mode embedded|worker]
+"""
+import argparse
+import os
+import statistics
+import time
+
+from benchmarks.common import free_port, make_engine, spawn, spawn_api, terminate, wait_for_http
+
+
+def import_time(env):
+    started = time.perf_counter()
+    spawn(["-c", "import app.main"], env).wait()
+    return time.perf_counter() - started
+
+
+def cold_start(env):
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = spawn_api(env, port)
+    try:
+        live = wait_for_http(f"{base_url}/health/live", interval=0.005) - started
+        ready = wait_for_http(f"{base_url}/health/ready", interval=0.005) - started
+        return live, ready
+    finally:
+        terminate([process])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mode", choices=["embedded", "worker"], default="embedded")
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    engine, _ = make_engine(args.database_url, "bench_cold_start")
+    env = dict(
+        os.environ,
+        DATABASE_URL=engine.url.render_as_string(hide_password=False),
+        SCHEDULER_MODE=args.mode,
+        LOG_LEVEL="WARNING",
+    )
+    engine.dispose()
+
+    imports = [import_time(env) for _ in range(args.runs)]
+    starts = [cold_start(env) for _ in range(args.runs)]
+
+    print(f"cold start ({args.mode}), median of {args.runs} runs")
+    print(f"   python -c 'import app.main'     {statistics.median(imports) * 1000:8.0f} ms")
+    print(f"   spawn -> /health/live 200       {statistics.median(s[0] for s in starts) * 1000:8.0f} ms")
+    print(f"   spawn -> /health/ready 200      {statistics.median(s[1] for s in starts) * 1000:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""POST /api/reminders throughput: embedded scheduler vs API workers + standalone dispatcher.
+
+Starts real uvicorn processes against a fresh database and fires --requests creates with
+--concurrency client threads:
+
+  embedded  one uvicorn worker running the scheduler in-process (the only safe setup
+            before the standalone worker existed)
+  worker    --workers uvicorn workers with SCHEDULER_MODE=worker plus `python -m app.worker`
+
+Reports requests/second and latency percentiles, then how long the dispatcher took to
+turn every signal into a scheduled job.
+
+Usage: python -m benchmarks.bench_create_throughput [--requests 2000] [--workers 4]
+       [--database-url postgresql://...]   (an empty database; tables are recreated)
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import (
+    free_port,
+    make_engine,
+    percentiles,
+    spawn,
+    spawn_api,
+    terminate,
+    wait_for_http,
+)
+
+import httpx
+from sqlalchemy import text
+
+
+def _count_jobs(engine):
+    with engine.connect() as connection:
+        try:
+            return connection.execute(text("SELECT COUNT(*) FROM reminder_jobs")).scalar_one()
+        except Exception:
+            return 0
+
+
+def run(mode, args, database_url):
+    engine, _ = make_engine(database_url, f"bench_create_{mode}")
+    url = engine.url.render_as_string(hide_password=False)
+
+    env = dict(
+        os.environ,
+        DATABASE_URL=url,
+        SCHEDULER_MODE=mode,
+        SCHEDULER_SIGNAL_POLL_SECONDS="0.2",
+        LOG_LEVEL="WARNING",
+    )
+    port = free_port()
+    workers = 1 if mode == "embedded" else args.workers
+    processes = []
+    if mode == "worker":
+        processes.append(spawn(["-m", "app.worker"], env))
+    processes.append(spawn_api(env, port, workers))
+    base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        wait_for_http(f"{base_url}/health/live")
+
+        start = datetime.now(timezone.utc) + timedelta(days=1)
+        client = httpx.Client(base_url=base_url, timeout=60)
+        latencies = []
+        errors = 0
+
+        def create(i):
+            payload = {
+                "title": f"Benchmark {i}",
+                "message": "Benchmark reminder message",
+                "phone_number": "+12025551234",
+                "scheduled_for": (start + timedelta(seconds=i)).isoformat(),
+                "timezone": "UTC",
+            }
+            started = time.perf_counter()
+            response = client.post("/api/reminders/", json=payload)
+            return time.perf_counter() - started, response.status_code
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            for latency, status_code in pool.map(create, range(args.requests)):
+                latencies.append(latency)
+                errors += status_code != 201
+        elapsed = time.perf_counter() - started
+
+        settled = None
+        created = args.requests - errors
+        deadline = time.perf_counter() + 120
+        while time.perf_counter() < deadline:
+            if _count_jobs(engine) >= created:
+                settled = time.perf_counter() - started - elapsed
+                break
+            time.sleep(0.1)
+
+        ms = {key: value * 1000 for key, value in percentiles(latencies).items()}
+        print(
+            f"{mode:9s} api workers {workers}  {args.requests / elapsed:8.1f} req/s  "
+            f"p50 {ms['p50']:7.1f} ms  p95 {ms['p95']:7.1f} ms  p99 {ms['p99']:7.1f} ms  "
+            f"errors {errors}  jobs settled "
+            + (f"+{settled:.2f}s" if settled is not None else "timeout")
+        )
+        client.close()
+    finally:
+        terminate(processes)
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    for mode in ("embedded", "worker"):
+        run(mode, args, args.database_url)
+
+
+if __name__ == "__main__":
+    main()
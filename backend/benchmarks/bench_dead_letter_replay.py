@@ -0,0 +1,128 @@
+"""Replaying an outage's failed dispatches: bulk dead-letter replay vs POST /{id}/retry.
+
+Seeds --items failed reminders with a provider_error dead letter each, all from one
+10-minute window, plus --noise dead letters of other reasons and times. Then:
+
+  query    the first page of the window's dead letters, with counts by reason
+  retry    ReminderService.retry_reminder for --per-item other failed reminders, the
+           one-at-a-time path a client had before
+  replay   DeadLetterService.replay over the window, rescheduling --rate calls per second
+
+Runs with SCHEDULER_MODE=worker, as an API process: rescheduled reminders are signalled
+to the dispatcher rather than called from here.
+
+Usage: python -m benchmarks.bench_dead_letter_replay [--items 50000] [--noise 50000]
+       [--per-item 1000] [--rate 20] [--database-url ...]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import make_engine, seed_reminders, timed
+
+from sqlalchemy import func, insert, select
+
+from app.models import DeadLetter, DeadLetterKind, DeadLetterReason, ReminderStatus
+
+
+def seed_dead_letters(engine, reminder_ids, reason, created_from, window, chunk=10_000):
+    with engine.begin() as connection:
+        for offset in range(0, len(reminder_ids), chunk):
+            connection.execute(
+                insert(DeadLetter),
+                [
+                    {
+                        "kind": DeadLetterKind.DISPATCH,
+                        "reason": reason,
+                        "reminder_id": reminder_id,
+                        "error": f"Vapi API error: 503 - {reason.value}",
+                        "created_at": created_from + window * random.random(),
+                        "replay_count": 0,
+                    }
+                    for reminder_id in reminder_ids[offset : offset + chunk]
+                ],
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--noise", type=int, default=50_000)
+    parser.add_argument("--per-item", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=20.0)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench_replay.db"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["SCHEDULER_MODE"] = "worker"
+
+    from app.models.signal import SchedulerSignal
+    from app.schemas.dead_letter import DeadLetterReplay, DeadLetterSelection
+    from app.services.dead_letter_service import DeadLetterService
+    from app.services.reminder_service import ReminderService
+
+    engine, Session = make_engine(database_url)
+    past = datetime.now(timezone.utc) - timedelta(days=1)
+    failed = dict(statuses=(ReminderStatus.FAILED,), weights=(1,), start=past)
+    outage = seed_reminders(engine, args.items, **failed)
+    others = seed_reminders(engine, args.noise, **failed)
+    per_item = seed_reminders(engine, args.per_item, **failed)
+
+    outage_start = past + timedelta(hours=2)
+    window = timedelta(minutes=10)
+    seed_dead_letters(engine, outage, DeadLetterReason.PROVIDER_ERROR, outage_start, window)
+    for i, reason in enumerate((DeadLetterReason.REJECTED, DeadLetterReason.TIMEOUT)):
+        half = others[i::2]
+        seed_dead_letters(engine, half, reason, past, timedelta(days=1))
+
+    selection = dict(
+        reason=DeadLetterReason.PROVIDER_ERROR,
+        created_from=outage_start,
+        created_to=outage_start + window,
+    )
+    total = args.items + args.noise
+    print(f"{args.items} outage dead letters among {total} ({engine.dialect.name})")
+
+    with Session() as db:
+        query_ms = timed(
+            lambda: DeadLetterService.get_dead_letters(db, DeadLetterSelection(**selection))
+        )
+        print(f"   query first page + counts      {query_ms:8.1f} ms")
+
+        when = datetime.now(timezone.utc) + timedelta(hours=1)
+        started = time.perf_counter()
+        for i, reminder_id in enumerate(per_item):
+            ReminderService.retry_reminder(db, reminder_id, when + timedelta(seconds=i))
+        elapsed = time.perf_counter() - started
+        print(
+            f"   per-item retry                 {args.per_item / elapsed:8.0f} items/s"
+            f"  ({args.items * elapsed / args.per_item:6.1f}s for {args.items})"
+        )
+
+        started = time.perf_counter()
+        result = DeadLetterService.replay(
+            db, DeadLetterReplay(**selection, rate_per_second=args.rate, limit=100_000)
+        )
+        elapsed = time.perf_counter() - started
+        assert result["replayed"] == args.items, result
+        span = result["rescheduled_to"] - result["rescheduled_from"]
+        print(
+            f"   bulk replay                    {args.items / elapsed:8.0f} items/s"
+            f"  ({elapsed:6.1f}s for {args.items})"
+        )
+        print(f"   calls spread over              {span.total_seconds():8.0f} s at {args.rate}/s")
+
+        pending = db.execute(
+            select(func.count()).select_from(DeadLetter).where(DeadLetter.replayed_at.is_(None))
+        ).scalar_one()
+        signals = db.execute(select(func.count()).select_from(SchedulerSignal)).scalar_one()
+        print(f"   dead letters still pending     {pending:8d}")
+        print(f"   scheduler signals written      {signals:8d}")
+
+
+if __name__ == "__main__":
+    main()
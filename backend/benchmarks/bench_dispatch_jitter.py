@@ -0,0 +1,163 @@
+"""Dispatch precision and CPU cost: timing wheel vs APScheduler polling.
+
+1. Simulated hour: --reminders entries due uniformly over the next hour are inserted into
+   a TimingWheel, then the wheel is advanced tick by tick over the full hour with a fake
+   clock. Reports insert/cancel cost and CPU per simulated hour.
+2. Real time: --live entries due over the next --seconds are fired by (a) a wheel ticked by
+   a thread, as ReminderScheduler does, and (b) an APScheduler BackgroundScheduler with a
+   job per entry. Reports lateness percentiles and process CPU.
+
+Usage: python -m benchmarks.bench_dispatch_jitter [--reminders 100000] [--live 5000]
+"""
+import argparse
+import random
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+from benchmarks.common import percentiles
+
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.date import DateTrigger
+
+from app.services.timing_wheel import TimingWheel
+
+
+def simulated_hour(reminders, tick):
+    start = 1_000_000.0
+    wheel = TimingWheel(tick=tick, start=start)
+    keys = [str(uuid.uuid4()) for _ in range(reminders)]
+    deadlines = [start + random.uniform(0, 3600) for _ in keys]
+
+    started = time.perf_counter()
+    for key, deadline in zip(keys, deadlines):
+        wheel.insert(key, deadline)
+    insert_us = (time.perf_counter() - started) / reminders * 1e6
+
+    cancelled = keys[: reminders // 10]
+    started = time.perf_counter()
+    for key in cancelled:
+        wheel.cancel(key)
+    cancel_us = (time.perf_counter() - started) / max(len(cancelled), 1) * 1e6
+
+    fired = 0
+    cpu = time.process_time()
+    now = start
+    while now < start + 3601:
+        now += tick
+        fired += len(wheel.advance(now))
+    cpu = time.process_time() - cpu
+
+    print(f"wheel, {reminders} reminders over 1 simulated hour (tick {tick}s)")
+    print(f"   insert {insert_us:.2f} us   cancel {cancel_us:.2f} us")
+    print(f"   fired {fired}   CPU for the hour {cpu:.2f}s ({cpu / 3600 * 100:.3f}% of a core)")
+
+
+def live_wheel(count, seconds, tick):
+    wheel = TimingWheel(tick=tick, start=time.time())
+    lock = threading.Lock()
+    lateness = []
+    stop = threading.Event()
+
+    now = time.time()
+    for i in range(count):
+        due = now + 1 + random.uniform(0, seconds)
+        wheel.insert(i, due, due)
+
+    def run():
+        while not stop.wait(tick - time.time() % tick):
+            with lock:
+                due = wheel.advance(time.time())
+            fired_at = time.time()
+            for _, deadline in due:
+                lateness.append(fired_at - deadline)
+
+    cpu = time.process_time()
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    while len(lateness) < count:
+        time.sleep(0.1)
+    stop.set()
+    thread.join()
+    return lateness, time.process_time() - cpu
+
+
+_aps_lateness = []
+_aps_lock = threading.Lock()
+_aps_done = threading.Event()
+
+
+def _aps_fire(deadline, count):
+    # Module-level so the SQLAlchemy job store can pickle a reference to it
+    with _aps_lock:
+        _aps_lateness.append(time.time() - deadline)
+        if len(_aps_lateness) >= count:
+            _aps_done.set()
+
+
+def live_apscheduler(count, seconds, store):
+    jobstore = (
+        SQLAlchemyJobStore(url=f"sqlite:///{tempfile.mkdtemp()}/jobs.db")
+        if store == "sqlalchemy"
+        else MemoryJobStore()
+    )
+
+    scheduler = BackgroundScheduler(
+        jobstores={"default": jobstore},
+        executors={"default": ThreadPoolExecutor(10)},
+        job_defaults={"misfire_grace_time": None},
+        timezone="UTC",
+    )
+    scheduler.start()
+
+    now = time.time()
+    for _ in range(count):
+        due = now + 1 + random.uniform(0, seconds)
+        scheduler.add_job(
+            _aps_fire,
+            trigger=DateTrigger(run_date=datetime.fromtimestamp(due, tz=timezone.utc)),
+            args=[due, count],
+        )
+
+    cpu = time.process_time()
+    _aps_done.wait(timeout=seconds + 120)
+    cpu = time.process_time() - cpu
+    scheduler.shutdown(wait=False)
+    return list(_aps_lateness), cpu
+
+
+def report(name, lateness, cpu):
+    ms = {key: value * 1000 for key, value in percentiles(lateness).items()}
+    print(
+        f"   {name:24s} fired {len(lateness):6d}  lateness p50 {ms['p50']:7.1f} ms  "
+        f"p95 {ms['p95']:7.1f} ms  p99 {ms['p99']:7.1f} ms  max {max(lateness) * 1000:7.1f} ms  "
+        f"CPU {cpu:.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reminders", type=int, default=100_000)
+    parser.add_argument("--live", type=int, default=5_000)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--tick", type=float, default=0.05)
+    parser.add_argument("--apscheduler-store", choices=["memory", "sqlalchemy"], default="memory")
+    args = parser.parse_args()
+
+    simulated_hour(args.reminders, args.tick)
+
+    print(f"real time, {args.live} reminders due over {args.seconds:.0f}s")
+    report("timing wheel", *live_wheel(args.live, args.seconds, args.tick))
+    report(
+        f"apscheduler ({args.apscheduler_store})",
+        *live_apscheduler(args.live, args.seconds, args.apscheduler_store),
+    )
+
+
+if __name__ == "__main__":
+    main()
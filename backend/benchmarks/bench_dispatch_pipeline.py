@@ -0,0 +1,105 @@
+"""Dispatch throughput per database connection.
+
+Seeds --reminders due reminders and runs execute_reminder for all of them from --threads
+dispatch threads against an engine limited to --connections connections, with the Vapi
+call replaced by a stub that answers after --call-ms. Runs twice: with every dispatch
+committing its own status write ("inline") and with the batching StatusWriter running
+("batched"). Reports dispatches/s, per connection, and statements/commits per dispatch.
+
+Usage: python -m benchmarks.bench_dispatch_pipeline [--reminders 5000] [--threads 10]
+       [--connections 2] [--database-url postgresql://...]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from benchmarks.common import make_engine, seed_reminders
+
+from sqlalchemy import create_engine, event
+
+from app.models import ReminderStatus
+
+
+def run(label, reminder_ids, threads, connections, engine, writer=None):
+    from app.services import scheduler_service
+
+    counts = {"statements": 0, "commits": 0}
+
+    def on_statement(*_):
+        counts["statements"] += 1
+
+    def on_commit(*_):
+        counts["commits"] += 1
+
+    event.listen(engine, "before_cursor_execute", on_statement)
+    event.listen(engine, "commit", on_commit)
+    if writer:
+        writer.start()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(scheduler_service.execute_reminder, map(str, reminder_ids)))
+    if writer:
+        writer.stop()
+    elapsed = time.perf_counter() - started
+
+    event.remove(engine, "before_cursor_execute", on_statement)
+    event.remove(engine, "commit", on_commit)
+
+    rate = len(reminder_ids) / elapsed
+    print(
+        f"   {label:8s} {rate:8.0f} dispatches/s  {rate / connections:8.0f} per connection  "
+        f"{counts['statements'] / len(reminder_ids):5.2f} statements and "
+        f"{counts['commits'] / len(reminder_ids):5.2f} commits per dispatch"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reminders", type=int, default=5_000)
+    parser.add_argument("--threads", type=int, default=10)
+    parser.add_argument("--connections", type=int, default=2)
+    parser.add_argument("--call-ms", type=float, default=5.0)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/bench_dispatch.db"
+    os.environ["DATABASE_URL"] = database_url
+
+    from app.db.database import SessionLocal
+    from app.services import scheduler_service
+    from app.services.status_writer import get_status_writer
+
+    async def trigger_call(reminder, call_attempt_id):
+        await asyncio.sleep(args.call_ms / 1000)
+        return True, f"vapi-{call_attempt_id}", None
+
+    scheduler_service.vapi_service.trigger_call = trigger_call
+
+    seed_engine, _ = make_engine(database_url)
+    engine = create_engine(
+        database_url, pool_size=args.connections, max_overflow=0, pool_timeout=60
+    )
+    SessionLocal.configure(bind=engine)
+
+    print(
+        f"{args.reminders} dispatches, {args.threads} threads, {args.connections} connections, "
+        f"{args.call_ms:.0f} ms Vapi latency ({engine.dialect.name})"
+    )
+    for label, writer in (("inline", None), ("batched", get_status_writer())):
+        ids = seed_reminders(
+            seed_engine,
+            args.reminders,
+            statuses=(ReminderStatus.SCHEDULED,),
+            weights=(1,),
+            start=datetime.now(timezone.utc),
+        )
+        run(label, ids, args.threads, args.connections, engine, writer)
+
+
+if __name__ == "__main__":
+    main()
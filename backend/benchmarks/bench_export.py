@@ -0,0 +1,75 @@
+"""Memory while streaming GET /api/reminders/export.
+
+Seeds --rows reminders (finished ones with a call attempt each), then drains
+ExportService.stream() the way StreamingResponse does and samples resident memory every
+10% of the output. With --materialize, also loads the same join with .all() first for
+comparison with what an unstreamed export would hold.
+
+Usage: python -m benchmarks.bench_export [--rows 1000000] [--format ndjson]
+       [--database-url postgresql://...]   (an empty database; tables are recreated)
+"""
+import argparse
+import os
+import resource
+import time
+
+from benchmarks.common import make_engine, seed_reminders
+
+from app.services.export_service import ExportService
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        # Peak rather than current outside Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="ndjson")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--materialize", action="store_true")
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    engine, Session = make_engine(args.database_url, "bench_export")
+    started = time.perf_counter()
+    seed_reminders(engine, args.rows, with_attempts=True)
+    print(f"seeded {args.rows} reminders in {time.perf_counter() - started:.1f}s")
+
+    if args.materialize:
+        baseline = rss_mb()
+        with Session() as db:
+            rows = db.execute(ExportService._query(None, None, True)).all()
+            print(f"materialized join: {len(rows)} rows, +{rss_mb() - baseline:.0f} MB RSS")
+            del rows
+
+    baseline = rss_mb()
+    print(f"streaming {args.format}, RSS before {baseline:.0f} MB")
+
+    written = 0
+    lines = 0
+    next_sample = args.rows // 10
+    started = time.perf_counter()
+    for chunk in ExportService.stream(
+        args.format, session_factory=Session, batch_size=args.batch_size
+    ):
+        written += len(chunk)
+        lines += chunk.count("\n")
+        if lines >= next_sample:
+            print(f"   {lines:9d} lines  {written / 1e6:8.1f} MB out  RSS {rss_mb():6.0f} MB")
+            next_sample += args.rows // 10
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"exported {lines} lines ({written / 1e6:.0f} MB) in {elapsed:.1f}s, "
+        f"{lines / elapsed:.0f} lines/s; RSS after {rss_mb():.0f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
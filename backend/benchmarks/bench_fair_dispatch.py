@@ -0,0 +1,94 @@
+"""Dispatch lateness of small users while one user floods the dispatcher.
+
+One "big" user has --flood reminders all due at once; --small-users others each have
+--per-small reminders due spread over the following --spread seconds. Each dispatch holds
+a worker for --call-ms (the Vapi call). Reports how late small users' reminders start
+with a plain FIFO thread pool (the previous dispatcher), the fair dispatcher, and the fair
+dispatcher with a per-user cap.
+
+Usage: python -m benchmarks.bench_fair_dispatch [--flood 5000] [--workers 10]
+       [--call-ms 50] [--small-users 20] [--per-small 10] [--spread 10]
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import percentiles
+
+from app.services.fair_dispatch import FairDispatcher
+
+
+class Fifo:
+    def __init__(self, workers):
+        self.pool = ThreadPoolExecutor(workers)
+
+    def submit(self, user, fn, *args):
+        return self.pool.submit(fn, *args)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True)
+
+
+def run(dispatcher, schedule, call_seconds):
+    lateness = {"big": [], "small": []}
+    lock = threading.Lock()
+
+    def call(kind, due):
+        started = time.perf_counter()
+        with lock:
+            lateness[kind].append(started - due)
+        time.sleep(call_seconds)
+
+    origin = time.perf_counter()
+    for offset, user in schedule:
+        due = origin + offset
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        dispatcher.submit(user, call, "big" if user == "big" else "small", due)
+    dispatcher.shutdown()
+    return lateness
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--flood", type=int, default=5_000)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--call-ms", type=float, default=50.0)
+    parser.add_argument("--small-users", type=int, default=20)
+    parser.add_argument("--per-small", type=int, default=10)
+    parser.add_argument("--spread", type=float, default=10.0)
+    args = parser.parse_args()
+
+    schedule = [(0.0, "big")] * args.flood
+    total_small = args.small_users * args.per_small
+    for i in range(total_small):
+        schedule.append((args.spread * i / total_small, f"user{i % args.small_users}"))
+    schedule.sort(key=lambda item: item[0])
+
+    print(
+        f"{args.flood} reminders from one user at t=0, {total_small} from "
+        f"{args.small_users} users over {args.spread:.0f}s; {args.workers} workers, "
+        f"{args.call_ms:.0f} ms per call"
+    )
+    variants = {
+        "fifo": lambda: Fifo(args.workers),
+        "fair": lambda: FairDispatcher(args.workers),
+        "fair, cap 5": lambda: FairDispatcher(args.workers, max_per_tenant=5),
+    }
+    for label, build in variants.items():
+        dispatcher = build()
+        if isinstance(dispatcher, FairDispatcher):
+            dispatcher.start()
+        lateness = run(dispatcher, schedule, args.call_ms / 1000)
+        small = percentiles(lateness["small"])
+        big = percentiles(lateness["big"])
+        print(
+            f"   {label:12s} small users p50 {small['p50'] * 1000:8.1f} ms  "
+            f"p99 {small['p99'] * 1000:8.1f} ms   big user p99 {big['p99']:6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
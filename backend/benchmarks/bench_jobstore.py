@@ -0,0 +1,142 @@
+"""Reminder job store vs APScheduler's pickling SQLAlchemyJobStore at --jobs promotions.
+
+Both stores are loaded with the same jobs (promotions spread over a year, --due of them
+already due), each on its own SQLite file, then timed on what the scheduler does with
+them: add and remove single jobs, the due lookup its loop runs on every wakeup (which
+rebuilds each due job; the pickled store unpickles them), and the next wakeup time.
+
+Usage: python -m benchmarks.bench_jobstore [--jobs 1000000] [--due 1000] [--ops 500]
+"""
+import argparse
+import os
+import pickle
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import timed
+
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.util import datetime_to_utc_timestamp
+from sqlalchemy import create_engine
+
+from app.services.reminder_jobstore import BULK_CHUNK_SIZE, ReminderJobStore
+from app.services.scheduler_service import promote_reminder
+
+
+def schedule(jobs, due, now):
+    """(reminder_id, promote_at) pairs, the first `due` of them in the past"""
+    horizon = timedelta(days=365).total_seconds()
+    for i in range(jobs):
+        offset = -1 - i if i < due else horizon * i / jobs
+        yield uuid.uuid4(), now + timedelta(seconds=offset)
+
+
+def pickled_state(reminder_id, promote_at):
+    # What SQLAlchemyJobStore.add_job stores for a promotion job
+    return {
+        "version": 1,
+        "id": f"reminder_{reminder_id}",
+        "func": "app.services.scheduler_service:promote_reminder",
+        "trigger": DateTrigger(run_date=promote_at),
+        "executor": "default",
+        "args": (str(reminder_id),),
+        "kwargs": {},
+        "name": f"Reminder {reminder_id}",
+        "misfire_grace_time": None,
+        "coalesce": False,
+        "max_instances": 3,
+        "next_run_time": promote_at,
+    }
+
+
+def load_pickled(store, pairs):
+    rows = []
+    with store.engine.begin() as connection:
+        for reminder_id, promote_at in pairs:
+            rows.append(
+                {
+                    "id": f"reminder_{reminder_id}",
+                    "next_run_time": datetime_to_utc_timestamp(promote_at),
+                    "job_state": pickle.dumps(
+                        pickled_state(reminder_id, promote_at), store.pickle_protocol
+                    ),
+                }
+            )
+            if len(rows) == BULK_CHUNK_SIZE:
+                connection.execute(store.jobs_t.insert(), rows)
+                rows = []
+        if rows:
+            connection.execute(store.jobs_t.insert(), rows)
+
+
+def single_ops(scheduler, ops, now):
+    """Mean ms to add, then remove, one job through the scheduler"""
+    ids = [uuid.uuid4() for _ in range(ops)]
+    started = time.perf_counter()
+    for i, reminder_id in enumerate(ids):
+        scheduler.add_job(
+            promote_reminder,
+            trigger=DateTrigger(run_date=now + timedelta(days=400, seconds=i)),
+            args=[str(reminder_id)],
+            id=f"reminder_{reminder_id}",
+            misfire_grace_time=None,
+        )
+    added = time.perf_counter() - started
+    started = time.perf_counter()
+    for reminder_id in ids:
+        scheduler.remove_job(f"reminder_{reminder_id}")
+    removed = time.perf_counter() - started
+    return added / ops * 1000, removed / ops * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--due", type=int, default=1000)
+    parser.add_argument("--ops", type=int, default=500)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    directory = tempfile.mkdtemp()
+    stores = {
+        "pickled": SQLAlchemyJobStore(url=f"sqlite:///{directory}/pickled.db"),
+        "reminder": ReminderJobStore(create_engine(f"sqlite:///{directory}/reminder.db")),
+    }
+    loaders = {
+        "pickled": load_pickled,
+        "reminder": lambda store, pairs: store.add_reminders(pairs),
+    }
+
+    print(f"{args.jobs:,} jobs, {args.due:,} due, {args.ops} single adds/removes")
+    print(
+        f"{'store':<9} {'load s':>8} {'size MiB':>9} {'add ms':>8} {'remove ms':>10} "
+        f"{'due ms':>8} {'next ms':>8}"
+    )
+    for name, store in stores.items():
+        scheduler = BackgroundScheduler(jobstores={"default": store}, timezone="UTC")
+        scheduler.start(paused=True)
+
+        started = time.perf_counter()
+        loaders[name](store, schedule(args.jobs, args.due, now))
+        load = time.perf_counter() - started
+        size = os.path.getsize(store.engine.url.database) / 2**20
+
+        add_ms, remove_ms = single_ops(scheduler, args.ops, now)
+        assert len(store.get_due_jobs(now)) == args.due
+        due_ms = timed(lambda: store.get_due_jobs(now))
+        next_ms = timed(lambda: store.get_next_run_time(), repeat=50)
+        print(
+            f"{name:<9} {load:8.1f} {size:9.1f} {add_ms:8.3f} {remove_ms:10.3f} "
+            f"{due_ms:8.2f} {next_ms:8.3f}"
+        )
+        # Otherwise the scheduler's loop runs the due jobs on its way out
+        store.remove_all_jobs()
+        scheduler.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""GET /api/reminders pages: ORM instances vs Core rows of the list columns.
+
+Usage: python -m benchmarks.bench_list_reminders [--rows 50000] [--per-page 100]
+       [--pages 200] [--database-url sqlite:///bench.db]
+
+Requests random pages through a TestClient from two routes: "orm" is list_reminders as it
+was, loading Reminder instances with an ORM query and returning a model for FastAPI to
+check against response_model; "core" is the current endpoint, which selects
+LIST_ITEM_COLUMNS with get_reminder_items and serializes the page itself. Memory is the
+tracemalloc peak during one request.
+"""
+import argparse
+import math
+import random
+import time
+import tracemalloc
+
+from benchmarks.common import make_engine, percentiles, seed_reminders
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal, get_read_db
+from app.models import Reminder
+from app.routers import reminders
+from app.schemas.reminder import ReminderListItem, ReminderListResponse
+
+
+def orm_list_reminders(page: int = 1, per_page: int = 20, db: Session = Depends(get_read_db)):
+    query = db.query(Reminder)
+    total = query.count()
+    found = query.order_by(Reminder.scheduled_for).offset((page - 1) * per_page).limit(per_page)
+    items = []
+    for reminder in found:
+        reminder_dict = ReminderListItem.model_validate(reminder).model_dump()
+        reminder_dict["call_attempts_count"] = reminder.attempt_count
+        items.append(ReminderListItem(**reminder_dict))
+    total_pages = math.ceil(total / per_page) if total > 0 else 0
+    return ReminderListResponse(
+        reminders=items, total=total, page=page, per_page=per_page, total_pages=total_pages
+    )
+
+
+def run(client, path, pages, per_page):
+    samples = []
+    for page in pages:
+        started = time.perf_counter()
+        response = client.get(path, params={"page": page, "per_page": per_page})
+        samples.append(time.perf_counter() - started)
+        assert response.status_code == 200
+
+    peaks = []
+    for page in pages[:20]:
+        tracemalloc.start()
+        client.get(path, params={"page": page, "per_page": per_page})
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return samples, max(peaks)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    engine, Session = make_engine(args.database_url, "bench_list_reminders")
+    seed_reminders(engine, args.rows, with_attempts=True)
+    SessionLocal.configure(bind=engine)
+
+    app = FastAPI()
+    app.include_router(reminders.router, prefix="/core")
+    app.get("/orm/", response_model=ReminderListResponse)(orm_list_reminders)
+    client = TestClient(app)
+
+    random.seed(7)
+    pages = [random.randint(1, args.rows // args.per_page) for _ in range(args.pages)]
+    assert client.get("/orm/").json() == client.get("/core/").json()
+
+    print(f"{args.rows} reminders, {args.per_page} per page ({engine.dialect.name})")
+    print(f"{'path':<6} {'pages/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'peak KiB':>9}")
+    for name in ("orm", "core"):
+        run(client, f"/{name}/", pages[:10], args.per_page)
+        samples, peak = run(client, f"/{name}/", pages, args.per_page)
+        points = percentiles(samples, (50, 95))
+        print(
+            f"{name:<6} {len(samples) / sum(samples):8.0f} {points['p50'] * 1000:8.2f} "
+            f"{points['p95'] * 1000:8.2f} {peak / 1024:9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
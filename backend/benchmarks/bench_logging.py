@@ -0,0 +1,113 @@
+"""Log overhead per dispatched reminder.
+
+Replays the records one reminder produces across execute_reminder, trigger_call and the
+webhook path, and measures the time spent in the *calling* thread for:
+
+  eager   - f-string messages, StreamHandler writing synchronously (previous behaviour)
+  queued  - %-style messages through ContextQueueHandler + QueueListener
+  sampled - queued, with INFO records of the hot loggers sampled at 10%
+
+Usage: python -m benchmarks.bench_logging [--dispatches 20000]
+"""
+import argparse
+import logging
+import logging.handlers
+import os
+import queue
+import time
+import uuid
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.core.logging_config import (  # noqa: E402
+    ContextQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    log_context,
+)
+
+
+def eager_dispatch(logger, reminder_id, attempt_id, call_id):
+    logger.info(f"Executing reminder {reminder_id} - 'Take your medication'")
+    logger.info(
+        f"Call attempt {attempt_id} created for reminder {reminder_id}. "
+        f"Triggering Vapi call to +15551234567"
+    )
+    logger.info(f"Triggering Vapi call for reminder {reminder_id} to +15551234567")
+    logger.info(f"Vapi call initiated successfully. Vapi Call ID: {call_id}, Reminder ID: {reminder_id}")
+    logger.info(f"Vapi call initiated successfully for reminder {reminder_id}. Vapi Call ID: {call_id}.")
+    logger.info(f"Received Vapi webhook: call.ended for call {call_id}")
+    logger.info(f"Parsed Vapi webhook event: call.ended for call {call_id}, reminder {reminder_id}")
+    logger.info(f"Processing Vapi webhook: call.ended for call {call_id}")
+    logger.info(f"Call completed for reminder {reminder_id}. Duration: 42s")
+
+
+def lazy_dispatch(logger, reminder_id, attempt_id, call_id):
+    with log_context(reminder_id=reminder_id):
+        logger.info("Executing reminder %s", reminder_id)
+        with log_context(call_attempt_id=attempt_id):
+            logger.debug("Call attempt %s created for reminder %s", attempt_id, reminder_id)
+            logger.debug("Triggering Vapi call for reminder %s", reminder_id)
+            logger.debug("Vapi accepted call %s for reminder %s", call_id, reminder_id)
+            logger.info(
+                "Vapi call %s initiated for reminder %s, awaiting webhook",
+                call_id,
+                reminder_id,
+                extra={"vapi_call_id": call_id},
+            )
+    with log_context(vapi_call_id=call_id, reminder_id=reminder_id, call_attempt_id=attempt_id):
+        logger.info("Received Vapi webhook: %s for call %s", "call.ended", call_id)
+        logger.debug("Parsed Vapi webhook event %s for call %s", "call.ended", call_id)
+        logger.debug("Processing Vapi webhook %s for call %s", "call.ended", call_id)
+        logger.info("Call completed for reminder %s. Duration: %ss", reminder_id, 42)
+
+
+def run(name, dispatch, handler, dispatches, listener=None):
+    logger = logging.getLogger(f"bench.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    ids = [(str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())) for _ in range(dispatches)]
+
+    if listener:
+        listener.start()
+
+    started = time.perf_counter()
+    for reminder_id, attempt_id, call_id in ids:
+        dispatch(logger, reminder_id, attempt_id, call_id)
+    caller_elapsed = time.perf_counter() - started
+
+    if listener:
+        listener.stop()
+    total_elapsed = time.perf_counter() - started
+
+    logger.removeHandler(handler)
+    print(
+        f"{name:8s} caller {caller_elapsed / dispatches * 1e6:8.2f} us/dispatch   "
+        f"incl. drain {total_elapsed / dispatches * 1e6:8.2f} us/dispatch"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dispatches", type=int, default=20000)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull:
+        eager = logging.StreamHandler(devnull)
+        eager.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+        run("eager", eager_dispatch, eager, args.dispatches)
+
+        for name, rates in (("queued", {}), ("sampled", {"bench": 0.1})):
+            log_queue = queue.Queue(-1)
+            handler = ContextQueueHandler(log_queue)
+            handler.addFilter(SamplingFilter(rates))
+            writer = logging.StreamHandler(devnull)
+            writer.setFormatter(JsonFormatter())
+            listener = logging.handlers.QueueListener(log_queue, writer)
+            run(name, lazy_dispatch, handler, args.dispatches, listener)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Reconciliation throughput for calls whose final webhook was lost.
+
+Seeds --stale reminders whose only call attempt is stuck RINGING, among --healthy ones that
+finished normally, and reconciles them against a stub Vapi that answers each lookup after
+--lookup-ms. Reports reconciled calls/s for each concurrency level (1 is the sequential
+baseline), plus the time spent finding the stale attempts with and without the
+(status, initiated_at) index.
+
+Usage: python -m benchmarks.bench_reconciliation [--stale 2000] [--healthy 200000]
+       [--lookup-ms 50] [--concurrency 1,5,20,50]
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import make_engine, seed_reminders, timed
+
+from sqlalchemy import insert, text, update
+
+from app.models import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus
+from app.services.reconciliation_service import ReconciliationService
+from app.services.vapi_service import vapi_service
+
+
+def seed(engine, stale, healthy, started):
+    seed_reminders(engine, healthy, with_attempts=True, start=started - timedelta(days=30))
+    ids = seed_reminders(
+        engine, stale, statuses=(ReminderStatus.SCHEDULED,), weights=(1,), start=started
+    )
+    with engine.begin() as connection:
+        connection.execute(
+            insert(CallAttempt),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "reminder_id": reminder_id,
+                    "attempt_number": 1,
+                    "status": CallAttemptStatus.RINGING,
+                    "vapi_call_id": f"stale-{reminder_id}",
+                    "initiated_at": started,
+                }
+                for reminder_id in ids
+            ],
+        )
+        connection.execute(
+            update(Reminder)
+            .where(Reminder.id.in_(ids))
+            .values(attempt_count=1, last_attempt_status=CallAttemptStatus.RINGING)
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stale", type=int, default=2_000)
+    parser.add_argument("--healthy", type=int, default=200_000)
+    parser.add_argument("--lookup-ms", type=float, default=50.0)
+    parser.add_argument("--concurrency", default="1,5,20,50")
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    async def get_call_status(vapi_call_id, client=None):
+        await asyncio.sleep(args.lookup_ms / 1000 * random.uniform(0.5, 1.5))
+        return {
+            "id": vapi_call_id,
+            "status": "ended",
+            "endedReason": "customer-ended-call",
+            "duration": 30,
+            "cost": 0.05,
+        }
+
+    vapi_service.get_call_status = get_call_status
+    started = datetime.now(timezone.utc) - timedelta(hours=1)
+    later = datetime.now(timezone.utc)
+
+    print(
+        f"{args.stale} stale of {args.stale + args.healthy} reminders, "
+        f"{args.lookup_ms:.0f} ms per Vapi lookup"
+    )
+    for concurrency in (int(value) for value in args.concurrency.split(",")):
+        engine, Session = make_engine(args.database_url, name="bench_reconcile")
+        seed(engine, args.stale, args.healthy, started)
+
+        begin = time.perf_counter()
+        totals = ReconciliationService.reconcile_stale_attempts(
+            now=later, session_factory=Session, concurrency=concurrency, rate=0
+        )
+        elapsed = time.perf_counter() - begin
+        print(
+            f"   concurrency {concurrency:3d}  {totals['resolved'] / elapsed:8.0f} calls/s  "
+            f"({elapsed:6.2f} s for {totals['resolved']})"
+        )
+
+    seed(engine, args.stale, 0, started)
+    db = Session()
+    cutoff = later - timedelta(minutes=15)
+    find = lambda: ReconciliationService.find_stale_attempts(  # noqa: E731
+        db, cutoff, started - timedelta(days=1), 500
+    )
+    with_index = timed(find)
+    db.execute(text("DROP INDEX idx_call_attempts_status_initiated"))
+    without_index = timed(find)
+    print(f"   find stale batch: {with_index:8.2f} ms indexed, {without_index:8.2f} ms full scan")
+
+
+if __name__ == "__main__":
+    main()
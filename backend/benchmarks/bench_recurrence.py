@@ -0,0 +1,129 @@
+"""Recurring series vs the equivalent one-off reminders.
+
+--series customers each want a daily call for a year. Stored as one-off reminders that is
+series * 365 rows and APScheduler jobs; as recurring reminders only the next occurrence of
+each series exists. Reports reminder rows, database and job store size, and the time to
+(re)schedule everything into an SQLAlchemy job store, as reschedule_all_pending does on
+startup. Then measures what lazy expansion costs per completed occurrence.
+
+Usage: python -m benchmarks.bench_recurrence [--series 100] [--days 365]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import make_engine, seed_reminders
+
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.date import DateTrigger
+
+from app.models import Reminder, ReminderStatus
+from app.services.recurrence import RecurrenceService
+from app.services.scheduler_service import promote_reminder
+
+
+def db_size(engine):
+    path = engine.url.database
+    return os.path.getsize(path) if path and os.path.exists(path) else 0
+
+
+def schedule_all(session_factory):
+    """Job per scheduled reminder in a fresh SQLAlchemy job store; returns (jobs, s, bytes)."""
+    path = f"{tempfile.mkdtemp()}/jobs.db"
+    scheduler = BackgroundScheduler(
+        jobstores={"default": SQLAlchemyJobStore(url=f"sqlite:///{path}")}, timezone="UTC"
+    )
+    scheduler.start(paused=True)
+
+    started = time.perf_counter()
+    with session_factory() as db:
+        rows = db.query(Reminder.id, Reminder.scheduled_for).filter(
+            Reminder.status == ReminderStatus.SCHEDULED
+        )
+        for reminder_id, scheduled_for in rows:
+            scheduler.add_job(
+                promote_reminder,
+                trigger=DateTrigger(run_date=scheduled_for.replace(tzinfo=timezone.utc)),
+                args=[str(reminder_id)],
+                id=f"promote_{reminder_id}",
+                replace_existing=True,
+            )
+    elapsed = time.perf_counter() - started
+
+    jobs = len(scheduler.get_jobs())
+    scheduler.shutdown(wait=False)
+    return jobs, elapsed, os.path.getsize(path)
+
+
+def report(name, engine, session_factory):
+    with session_factory() as db:
+        rows = db.query(Reminder).count()
+    jobs, elapsed, store_bytes = schedule_all(session_factory)
+    print(
+        f"   {name:10s} rows {rows:8d}  db {db_size(engine) / 1e6:7.2f} MB  jobs {jobs:8d}  "
+        f"job store {store_bytes / 1e6:7.2f} MB  schedule {elapsed:6.2f}s"
+    )
+
+
+def expansion_cost(session_factory, completions):
+    with session_factory() as db:
+        series = (
+            db.query(Reminder)
+            .filter(Reminder.status == ReminderStatus.SCHEDULED)
+            .limit(completions)
+            .all()
+        )
+
+        started = time.perf_counter()
+        for reminder in series:
+            reminder.status = ReminderStatus.COMPLETED
+            RecurrenceService.materialize_next(db, reminder)
+            db.commit()
+        elapsed = time.perf_counter() - started
+
+    print(
+        f"   lazy expansion: {elapsed / len(series) * 1000:.2f} ms per completed occurrence "
+        f"(next occurrence computed, inserted and committed; {len(series)} samples)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--series", type=int, default=100)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--completions", type=int, default=100)
+    args = parser.parse_args()
+
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(hours=1)
+    print(f"{args.series} daily series over {args.days} days")
+
+    engine, session_factory = make_engine(name="one_off")
+    for offset in range(args.series):
+        seed_reminders(
+            engine,
+            args.days,
+            statuses=(ReminderStatus.SCHEDULED,),
+            weights=(1,),
+            start=start + timedelta(seconds=offset),
+            spacing=timedelta(days=1),
+        )
+    report("one-off", engine, session_factory)
+
+    engine, session_factory = make_engine(name="recurring")
+    seed_reminders(
+        engine,
+        args.series,
+        statuses=(ReminderStatus.SCHEDULED,),
+        weights=(1,),
+        start=start,
+        recurrence_rule=f"FREQ=DAILY;COUNT={args.days}",
+    )
+    report("recurring", engine, session_factory)
+    expansion_cost(session_factory, min(args.completions, args.series))
+
+
+if __name__ == "__main__":
+    main()
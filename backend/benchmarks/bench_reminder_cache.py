@@ -0,0 +1,85 @@
+"""Reminder detail reads under a polling workload: uncached vs the versioned detail cache.
+
+Usage: python -m benchmarks.bench_reminder_cache [--rows 100000] [--hot 500] [--reads 20000]
+       [--write-every 20] [--database-url sqlite:///bench.db]
+
+Clients poll the detail page of `hot` reminders (calls in progress) at random; every
+`write-every` reads one of them changes, as a webhook would. Each read uses its own
+session, like a request. "versioned" checks updated_at on every read; "trusted" is the
+REMINDER_CACHE_CHANNEL mode, where hits skip the database entirely.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timezone
+
+from benchmarks.common import make_engine, percentiles, seed_reminders
+
+from sqlalchemy import update
+
+from app.models import Reminder, ReminderStatus
+from app.services import reminder_cache, reminder_service
+from app.services.reminder_cache import ReminderCache, invalidate_reminders
+from app.services.reminder_service import ReminderService
+
+
+def run(Session, hot_ids, reads, write_every, cache):
+    reminder_cache.get_reminder_cache = reminder_service.get_reminder_cache = lambda: cache
+    random.seed(7)
+    samples = []
+    for i in range(reads):
+        if write_every and i % write_every == 0:
+            changed = random.choice(hot_ids)
+            with Session() as db:
+                db.execute(
+                    update(Reminder)
+                    .where(Reminder.id == changed)
+                    .values(updated_at=datetime.now(timezone.utc))
+                )
+                db.commit()
+            invalidate_reminders([changed])
+
+        reminder_id = random.choice(hot_ids)
+        started = time.perf_counter()
+        with Session() as db:
+            ReminderService.get_reminder_detail(db, reminder_id)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--hot", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=20_000)
+    parser.add_argument("--write-every", type=int, default=20)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    engine, Session = make_engine(args.database_url, "bench_reminder_cache")
+    ids = seed_reminders(
+        engine, args.rows, statuses=(ReminderStatus.COMPLETED,), weights=(1,), with_attempts=True
+    )
+    hot_ids = random.sample(ids, args.hot)
+
+    trusted = ReminderCache(maxsize=10_000, ttl=30)
+    trusted._trusted = True
+    modes = {
+        "uncached": ReminderCache(maxsize=0, ttl=30),
+        "versioned": ReminderCache(maxsize=10_000, ttl=30),
+        "trusted": trusted,
+    }
+
+    print(f"{'mode':<10} {'reads/s':>9} {'hit rate':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, cache in modes.items():
+        samples = run(Session, hot_ids, args.reads, args.write_every, cache)
+        points = percentiles(samples)
+        hit_rate = cache.stats()["hit_rate"] or 0.0
+        print(
+            f"{name:<10} {len(samples) / sum(samples):9.0f} {hit_rate:9.1%} "
+            f"{points['p50'] * 1000:8.3f} {points['p95'] * 1000:8.3f} {points['p99'] * 1000:8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Hot-path query latency before and after archiving historical reminders.
+
+Seeds --history finished reminders (with one call attempt each) plus --hot scheduled ones,
+times the queries the scheduler and list endpoint run, archives everything older than
+the cutoff and times them again.
+
+Usage: python -m benchmarks.bench_retention [--history 10000000] [--hot 10000]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import make_engine, seed_reminders, timed
+
+from sqlalchemy import func, select
+
+from app.models import ArchivedReminder, Reminder, ReminderStatus
+from app.services.retention_service import RetentionService
+
+
+def hot_queries(db):
+    now = datetime.now(timezone.utc)
+    return {
+        "due lookup": lambda: db.execute(
+            select(Reminder.id).where(
+                Reminder.status == ReminderStatus.SCHEDULED,
+                Reminder.scheduled_for <= now + timedelta(minutes=5),
+            )
+        ).all(),
+        "list page (all)": lambda: db.execute(
+            select(Reminder).order_by(Reminder.scheduled_for.desc()).limit(20)
+        ).all(),
+        "list count (all)": lambda: db.execute(select(func.count()).select_from(Reminder)).scalar(),
+        "detail by id": lambda: db.get(Reminder, db.execute(select(Reminder.id).limit(1)).scalar()),
+    }
+
+
+def report(label, db, repeat):
+    print(f"-- {label}")
+    for name, query in hot_queries(db).items():
+        print(f"   {name:18s} {timed(query, repeat):10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--history", type=int, default=1_000_000)
+    parser.add_argument("--hot", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    engine, Session = make_engine(args.database_url, "bench_retention")
+
+    started = time.perf_counter()
+    seed_reminders(
+        engine,
+        args.history,
+        statuses=(ReminderStatus.COMPLETED, ReminderStatus.FAILED),
+        weights=(8, 2),
+        start=datetime.now(timezone.utc) - timedelta(days=400),
+        spacing=timedelta(days=300) / max(args.history, 1),
+        with_attempts=True,
+    )
+    seed_reminders(
+        engine,
+        args.hot,
+        statuses=(ReminderStatus.SCHEDULED,),
+        weights=(1,),
+        start=datetime.now(timezone.utc) + timedelta(minutes=1),
+    )
+    print(f"seeded {args.history} historical + {args.hot} hot reminders in "
+          f"{time.perf_counter() - started:.1f}s")
+
+    db = Session()
+    report("before archiving", db, args.repeat)
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=90)
+    started = time.perf_counter()
+    archived = 0
+    while True:
+        moved = RetentionService.archive_batch(db, cutoff, args.batch_size)
+        archived += moved
+        if moved < args.batch_size:
+            break
+    elapsed = time.perf_counter() - started
+    print(f"archived {archived} reminders in {elapsed:.1f}s ({archived / elapsed:.0f}/s)")
+
+    report("after archiving", db, args.repeat)
+    print(f"   archived rows readable: {db.query(ArchivedReminder).count()}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
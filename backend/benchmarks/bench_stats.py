@@ -0,0 +1,53 @@
+"""Per-status counts: live COUNT(*) vs the reminder_stats summary table.
+
+Usage: python -m benchmarks.bench_stats [--rows 1000000] [--database-url sqlite:///bench.db]
+
+Without --database-url a temporary SQLite file is used. Point it at an empty Postgres
+database to reproduce production-like numbers.
+"""
+import argparse
+import time
+
+from benchmarks.common import make_engine, seed_reminders, timed
+
+from sqlalchemy import func, select
+
+from app.models import Reminder, ReminderStatus
+from app.services.stats_service import StatsService
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    engine, Session = make_engine(args.database_url, "bench_stats")
+
+    started = time.perf_counter()
+    seed_reminders(engine, args.rows)
+    print(f"seeded {args.rows} reminders in {time.perf_counter() - started:.1f}s")
+
+    db = Session()
+    StatsService.check_consistency(db, repair=True)
+
+    def live_tab_counts():
+        # What the UI tabs cost today: one filtered count per status
+        for status in ReminderStatus:
+            db.execute(select(func.count()).where(Reminder.status == status)).scalar_one()
+
+    def live_group_by():
+        db.execute(select(Reminder.status, func.count()).group_by(Reminder.status)).all()
+
+    def summary():
+        StatsService.get_stats(db)
+
+    print(f"live COUNT(*) per status   {timed(live_tab_counts, args.repeat):10.2f} ms")
+    print(f"live GROUP BY status       {timed(live_group_by, args.repeat):10.2f} ms")
+    print(f"reminder_stats summary     {timed(summary, args.repeat):10.2f} ms")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
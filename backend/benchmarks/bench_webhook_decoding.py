@@ -0,0 +1,144 @@
+"""Webhook decoding: json.loads into dicts (the old path) vs the typed decoder.
+
+Usage: python -m benchmarks.bench_webhook_decoding [--events 2000] [--messages 300]
+
+Bodies are realistic Vapi payloads: a small status update and an end-of-call report
+carrying the transcript, the message list and analysis we never read. Reports CPU time
+per event and the Python heap the decode peaks at and keeps alive with its result
+(tracemalloc; the typed decoder's parser buffers live outside the Python heap and are
+freed before it returns).
+"""
+import argparse
+import json
+import os
+import time
+import tracemalloc
+import uuid
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.services.vapi_service import vapi_service  # noqa: E402
+
+
+def _metadata():
+    return {"reminder_id": str(uuid.uuid4()), "call_attempt_id": str(uuid.uuid4())}
+
+
+def status_update_body():
+    return json.dumps(
+        {
+            "type": "call.started",
+            "call": {
+                "id": str(uuid.uuid4()),
+                "orgId": str(uuid.uuid4()),
+                "status": "in-progress",
+                "type": "outboundPhoneCall",
+                "phoneNumberId": str(uuid.uuid4()),
+                "customer": {"number": "+12025551234"},
+                "metadata": _metadata(),
+                "createdAt": "2026-10-19T12:00:00.000Z",
+            },
+        }
+    ).encode()
+
+
+def end_of_call_body(messages):
+    turns = [
+        {
+            "role": "bot" if i % 2 == 0 else "user",
+            "message": "Hi, this is your reminder to take your medication this evening. " * 3,
+            "time": 1760875200000 + i * 4000,
+            "endTime": 1760875203000 + i * 4000,
+            "secondsFromStart": i * 4.0,
+            "duration": 3000,
+        }
+        for i in range(messages)
+    ]
+    return json.dumps(
+        {
+            "type": "call.ended",
+            "call": {
+                "id": str(uuid.uuid4()),
+                "status": "ended",
+                "duration": messages * 4,
+                "endedReason": "customer-ended-call",
+                "cost": 0.37,
+                "costBreakdown": {"transport": 0.01, "stt": 0.08, "llm": 0.2, "tts": 0.08},
+                "metadata": _metadata(),
+                "messages": turns,
+                "transcript": "\n".join(f"{turn['role']}: {turn['message']}" for turn in turns),
+                "analysis": {"summary": "The user confirmed the reminder. " * 20},
+                "recordingUrl": "https://storage.vapi.ai/recordings/call.wav",
+            },
+        }
+    ).encode()
+
+
+def dict_decode(body):
+    """The previous path: request.json() plus the dict copy that kept raw_data"""
+    event_data = json.loads(body)
+    call_data = event_data.get("call", {})
+    metadata = call_data.get("metadata", {})
+    return {
+        "event_type": event_data.get("type", ""),
+        "vapi_call_id": call_data.get("id"),
+        "reminder_id": metadata.get("reminder_id"),
+        "call_attempt_id": metadata.get("call_attempt_id"),
+        "status": call_data.get("status", ""),
+        "duration_seconds": call_data.get("duration"),
+        "end_reason": call_data.get("endedReason", ""),
+        "cost": call_data.get("cost"),
+        "raw_data": event_data,
+    }
+
+
+def typed_decode(body):
+    return vapi_service.parse_webhook_event(vapi_service.decode_webhook(body))
+
+
+def cpu_per_event(decode, body, events):
+    started = time.process_time()
+    for _ in range(events):
+        decode(body)
+    return (time.process_time() - started) / events
+
+
+def heap_per_event(decode, body):
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = decode(body)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak - baseline, retained - baseline
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--messages", type=int, default=300)
+    args = parser.parse_args()
+
+    bodies = {
+        "status update": status_update_body(),
+        "end of call": end_of_call_body(args.messages),
+    }
+    for body in bodies.values():
+        assert dict_decode(body).items() > typed_decode(body).items()
+
+    print(
+        f"{'payload':<14} {'size':>9} {'decoder':<6} {'cpu us':>9} {'peak KiB':>9} "
+        f"{'kept KiB':>9}"
+    )
+    for name, body in bodies.items():
+        for label, decode in (("dict", dict_decode), ("typed", typed_decode)):
+            cpu = cpu_per_event(decode, body, args.events)
+            peak, retained = heap_per_event(decode, body)
+            print(
+                f"{name:<14} {len(body) / 1024:7.1f}Ki {label:<6} {cpu * 1e6:9.1f} "
+                f"{peak / 1024:9.1f} {retained / 1024:9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
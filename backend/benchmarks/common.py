@@ -0,0 +1,152 @@
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.db.database import Base  # noqa: E402
+from app.models import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus  # noqa: E402
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_engine(database_url=None, name="bench"):
+    url = database_url or f"sqlite:///{tempfile.mkdtemp()}/{name}.db"
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    return engine, sessionmaker(bind=engine)
+
+
+def seed_reminders(
+    engine,
+    rows,
+    statuses=(ReminderStatus.SCHEDULED, ReminderStatus.COMPLETED, ReminderStatus.FAILED),
+    weights=(2, 6, 2),
+    start=None,
+    spacing=timedelta(seconds=1),
+    user_ids=(None,),
+    with_attempts=False,
+    recurrence_rule=None,
+    chunk=50_000,
+):
+    start = start or datetime.now(timezone.utc)
+    ids = []
+    with engine.begin() as connection:
+        for offset in range(0, rows, chunk):
+            batch = []
+            attempts = []
+            for i in range(offset, min(offset + chunk, rows)):
+                reminder_id = uuid.uuid4()
+                status = random.choices(statuses, weights=weights)[0]
+                when = start + spacing * i
+                batch.append(
+                    {
+                        "id": reminder_id,
+                        "user_id": random.choice(user_ids),
+                        "title": "Benchmark reminder",
+                        "message": "Benchmark reminder message",
+                        "phone_number": "+12025551234",
+                        "scheduled_for": when,
+                        "timezone": "UTC",
+                        "recurrence_rule": recurrence_rule,
+                        "series_id": reminder_id if recurrence_rule else None,
+                        "status": status,
+                        "retry_count": 0,
+                        "created_at": when,
+                        "updated_at": when,
+                    }
+                )
+                if with_attempts and status != ReminderStatus.SCHEDULED:
+                    attempts.append(
+                        {
+                            "id": uuid.uuid4(),
+                            "reminder_id": reminder_id,
+                            "attempt_number": 1,
+                            "status": CallAttemptStatus.COMPLETED
+                            if status == ReminderStatus.COMPLETED
+                            else CallAttemptStatus.FAILED,
+                            "vapi_call_id": f"call-{reminder_id}",
+                            "duration_seconds": 30,
+                            "initiated_at": when,
+                        }
+                    )
+                ids.append(reminder_id)
+            connection.execute(insert(Reminder), batch)
+            if attempts:
+                connection.execute(insert(CallAttempt), attempts)
+    return ids
+
+
+def timed(fn, repeat=5):
+    """Median wall time of fn() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def percentiles(samples, points=(50, 95, 99)):
+    if not samples:
+        return {f"p{point}": None for point in points}
+    ordered = sorted(samples)
+    return {
+        f"p{point}": ordered[min(len(ordered) - 1, int(len(ordered) * point / 100))]
+        for point in points
+    }
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn(module_args, env):
+    """Start `python <module_args>` from the backend directory."""
+    return subprocess.Popen([sys.executable, *module_args], cwd=BACKEND_DIR, env=env)
+
+
+def spawn_api(env, port, workers=1):
+    return spawn(
+        ["-m", "uvicorn", "app.main:app", "--workers", str(workers), "--port", str(port),
+         "--log-level", "warning"],
+        env,
+    )
+
+
+def wait_for_http(url, timeout=60.0, interval=0.05):
+    """Poll url until it answers 200; returns the perf_counter() time it did."""
+    import httpx
+
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(url, timeout=1).status_code == 200:
+                return time.perf_counter()
+        except httpx.HTTPError:
+            pass
+        time.sleep(interval)
+    raise TimeoutError(f"{url} did not become ready within {timeout}s")
+
+
+def terminate(processes, timeout=30):
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
@@ -0,0 +1,272 @@
+"""End-to-end pipeline benchmark against a local Vapi simulator.
+
+Starts the Vapi simulator, the API (plus `python -m app.worker` with --mode worker) against
+a fresh SQLite file or --database-url, then:
+
+  1. creates --dispatch reminders due --lead seconds from now, spread over --spread seconds
+  2. creates --creates reminders due tomorrow               -> create latency
+  3. issues --lists list requests across pages and filters  -> list latency
+  4. waits for every due reminder to be called and its webhooks processed
+                                                            -> dispatch lateness
+                                                            -> webhook-to-completion
+
+Prints a summary and writes machine-readable results (--output, JSON) for tracking
+regressions between commits.
+
+Usage: python -m benchmarks.e2e.run [--creates 500] [--dispatch 200] [--spread 30]
+       [--mode embedded|worker] [--database-url postgresql://...] [--output e2e.json]
+       [--latency-ms 150] [--error-rate 0.0] [--fail-rate 0.05]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import (
+    BACKEND_DIR,
+    free_port,
+    make_engine,
+    percentiles,
+    spawn,
+    spawn_api,
+    terminate,
+    wait_for_http,
+)
+
+import httpx
+
+TERMINAL_EVENTS = ("call.ended", "call.failed")
+
+
+def summarize(samples_seconds, errors=0):
+    points = percentiles(samples_seconds)
+    return {
+        "count": len(samples_seconds),
+        "errors": errors,
+        **{
+            f"{key}_ms": round(value * 1000, 2) if value is not None else None
+            for key, value in points.items()
+        },
+        "max_ms": round(max(samples_seconds) * 1000, 2) if samples_seconds else None,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def reminder_payload(index, scheduled_for):
+    return {
+        "title": f"E2E reminder {index}",
+        "message": "End-to-end benchmark reminder",
+        "phone_number": "+12025551234",
+        "scheduled_for": scheduled_for.isoformat(),
+        "timezone": "UTC",
+    }
+
+
+def create_many(client, payloads, concurrency):
+    """POST every payload; returns (latencies, created id -> scheduled_for, errors)."""
+
+    def create(payload):
+        started = time.perf_counter()
+        response = client.post("/api/reminders/", json=payload)
+        latency = time.perf_counter() - started
+        if response.status_code != 201:
+            return latency, None, None
+        body = response.json()
+        return latency, body["id"], datetime.fromisoformat(body["scheduled_for"])
+
+    latencies, created, errors = [], {}, 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency, reminder_id, scheduled_for in pool.map(create, payloads):
+            latencies.append(latency)
+            if reminder_id is None:
+                errors += 1
+            else:
+                created[reminder_id] = scheduled_for
+    return latencies, created, errors
+
+
+def list_many(client, count, concurrency):
+    filters = [None, "scheduled", "completed", "failed"]
+
+    def list_once(i):
+        params = {"page": random.randint(1, 5), "per_page": 20}
+        if filters[i % len(filters)]:
+            params["status"] = filters[i % len(filters)]
+        started = time.perf_counter()
+        response = client.get("/api/reminders/", params=params)
+        return time.perf_counter() - started, response.status_code == 200
+
+    latencies, errors = [], 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency, ok in pool.map(list_once, range(count)):
+            latencies.append(latency)
+            errors += not ok
+    return latencies, errors
+
+
+def wait_for_calls(simulator_url, due, timeout):
+    """Wait until every due reminder reached the simulator and its call (if accepted)
+    finished."""
+    deadline = time.time() + timeout
+    while True:
+        stats = httpx.get(f"{simulator_url}/stats", timeout=30).json()
+        dispatched = {
+            entry["reminder_id"] for entry in stats["requests_log"] if entry["reminder_id"] in due
+        }
+        calls = [call for call in stats["calls"] if call["reminder_id"] in due]
+        finished = [
+            call
+            for call in calls
+            if any(hook["type"] in TERMINAL_EVENTS for hook in call["webhooks"])
+        ]
+        if (len(dispatched) == len(due) and len(finished) == len(calls)) or time.time() > deadline:
+            return stats, calls
+        time.sleep(0.5)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--creates", type=int, default=500)
+    parser.add_argument("--lists", type=int, default=200)
+    parser.add_argument("--dispatch", type=int, default=200)
+    parser.add_argument("--lead", type=float, default=45.0)
+    parser.add_argument("--spread", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--mode", choices=["embedded", "worker"], default="embedded")
+    parser.add_argument("--workers", type=int, default=4, help="API workers in worker mode")
+    parser.add_argument("--database-url")
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.05)
+    parser.add_argument("--talk-seconds", type=float, default=1.0)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    engine, _ = make_engine(args.database_url, "e2e")
+    dialect = engine.dialect.name
+    config = {**vars(args), "database_url": engine.url.render_as_string(hide_password=True)}
+
+    api_port, simulator_port = free_port(), free_port()
+    api_url = f"http://127.0.0.1:{api_port}"
+    simulator_url = f"http://127.0.0.1:{simulator_port}"
+    env = dict(
+        os.environ,
+        DATABASE_URL=engine.url.render_as_string(hide_password=False),
+        VAPI_API_URL=simulator_url,
+        VAPI_ASSISTANT_ID="",
+        SCHEDULER_MODE=args.mode,
+        SCHEDULER_SIGNAL_POLL_SECONDS="0.2",
+        LOG_LEVEL="WARNING",
+    )
+    engine.dispose()
+
+    processes = [
+        spawn(
+            ["-m", "benchmarks.e2e.vapi_simulator", "--port", str(simulator_port),
+             "--webhook-url", f"{api_url}/api/webhooks/vapi",
+             "--latency-ms", str(args.latency_ms), "--error-rate", str(args.error_rate),
+             "--fail-rate", str(args.fail_rate), "--talk-seconds", str(args.talk_seconds)],
+            env,
+        )
+    ]
+    if args.mode == "worker":
+        processes.append(spawn(["-m", "app.worker"], env))
+    processes.append(spawn_api(env, api_port, args.workers if args.mode == "worker" else 1))
+
+    try:
+        wait_for_http(f"{simulator_url}/stats")
+        wait_for_http(f"{api_url}/health/live")
+        client = httpx.Client(base_url=api_url, timeout=60)
+
+        now = datetime.now(timezone.utc)
+        first_due = now + timedelta(seconds=args.lead)
+        step = args.spread / max(args.dispatch, 1)
+        due_payloads = [
+            reminder_payload(i, first_due + timedelta(seconds=step * i))
+            for i in range(args.dispatch)
+        ]
+        far_payloads = [
+            reminder_payload(i, now + timedelta(days=1, seconds=i)) for i in range(args.creates)
+        ]
+
+        due_latencies, due, due_errors = create_many(client, due_payloads, args.concurrency)
+        create_latencies, _, create_errors = create_many(client, far_payloads, args.concurrency)
+        list_latencies, list_errors = list_many(client, args.lists, args.concurrency)
+
+        remaining = (first_due - datetime.now(timezone.utc)).total_seconds() + args.spread
+        simulator_stats, calls = wait_for_calls(simulator_url, due, timeout=remaining + 60)
+
+        first_request = {}
+        for entry in simulator_stats["requests_log"]:
+            if entry["reminder_id"] in due:
+                first_request.setdefault(entry["reminder_id"], entry["received_at"])
+        lateness = [
+            received_at - due[reminder_id].timestamp()
+            for reminder_id, received_at in first_request.items()
+        ]
+        completion = [
+            hook["acked_at"] - hook["sent_at"]
+            for call in calls
+            for hook in call["webhooks"]
+            if hook["type"] in TERMINAL_EVENTS and "acked_at" in hook
+        ]
+        final_state = client.get("/api/reminders/stats").json()["by_status"]
+        client.close()
+    finally:
+        terminate(processes)
+
+    results = {
+        "config": config,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": dialect,
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": {
+            "create": summarize(due_latencies + create_latencies, due_errors + create_errors),
+            "list": summarize(list_latencies, list_errors),
+            "dispatch_lateness": summarize(lateness, errors=len(due) - len(first_request)),
+            "webhook_to_completion": summarize(completion),
+        },
+        "simulator": {
+            "call_requests": simulator_stats["requests"],
+            "upstream_errors": simulator_stats["errors"],
+        },
+        "final_state": final_state,
+    }
+
+    print(f"e2e ({args.mode}, {dialect}, commit {results['environment']['commit']})")
+    for name, summary in results["results"].items():
+        print(
+            f"   {name:22s} n={summary['count']:6d}  errors={summary['errors']:4d}  "
+            f"p50 {summary['p50_ms']} ms  p95 {summary['p95_ms']} ms  p99 {summary['p99_ms']} ms"
+        )
+    print(f"   final state {final_state}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
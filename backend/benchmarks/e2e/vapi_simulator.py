@@ -0,0 +1,180 @@
+"""Local stand-in for the Vapi API.
+
+Accepts POST /call/phone like Vapi does, answers after a configurable latency (or with a
+5xx at --error-rate), then plays the call back to the app as call.started followed by
+call.ended or, at --fail-rate, call.failed webhooks. GET /call/{id} returns the call as
+Vapi would. GET /stats exposes what happened for the benchmark runner.
+
+Usage: python -m benchmarks.e2e.vapi_simulator --port 8900 \
+           --webhook-url http://127.0.0.1:8000/api/webhooks/vapi [--latency-ms 150]
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass
+class SimulatorConfig:
+    webhook_url: str
+    latency_ms: float = 150.0
+    latency_jitter_ms: float = 50.0
+    error_rate: float = 0.0  # POST /call/phone answered with 500
+    fail_rate: float = 0.05  # accepted calls that end with call.failed
+    ring_seconds: float = 0.5  # accept -> call.started
+    talk_seconds: float = 1.0  # call.started -> call.ended
+    drop_rate: float = 0.0  # webhooks that are never delivered
+
+
+@dataclass
+class SimulatedCall:
+    id: str
+    metadata: Dict[str, Any]
+    received_at: float
+    status: str = "queued"
+    ended_reason: Optional[str] = None
+    webhooks: List[Dict[str, Any]] = field(default_factory=list)
+
+    def as_vapi(self) -> Dict[str, Any]:
+        call = {"id": self.id, "status": self.status, "metadata": self.metadata}
+        if self.status == "ended":
+            call.update(endedReason=self.ended_reason, duration=30, cost=0.05)
+        return call
+
+
+def create_app(config: SimulatorConfig) -> FastAPI:
+    calls: Dict[str, SimulatedCall] = {}
+    counters = {"requests": 0, "errors": 0}
+    # Every POST /call/phone, including rejected ones, for dispatch lateness
+    requests: List[Dict[str, Any]] = []
+    client: Dict[str, httpx.AsyncClient] = {}
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        client["http"] = httpx.AsyncClient(timeout=30.0)
+        yield
+        await client["http"].aclose()
+
+    app = FastAPI(title="Vapi simulator", lifespan=lifespan)
+
+    async def send(call: SimulatedCall, event_type: str):
+        if random.random() < config.drop_rate:
+            call.webhooks.append({"type": event_type, "dropped": True})
+            return
+        sent_at = time.time()
+        record = {"type": event_type, "sent_at": sent_at}
+        try:
+            response = await client["http"].post(
+                config.webhook_url, json={"type": event_type, "call": call.as_vapi()}
+            )
+            record["status_code"] = response.status_code
+        except httpx.HTTPError as e:
+            record["error"] = str(e)
+        record["acked_at"] = time.time()
+        call.webhooks.append(record)
+
+    async def play(call: SimulatedCall):
+        await asyncio.sleep(config.ring_seconds)
+        call.status = "in-progress"
+        await send(call, "call.started")
+        await asyncio.sleep(config.talk_seconds)
+        call.status = "ended"
+        if random.random() < config.fail_rate:
+            call.ended_reason = "customer-did-not-answer"
+            await send(call, "call.failed")
+        else:
+            call.ended_reason = "assistant-ended-call"
+            await send(call, "call.ended")
+
+    @app.post("/call/phone")
+    async def create_call(request: Request):
+        received_at = time.time()
+        payload = await request.json()
+        counters["requests"] += 1
+
+        latency = max(0.0, random.gauss(config.latency_ms, config.latency_jitter_ms)) / 1000
+        await asyncio.sleep(latency)
+
+        metadata = payload.get("metadata") or {}
+        failed = random.random() < config.error_rate
+        requests.append(
+            {
+                "reminder_id": metadata.get("reminder_id"),
+                "received_at": received_at,
+                "status_code": 500 if failed else 201,
+            }
+        )
+        if failed:
+            counters["errors"] += 1
+            return JSONResponse({"message": "simulated upstream error"}, status_code=500)
+
+        call = SimulatedCall(id=str(uuid.uuid4()), metadata=metadata, received_at=received_at)
+        calls[call.id] = call
+        asyncio.get_running_loop().create_task(play(call))
+        return JSONResponse(call.as_vapi(), status_code=201)
+
+    @app.get("/call/{call_id}")
+    async def get_call(call_id: str):
+        call = calls.get(call_id)
+        if call is None:
+            return JSONResponse({"message": "not found"}, status_code=404)
+        return call.as_vapi()
+
+    @app.get("/stats")
+    async def stats():
+        return {
+            **counters,
+            "requests_log": requests,
+            "calls": [
+                {
+                    "id": call.id,
+                    "reminder_id": call.metadata.get("reminder_id"),
+                    "received_at": call.received_at,
+                    "status": call.status,
+                    "webhooks": call.webhooks,
+                }
+                for call in calls.values()
+            ],
+        }
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--webhook-url", required=True)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.05)
+    parser.add_argument("--ring-seconds", type=float, default=0.5)
+    parser.add_argument("--talk-seconds", type=float, default=1.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        webhook_url=args.webhook_url,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        fail_rate=args.fail_rate,
+        ring_seconds=args.ring_seconds,
+        talk_seconds=args.talk_seconds,
+        drop_rate=args.drop_rate,
+    )
+    uvicorn.run(create_app(config), host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
+import os
+
 import pytest
 from datetime import datetime, timedelta, timezone
 
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
 
 @pytest.fixture
 def sample_reminder_data():
@@ -12,3 +16,64 @@ def sample_reminder_data():
         "scheduled_for": scheduled_time.isoformat(),
         "timezone": "America/New_York",
     }
+
+
+@pytest.fixture
+def db_session():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.db.database import Base
+    import app.models  # noqa: F401
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def stub_scheduler(monkeypatch):
+    from app.services import reminder_service, scheduler_service, webhook_service
+
+    class StubScheduler:
+        def __init__(self):
+            self.scheduled = []
+            self.cancelled = []
+            self.staged = []
+
+        def stage(self, db, reminder_ids):
+            ids = list(reminder_ids)
+            self.staged.extend(ids)
+            return len(ids)
+
+        def schedule_reminder(self, reminder):
+            self.scheduled.append(reminder.id)
+            return True
+
+        def cancel_reminder(self, reminder_id):
+            self.cancelled.append(reminder_id)
+            return True
+
+        def schedule_reminders(self, reminders):
+            ids = [reminder.id for reminder in reminders]
+            self.scheduled.extend(ids)
+            return len(ids)
+
+        def cancel_reminders(self, reminder_ids):
+            ids = list(reminder_ids)
+            self.cancelled.extend(ids)
+            return len(ids)
+
+    stub = StubScheduler()
+    monkeypatch.setattr(reminder_service, "get_scheduler", lambda: stub)
+    monkeypatch.setattr(webhook_service, "get_scheduler", lambda: stub)
+    monkeypatch.setattr(scheduler_service, "get_scheduler", lambda: stub)
+    return stub
@@ -0,0 +1,132 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.reminder import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus
+from app.schemas.reminder import ReminderBulkReschedule, ReminderBulkSelection, ReminderCreate
+from app.services.reminder_service import ReminderService
+from app.services.stats_service import StatsService
+
+
+def _create(db, minutes):
+    return ReminderService.create_reminder(
+        db,
+        ReminderCreate(
+            title="Bulk reminder",
+            message="This is a test message",
+            phone_number="+12025551234",
+            scheduled_for=datetime.now(timezone.utc) + timedelta(minutes=minutes),
+            timezone="UTC",
+        ),
+    )
+
+
+def _results(response):
+    return {result["id"]: result for result in response["results"]}
+
+
+def test_bulk_cancel_and_reschedule_report_each_item(db_session, stub_scheduler):
+    reminders = [_create(db_session, minutes) for minutes in (10, 20, 30, 40)]
+    ids = [reminder.id for reminder in reminders]
+
+    ringing = reminders[3]
+    ringing.last_attempt_status = CallAttemptStatus.RINGING
+    db_session.commit()
+
+    missing_id = uuid.uuid4()
+    response = ReminderService.bulk_cancel(
+        db_session, ReminderBulkSelection(ids=[ids[0], ids[3], missing_id])
+    )
+    results = _results(response)
+    assert (response["succeeded"], response["skipped"]) == (1, 2)
+    assert results[ids[0]]["result"] == "cancelled"
+    assert results[ids[3]]["detail"] == "Call in progress"
+    assert results[missing_id]["result"] == "not_found"
+    assert stub_scheduler.cancelled == [ids[0]]
+
+    originals = {reminder.id: reminder.scheduled_for for reminder in reminders}
+    response = ReminderService.bulk_reschedule(
+        db_session, ReminderBulkReschedule(ids=ids[:3], shift_seconds=3600)
+    )
+    results = _results(response)
+    assert response["succeeded"] == 2
+    assert results[ids[0]]["detail"] == "Reminder status is 'failed'"
+    assert sorted(stub_scheduler.scheduled[-2:]) == sorted(ids[1:3])
+
+    db_session.expire_all()
+    for reminder_id in ids[1:3]:
+        reminder = db_session.get(Reminder, reminder_id)
+        assert reminder.scheduled_for - originals[reminder_id] == timedelta(hours=1)
+        assert results[reminder_id]["scheduled_for"] == reminder.scheduled_for
+
+    # Moving reminders into the past is refused per item
+    response = ReminderService.bulk_reschedule(
+        db_session, ReminderBulkReschedule(ids=[ids[1]], shift_seconds=-7200)
+    )
+    assert response["succeeded"] == 0
+    assert db_session.get(Reminder, ids[0]).failure_reason == "Cancelled"
+    assert StatsService.check_consistency(db_session) == []
+
+
+def test_bulk_reschedule_does_not_stack_reminders_on_one_time(db_session, stub_scheduler):
+    reminders = [_create(db_session, minutes) for minutes in (10, 20, 70, 80)]
+    base = datetime.now(timezone.utc)
+    for reminder, minutes in zip(reminders, (10, 20, 70, 80)):
+        reminder.scheduled_for = base + timedelta(minutes=minutes)
+    db_session.commit()
+    first, second, staying, last = (reminder.id for reminder in reminders)
+    times = {reminder.id: reminder.scheduled_for for reminder in reminders}
+
+    # first would land on `staying`; second lands where `last` was, but `last` moves too
+    response = ReminderService.bulk_reschedule(
+        db_session, ReminderBulkReschedule(ids=[first, second, last], shift_seconds=3600)
+    )
+    results = _results(response)
+    assert (response["succeeded"], response["skipped"]) == (2, 1)
+    assert results[first]["result"] == "conflict"
+    assert results[second]["result"] == results[last]["result"] == "rescheduled"
+    db_session.expire_all()
+    assert db_session.get(Reminder, first).scheduled_for == times[first]
+    assert db_session.get(Reminder, second).scheduled_for == times[last]
+
+    staying_at = times[staying].replace(tzinfo=timezone.utc)
+    with pytest.raises(HTTPException) as exc_info:
+        ReminderService.bulk_reschedule(
+            db_session, ReminderBulkReschedule(ids=[first, second], scheduled_for=staying_at)
+        )
+    assert exc_info.value.status_code == 400
+
+    response = ReminderService.bulk_reschedule(
+        db_session, ReminderBulkReschedule(ids=[first], scheduled_for=staying_at)
+    )
+    assert [(r["id"], r["result"]) for r in response["results"]] == [(first, "conflict")]
+    db_session.expire_all()
+    assert db_session.get(Reminder, first).scheduled_for == times[first]
+
+
+def test_bulk_delete_by_filter_cascades_and_keeps_stats(db_session, stub_scheduler):
+    reminders = [_create(db_session, minutes) for minutes in range(10, 60, 10)]
+    ids = [reminder.id for reminder in reminders]
+    db_session.add(
+        CallAttempt(
+            reminder_id=reminders[0].id, attempt_number=1, status=CallAttemptStatus.FAILED
+        )
+    )
+    reminders[0].status = ReminderStatus.FAILED
+    StatsService.record_transition(
+        db_session, None, ReminderStatus.SCHEDULED, ReminderStatus.FAILED
+    )
+    db_session.commit()
+
+    response = ReminderService.bulk_delete(
+        db_session,
+        ReminderBulkSelection(scheduled_to=datetime.now(timezone.utc) + timedelta(minutes=35)),
+    )
+
+    assert response["succeeded"] == 3
+    assert db_session.query(Reminder).count() == 2
+    assert db_session.query(CallAttempt).count() == 0
+    assert sorted(stub_scheduler.cancelled) == sorted(ids[1:3])
+    assert StatsService.check_consistency(db_session) == []
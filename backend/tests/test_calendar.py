@@ -0,0 +1,130 @@
+from datetime import datetime, timezone
+import uuid
+
+import pytest
+import pytz
+from fastapi import HTTPException
+
+from app.models.reminder import Reminder, ReminderStatus
+from app.services.calendar_service import CalendarService, offset_segments
+from app.services.reminder_service import ReminderService
+
+
+def _utc(text):
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def reminders(db_session):
+    # New York falls back from EDT (-4) to EST (-5) at 2026-11-01T06:00Z
+    times = {
+        "2026-10-31T03:30": ReminderStatus.COMPLETED,  # Oct 30, 23:30 EDT
+        "2026-10-31T04:30": ReminderStatus.FAILED,  # Oct 31, 00:30 EDT
+        "2026-10-31T04:45": ReminderStatus.COMPLETED,  # Oct 31, 00:45 EDT
+        "2026-11-02T04:30": ReminderStatus.SCHEDULED,  # Nov 1, 23:30 EST
+        "2026-11-02T05:30": ReminderStatus.SCHEDULED,  # Nov 2, 00:30 EST
+    }
+    _add(db_session, times)
+    return db_session
+
+
+def _add(db, times):
+    for when, reminder_status in times.items():
+        db.add(
+            Reminder(
+                id=uuid.uuid4(),
+                title="Calendar reminder",
+                message="This is a test message",
+                phone_number="+12025551234",
+                scheduled_for=_utc(when),
+                timezone="America/New_York",
+                status=reminder_status,
+                retry_count=0,
+            )
+        )
+    db.commit()
+
+
+def test_day_buckets_follow_the_callers_timezone_across_dst(reminders):
+    segments = offset_segments(
+        pytz.timezone("America/New_York"), _utc("2026-10-30"), _utc("2026-11-03")
+    )
+    assert segments[1:] == [(_utc("2026-11-01T06:00"), -5 * 3600)]
+
+    calendar = CalendarService.get_buckets(
+        reminders, datetime(2026, 10, 30), datetime(2026, 11, 3), "America/New_York"
+    )
+    buckets = [
+        (bucket["start"].isoformat(), bucket["total"], bucket["by_status"])
+        for bucket in calendar["buckets"]
+    ]
+    assert buckets == [
+        ("2026-10-30T00:00:00-04:00", 1, {"completed": 1}),
+        ("2026-10-31T00:00:00-04:00", 2, {"failed": 1, "completed": 1}),
+        ("2026-11-01T00:00:00-04:00", 1, {"scheduled": 1}),
+        ("2026-11-02T00:00:00-05:00", 1, {"scheduled": 1}),
+    ]
+    assert calendar["start"].isoformat() == "2026-10-30T00:00:00-04:00"
+
+
+def test_hour_buckets_with_a_half_hour_offset(reminders):
+    calendar = CalendarService.get_buckets(
+        reminders,
+        _utc("2026-10-31T00:00"),
+        _utc("2026-10-31T12:00"),
+        "Asia/Kolkata",
+        granularity="hour",
+    )
+    assert [(b["start"].isoformat(), b["total"]) for b in calendar["buckets"]] == [
+        ("2026-10-31T09:00:00+05:30", 1),
+        ("2026-10-31T10:00:00+05:30", 2),
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        CalendarService.get_buckets(
+            reminders, _utc("2026-10-01"), _utc("2026-11-05"), granularity="hour"
+        )
+    assert exc_info.value.status_code == 400
+    with pytest.raises(HTTPException):
+        CalendarService.get_buckets(
+            reminders, _utc("2026-10-01"), _utc("2026-10-02"), "Mars/Base"
+        )
+
+
+def test_the_hour_repeated_at_fall_back_is_two_buckets(db_session):
+    _add(
+        db_session,
+        {
+            "2026-11-01T05:10": ReminderStatus.SCHEDULED,  # 01:10 EDT
+            "2026-11-01T05:50": ReminderStatus.SCHEDULED,  # 01:50 EDT
+            "2026-11-01T06:20": ReminderStatus.FAILED,  # 01:20 EST, an hour later
+            "2026-11-01T07:05": ReminderStatus.SCHEDULED,  # 02:05 EST
+        },
+    )
+    calendar = CalendarService.get_buckets(
+        db_session, datetime(2026, 11, 1), datetime(2026, 11, 2), "America/New_York", "hour"
+    )
+    assert [(b["start"].isoformat(), b["by_status"]) for b in calendar["buckets"]] == [
+        ("2026-11-01T01:00:00-04:00", {"scheduled": 2}),
+        ("2026-11-01T01:00:00-05:00", {"failed": 1}),
+        ("2026-11-01T02:00:00-05:00", {"scheduled": 1}),
+    ]
+
+    days = CalendarService.get_buckets(
+        db_session, datetime(2026, 11, 1), datetime(2026, 11, 2), "America/New_York"
+    )
+    assert [(b["start"].isoformat(), b["total"]) for b in days["buckets"]] == [
+        ("2026-11-01T00:00:00-04:00", 4)
+    ]
+
+
+def test_list_filters_by_scheduled_range(reminders):
+    rows, total = ReminderService.get_reminder_items(
+        reminders, scheduled_from=_utc("2026-10-31T04:30"), scheduled_to=_utc("2026-11-02T05:30")
+    )
+    assert total == 3
+    assert [row.status for row in rows] == [
+        ReminderStatus.FAILED,
+        ReminderStatus.COMPLETED,
+        ReminderStatus.SCHEDULED,
+    ]
@@ -0,0 +1,165 @@
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+import uuid
+
+from sqlalchemy import insert
+
+from app.models.reminder import Reminder, ReminderStatus
+from app.services.catch_up import EXPIRED_REASON, CatchUpDispatcher
+from app.services.stats_service import StatsService
+
+
+DONE = Future()
+DONE.set_result(None)
+
+
+class SimulatedScheduler:
+    """Dispatch pool stand-in on a simulated clock: every submission completes at once,
+    and live (on-time) traffic keeps the pool busy for the first 5s of every minute."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.submitted = []
+        self.scheduled = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def on_time_pending(self):
+        return 1 if self.now % 60 < 5 else 0
+
+    def submit_dispatch(self, reminder_id, user_id=None):
+        self.submitted.append((self.now, reminder_id))
+        return DONE
+
+    def schedule_reminders(self, reminders):
+        self.scheduled.extend(reminders)
+        return len(reminders)
+
+
+def _seed(db, start, count, spacing, **values):
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "title": "Missed during outage",
+            "message": "This is a test message",
+            "phone_number": "+12025551234",
+            "scheduled_for": start + spacing * i,
+            "timezone": "UTC",
+            "status": ReminderStatus.SCHEDULED,
+            "retry_count": 0,
+            **values,
+        }
+        for i in range(count)
+    ]
+    db.execute(insert(Reminder.__table__), rows)
+    db.commit()
+    return {str(row["id"]): row["scheduled_for"] for row in rows}
+
+
+def test_drains_a_30_minute_outage_most_late_first_around_live_traffic(db_session, monkeypatch):
+    monkeypatch.setattr(db_session, "close", lambda: None)
+    sim = SimulatedScheduler()
+    sim.now = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc).timestamp()
+    restart = datetime.fromtimestamp(sim.now, timezone.utc)
+
+    # 10k reminders a minute came due during the 30 minutes the dispatcher was down
+    outage = _seed(db_session, restart - timedelta(minutes=30), 300_000, timedelta(seconds=0.006))
+    ancient = _seed(db_session, restart - timedelta(hours=3), 50, timedelta(seconds=1))
+
+    dispatcher = CatchUpDispatcher(
+        sim,
+        overdue_before=restart,
+        max_lateness=timedelta(minutes=45),
+        rate=100,
+        concurrency=5,
+        batch_size=20_000,
+        session_factory=lambda: db_session,
+        clock=sim.clock,
+        sleep=sim.sleep,
+    )
+    dispatcher.run()
+
+    status = dispatcher.status()
+    assert status["state"] == "done" and status["backlog"] == 0
+    assert status["dispatched"] + status["expired"] == 300_050
+    assert status["dispatched"] == len(sim.submitted)
+
+    due = [outage[reminder_id] for _, reminder_id in sim.submitted]
+    assert due == sorted(due)
+    for dispatched_at, reminder_id in sim.submitted:
+        # Never while on-time dispatches were waiting, never beyond the maximum lateness
+        assert dispatched_at % 60 >= 5
+        lateness = dispatched_at - outage[reminder_id].timestamp()
+        assert lateness <= timedelta(minutes=45).total_seconds()
+
+    # At 100/s (less live-traffic windows) the tail of the backlog runs out of time
+    assert status["expired"] > 50
+    seconds = sim.submitted[-1][0] - sim.submitted[0][0]
+    assert len(sim.submitted) / seconds <= 100
+
+    failed = db_session.query(Reminder).filter(Reminder.failure_reason == EXPIRED_REASON)
+    assert failed.count() == status["expired"]
+    assert set(ancient) <= {str(row.id) for row in failed}
+
+
+def test_reports_backlog_and_eta_and_continues_expired_series(db_session, monkeypatch):
+    monkeypatch.setattr(db_session, "close", lambda: None)
+    sim = SimulatedScheduler()
+    sim.now = datetime(2026, 10, 19, 12, 0, 30, tzinfo=timezone.utc).timestamp()
+    restart = datetime.fromtimestamp(sim.now, timezone.utc)
+
+    _seed(db_session, restart - timedelta(minutes=10), 600, timedelta(seconds=1))
+    series = _seed(
+        db_session,
+        restart - timedelta(days=1, hours=1),
+        1,
+        timedelta(0),
+        recurrence_rule="FREQ=DAILY",
+        series_id=None,
+    )
+    StatsService.record_transitions(
+        db_session, ((None, None, ReminderStatus.SCHEDULED) for _ in range(601))
+    )
+    db_session.commit()
+
+    dispatcher = CatchUpDispatcher(
+        sim,
+        overdue_before=restart,
+        max_lateness=timedelta(hours=1),
+        rate=10,
+        concurrency=5,
+        session_factory=lambda: db_session,
+        clock=sim.clock,
+        sleep=sim.sleep,
+    )
+    assert dispatcher.status()["eta_seconds"] == 0.0
+
+    stop_after = 100
+    original_submit = sim.submit_dispatch
+
+    def submit_then_stop(reminder_id, user_id=None):
+        if len(sim.submitted) + 1 == stop_after:
+            dispatcher._stop.set()
+        return original_submit(reminder_id, user_id)
+
+    sim.submit_dispatch = submit_then_stop
+    dispatcher.run()
+
+    status = dispatcher.status()
+    assert status["state"] == "stopped"
+    assert (status["dispatched"], status["expired"], status["backlog"]) == (100, 1, 500)
+    assert 9.5 <= status["rate_per_second"] <= 10.5
+    assert status["eta_seconds"] == round(500 / status["rate_per_second"], 1)
+
+    # The missed daily occurrence failed; the series skips today's (also past) occurrence
+    # and carries on tomorrow
+    series_id = uuid.UUID(next(iter(series)))
+    assert db_session.get(Reminder, series_id).status == ReminderStatus.FAILED
+    (following,) = sim.scheduled
+    assert following.series_id == series_id and following.occurrence_index == 2
+    assert following.scheduled_for.replace(tzinfo=timezone.utc) > restart
+    assert StatsService.check_consistency(db_session) == []
@@ -0,0 +1,197 @@
+from datetime import datetime, timedelta, timezone
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.db.database import Base, SessionLocal
+from app.main import app
+from app.models.dead_letter import DeadLetter, DeadLetterKind, DeadLetterReason
+from app.models.reminder import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus
+from app.schemas.dead_letter import DeadLetterReplay, DeadLetterSelection
+from app.services import scheduler_service
+from app.services.dead_letter_service import DeadLetterService, classify_dispatch_error
+from app.services.vapi_service import vapi_service
+
+
+def _reminder(db, **fields):
+    reminder = Reminder(
+        id=uuid.uuid4(),
+        title="Dead letter reminder",
+        message="This is a test message",
+        phone_number="+12025551234",
+        scheduled_for=datetime.now(timezone.utc),
+        timezone="UTC",
+        status=ReminderStatus.SCHEDULED,
+        retry_count=0,
+        **fields,
+    )
+    db.add(reminder)
+    db.commit()
+    return reminder.id
+
+
+def test_failed_dispatches_are_classified_and_replayed_at_a_controlled_rate(
+    db_session, stub_scheduler, monkeypatch
+):
+    monkeypatch.setattr(scheduler_service, "SessionLocal", lambda: db_session)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+
+    outcomes = {}
+
+    async def trigger_call(reminder, call_attempt_id):
+        return False, None, outcomes[reminder.id]
+
+    monkeypatch.setattr(vapi_service, "trigger_call", trigger_call)
+
+    errors = [
+        "Vapi API error: 503 - upstream unavailable",
+        "Vapi API error: 503 - upstream unavailable",
+        "Vapi API error: 503 - upstream unavailable",
+        "Vapi API error: 400 - invalid phone number",
+        "Vapi API request timed out",
+    ]
+    ids = []
+    for error in errors:
+        reminder_id = _reminder(db_session)
+        outcomes[reminder_id] = error
+        scheduler_service.execute_reminder(str(reminder_id))
+        ids.append(reminder_id)
+
+    assert classify_dispatch_error("Could not reach Vapi API: ConnectError()") == (
+        DeadLetterReason.UNREACHABLE
+    )
+    assert classify_dispatch_error("Vapi API error: 429 - slow down") == (
+        DeadLetterReason.RATE_LIMITED
+    )
+    page = DeadLetterService.get_dead_letters(
+        db_session, DeadLetterSelection(kind=DeadLetterKind.DISPATCH), limit=2
+    )
+    assert page["by_reason"] == {
+        DeadLetterReason.PROVIDER_ERROR: 3,
+        DeadLetterReason.REJECTED: 1,
+        DeadLetterReason.TIMEOUT: 1,
+    }
+    assert [letter.reminder_id for letter in page["dead_letters"]] == ids[:2]
+    assert page["dead_letters"][0].error == errors[0]
+
+    # One of the outage's reminders was retried by hand in the meantime
+    db_session.get(Reminder, ids[2]).status = ReminderStatus.COMPLETED
+    db_session.commit()
+
+    started = datetime.now(timezone.utc)
+    result = DeadLetterService.replay(
+        db_session, DeadLetterReplay(reason=DeadLetterReason.PROVIDER_ERROR, rate_per_second=4)
+    )
+    assert (result["matched"], result["replayed"], result["skipped"]) == (3, 2, 1)
+    assert result["skipped_reasons"] == {"reminder_completed": 1}
+    assert stub_scheduler.scheduled == ids[:2]
+
+    db_session.expire_all()
+    first, second = (db_session.get(Reminder, reminder_id) for reminder_id in ids[:2])
+    assert first.status == second.status == ReminderStatus.SCHEDULED
+    assert first.retry_count == 1
+    assert second.scheduled_for - first.scheduled_for == timedelta(seconds=0.25)
+    assert first.scheduled_for.replace(tzinfo=timezone.utc) > started
+
+    # Replayed letters are not picked up again; the skipped one still is
+    result = DeadLetterService.replay(
+        db_session, DeadLetterReplay(reason=DeadLetterReason.PROVIDER_ERROR)
+    )
+    assert (result["matched"], result["replayed"]) == (1, 0)
+    pending = DeadLetterService.get_dead_letters(
+        db_session, DeadLetterSelection(reminder_ids=ids[:2]), replayed=False
+    )
+    assert pending["dead_letters"] == []
+
+
+
+def test_internal_dispatch_errors_can_be_replayed(db_session, stub_scheduler, monkeypatch):
+    monkeypatch.setattr(scheduler_service, "SessionLocal", lambda: db_session)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+
+    async def trigger_call(reminder, call_attempt_id):
+        raise RuntimeError("connection pool exhausted")
+
+    monkeypatch.setattr(vapi_service, "trigger_call", trigger_call)
+    reminder_id = _reminder(db_session)
+    scheduler_service.execute_reminder(str(reminder_id))
+
+    letters = db_session.query(DeadLetter).all()
+    assert [(letter.reason, letter.error) for letter in letters] == [
+        (DeadLetterReason.INTERNAL, "connection pool exhausted")
+    ]
+    result = DeadLetterService.replay(
+        db_session, DeadLetterReplay(reason=DeadLetterReason.INTERNAL)
+    )
+    assert (result["matched"], result["replayed"], result["skipped"]) == (1, 1, 0)
+    assert stub_scheduler.scheduled == [reminder_id]
+
+    db_session.expire_all()
+    reminder = db_session.get(Reminder, reminder_id)
+    assert reminder.status == ReminderStatus.SCHEDULED
+    assert [a.status for a in reminder.call_attempts] == [CallAttemptStatus.FAILED]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, stub_scheduler):
+    engine = create_engine(f"sqlite:///{tmp_path / 'dead_letters.db'}")
+    Base.metadata.create_all(engine)
+    monkeypatch.setitem(SessionLocal.kw, "bind", engine)
+    yield TestClient(app), engine
+    engine.dispose()
+
+
+def test_unprocessable_webhooks_are_kept_and_replayed_in_bulk(client):
+    client, engine = client
+    attempt_id = uuid.uuid4()
+    with Session(engine) as db:
+        reminder_id = _reminder(db)
+
+    event = {
+        "type": "call.ended",
+        "call": {
+            "id": "vapi-call-1",
+            "status": "ended",
+            "duration": 42,
+            "endedReason": "customer-ended-call",
+            "metadata": {"reminder_id": str(reminder_id), "call_attempt_id": str(attempt_id)},
+        },
+    }
+    # The webhook beats the dispatcher's commit of the call attempt
+    assert client.post("/api/webhooks/vapi", content=json.dumps(event)).status_code == 200
+    assert client.post("/api/webhooks/vapi", content=b"{not json").status_code == 200
+
+    response = client.get("/api/dead-letters/", params={"kind": "webhook"}).json()
+    assert response["by_reason"] == {"unmatched": 1, "invalid_payload": 1}
+    unmatched = response["dead_letters"][0]
+    assert unmatched["reminder_id"] == str(reminder_id)
+    assert "payload" not in unmatched
+
+    with Session(engine) as db:
+        db.add(
+            CallAttempt(
+                id=attempt_id,
+                reminder_id=reminder_id,
+                attempt_number=1,
+                status=CallAttemptStatus.RINGING,
+                vapi_call_id="vapi-call-1",
+            )
+        )
+        reminder = db.get(Reminder, reminder_id)
+        reminder.attempt_count = 1
+        reminder.last_attempt_status = CallAttemptStatus.RINGING
+        db.commit()
+
+    result = client.post("/api/dead-letters/replay", json={"kind": "webhook"}).json()
+    assert (result["replayed"], result["skipped_reasons"]) == (1, {"invalid_payload": 1})
+
+    with Session(engine) as db:
+        assert db.get(Reminder, reminder_id).status == ReminderStatus.COMPLETED
+        letters = {letter.reason: letter for letter in db.query(DeadLetter)}
+        assert letters[DeadLetterReason.UNMATCHED].replayed_at is not None
+        assert letters[DeadLetterReason.INVALID_PAYLOAD].replay_count == 1
+        assert letters[DeadLetterReason.INVALID_PAYLOAD].replayed_at is None
@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import SessionLocal
+from app.main import app
+from app.models.reminder import CallAttempt, CallAttemptStatus, ReminderStatus
+from app.schemas.reminder import ReminderCreate
+from app.services.export_service import ExportService
+from app.services.reminder_service import ReminderService
+
+
+def _seed(db):
+    reminders = []
+    for index, title in enumerate(("Dentist appointment", "Team standup", "Pay the rent")):
+        reminders.append(
+            ReminderService.create_reminder(
+                db,
+                ReminderCreate(
+                    title=title,
+                    message="This is a test message, with a comma",
+                    phone_number="+12025551234",
+                    scheduled_for=datetime.now(timezone.utc) + timedelta(minutes=10 + index),
+                    timezone="UTC",
+                ),
+            )
+        )
+    for number, status in enumerate((CallAttemptStatus.FAILED, CallAttemptStatus.COMPLETED), 1):
+        db.add(CallAttempt(reminder_id=reminders[0].id, attempt_number=number, status=status))
+    reminders[0].status = ReminderStatus.COMPLETED
+    db.commit()
+    return reminders
+
+
+def test_ndjson_nests_attempts_and_applies_filters(db_session, stub_scheduler):
+    reminders = _seed(db_session)
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    lines = "".join(ExportService.stream("ndjson", session_factory=factory, batch_size=2))
+    records = [json.loads(line) for line in lines.splitlines()]
+
+    assert [record["id"] for record in records] == [str(r.id) for r in reminders]
+    assert [a["attempt_number"] for a in records[0]["call_attempts"]] == [1, 2]
+    assert records[0]["status"] == "completed"
+    assert records[1]["call_attempts"] == []
+
+    filtered = "".join(
+        ExportService.stream(
+            "ndjson", status_filter="scheduled", search="rent", session_factory=factory
+        )
+    )
+    assert [json.loads(line)["title"] for line in filtered.splitlines()] == ["Pay the rent"]
+
+
+def test_csv_has_one_row_per_attempt(db_session, stub_scheduler):
+    reminders = _seed(db_session)
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    exported = "".join(ExportService.stream("csv", session_factory=factory))
+    rows = list(csv.DictReader(io.StringIO(exported)))
+
+    assert len(rows) == 4
+    assert [row["id"] for row in rows[:2]] == [str(reminders[0].id)] * 2
+    assert rows[0]["message"] == "This is a test message, with a comma"
+    assert rows[2]["attempt_id"] == ""
+
+    plain = "".join(
+        ExportService.stream("csv", include_attempts=False, session_factory=factory)
+    ).splitlines()
+    assert len(plain) == 4
+    assert "attempt_id" not in plain[0]
+
+
+def test_export_matches_the_list_for_a_scheduled_range(db_session, stub_scheduler, monkeypatch):
+    reminders = _seed(db_session)
+    monkeypatch.setitem(SessionLocal.kw, "bind", db_session.get_bind())
+    client = TestClient(app)
+    window = {
+        "scheduled_from": reminders[1].scheduled_for.isoformat(),
+        "scheduled_to": reminders[2].scheduled_for.isoformat(),
+    }
+
+    listed = client.get("/api/reminders/", params=window).json()["reminders"]
+    response = client.get("/api/reminders/export", params={**window, "format": "ndjson"})
+    exported = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [item["id"] for item in listed] == [str(reminders[1].id)]
+    assert [record["id"] for record in exported] == [item["id"] for item in listed]
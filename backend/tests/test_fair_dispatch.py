@@ -0,0 +1,86 @@
+import threading
+
+from app.services.fair_dispatch import FairDispatcher, parse_weights
+
+
+def _run_in_order(dispatcher, submissions):
+    """Queue every submission before the single worker starts, then record run order."""
+    order = []
+    gate = threading.Event()
+    dispatcher.submit("gate", gate.wait)
+    futures = [
+        dispatcher.submit(tenant, order.append, f"{tenant}{i}") for tenant, i in submissions
+    ]
+    gate.set()
+    for future in futures:
+        future.result(timeout=5)
+    return order
+
+
+def test_tenants_take_turns_instead_of_first_come_first_served():
+    dispatcher = FairDispatcher(workers=1)
+    dispatcher.start()
+    try:
+        order = _run_in_order(
+            dispatcher,
+            [("big", i) for i in range(6)] + [("a", 0), ("a", 1), ("b", 0)],
+        )
+    finally:
+        dispatcher.shutdown()
+
+    assert order == ["big0", "a0", "b0", "big1", "a1", "big2", "big3", "big4", "big5"]
+
+
+def test_weights_give_a_tenant_a_larger_share():
+    dispatcher = FairDispatcher(workers=1, weights=parse_weights("big=3, bad, small=x"))
+    dispatcher.start()
+    try:
+        order = _run_in_order(
+            dispatcher, [("big", i) for i in range(6)] + [("small", i) for i in range(2)]
+        )
+    finally:
+        dispatcher.shutdown()
+
+    assert order == ["big0", "big1", "big2", "small0", "big3", "big4", "big5", "small1"]
+
+
+def test_per_tenant_cap_leaves_workers_for_others():
+    dispatcher = FairDispatcher(workers=4, max_per_tenant=2)
+    dispatcher.start()
+    release = threading.Event()
+    both_running = threading.Event()
+    lock = threading.Lock()
+    in_flight = {"big": 0, "peak": 0}
+
+    def big_call():
+        with lock:
+            in_flight["big"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["big"])
+            if in_flight["big"] == 2:
+                both_running.set()
+        release.wait(timeout=5)
+        with lock:
+            in_flight["big"] -= 1
+
+    def small_call():
+        with lock:
+            return in_flight["big"]
+
+    try:
+        big = [dispatcher.submit("big", big_call) for _ in range(20)]
+        assert both_running.wait(timeout=5)
+        # The big tenant's calls are all blocked, so the small one can only finish on a
+        # worker the cap kept free, not after the big backlog
+        big_alongside_small = dispatcher.submit("small", small_call).result(timeout=5)
+        assert dispatcher.running("big") == 2
+        assert dispatcher.pending() == 18
+        release.set()
+        for future in big:
+            future.result(timeout=5)
+    finally:
+        release.set()
+        dispatcher.shutdown()
+
+    assert big_alongside_small == 2
+    assert in_flight["peak"] == 2
+    assert dispatcher.pending() == 0
@@ -0,0 +1,101 @@
+import statistics
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.routers import health
+from app.services.health_service import HealthMonitor, get_health_monitor
+
+
+class StubScheduler:
+    last_dispatch_at = None
+    last_dispatch_lag_seconds = None
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count_calls = 0
+
+    def is_alive(self):
+        return True
+
+    def count_in_memory(self):
+        return 0
+
+    def catch_up_status(self):
+        return None
+
+    def count_scheduled_jobs(self):
+        self.count_calls += 1
+        with self.engine.connect() as connection:
+            return connection.execute(text("SELECT COUNT(*) FROM reminder_jobs")).scalar_one()
+
+
+@pytest.fixture
+def jobs_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE reminder_jobs (reminder_id CHAR(32) PRIMARY KEY, promote_at FLOAT)")
+        )
+    return engine
+
+
+def _add_jobs(engine, start, count):
+    with engine.begin() as connection:
+        connection.execute(
+            text("INSERT INTO reminder_jobs (reminder_id, promote_at) VALUES (:id, :at)"),
+            [{"id": f"{i:032x}", "at": float(i)} for i in range(start, start + count)],
+        )
+
+
+def _probe_latency(client, path="/health/ready", probes=200):
+    samples = []
+    for _ in range(probes):
+        started = time.perf_counter()
+        response = client.get(path)
+        samples.append(time.perf_counter() - started)
+        assert response.status_code == 200
+    return statistics.median(samples)
+
+
+def test_probe_latency_is_independent_of_job_count(jobs_engine):
+    stub = StubScheduler(jobs_engine)
+    monitor = HealthMonitor(stub, jobs_engine, refresh_interval=60)
+
+    app = FastAPI()
+    app.include_router(health.router)
+    app.dependency_overrides[get_health_monitor] = lambda: monitor
+    client = TestClient(app)
+
+    _add_jobs(jobs_engine, 0, 100)
+    monitor.refresh()
+    small = _probe_latency(client)
+
+    _add_jobs(jobs_engine, 100, 50_000)
+    monitor.refresh()
+    large = _probe_latency(client)
+
+    assert client.get("/health").json()["scheduler"]["scheduled_jobs"] == 50_100
+    # Probes only read the cached snapshot; the job table is touched once per refresh
+    assert stub.count_calls == 2
+    assert large < small * 3 + 0.002
+
+
+def test_readiness_fails_when_database_ping_times_out(jobs_engine, monkeypatch):
+    monitor = HealthMonitor(StubScheduler(jobs_engine), jobs_engine, db_timeout=0.05)
+    monkeypatch.setattr(monitor, "_ping", lambda: time.sleep(0.5))
+
+    app = FastAPI()
+    app.include_router(health.router)
+    app.dependency_overrides[get_health_monitor] = lambda: monitor
+    client = TestClient(app)
+
+    monitor.refresh()
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["database"]["status"] == "timeout"
+    assert client.get("/health/live").status_code == 200
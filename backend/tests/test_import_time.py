@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Framework packages every process needs anyway; they are imported up front so the budget
+# only covers what the app itself adds
+FRAMEWORK = "import fastapi, pydantic_settings, sqlalchemy.orm, sqlalchemy.ext.declarative"
+
+# Only needed once the app dispatches a call, validates a reminder or builds the scheduler
+HEAVY_MODULES = ("apscheduler", "tzlocal", "httpx", "phonenumbers", "pytz")
+
+# Before lazy initialization the app's own share was ~350 ms on a dev laptop
+APP_IMPORT_BUDGET_SECONDS = 0.3
+
+
+def _import_app():
+    probe = (
+        f"{FRAMEWORK}\n"
+        "import sys\n"
+        "import app.main\n"
+        "from app.db.database import get_engine\n"
+        "from app.services.scheduler_service import ReminderScheduler\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+        "print(get_engine.cache_info().currsize, ReminderScheduler._instance is not None)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=BACKEND_DIR,
+        env=dict(os.environ, DATABASE_URL="sqlite://"),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == "app.main"
+    )
+    heavy, state = result.stdout.splitlines()
+    return cumulative_us / 1e6, heavy, state
+
+
+def test_importing_app_defers_heavy_dependencies_and_resources():
+    _, heavy, state = _import_app()
+
+    assert heavy == "[]"
+    # No engine and no scheduler (with its job store engine) until lifespan or first use
+    assert state == "0 False"
+
+
+def test_app_import_time_budget():
+    best = min(_import_app()[0] for _ in range(3))
+    assert best < APP_IMPORT_BUDGET_SECONDS, f"import app.main took {best * 1000:.0f} ms"
@@ -0,0 +1,69 @@
+import json
+import logging
+import queue
+
+from app.core.logging_config import (
+    ContextQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    log_context,
+    parse_sampling_rates,
+)
+
+
+class TestJsonFormatter:
+    def test_includes_correlation_ids_from_context(self):
+        log_queue = queue.Queue()
+        handler = ContextQueueHandler(log_queue)
+        logger = logging.getLogger("tests.logging.json")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+
+        try:
+            with log_context(reminder_id="r-1", call_attempt_id=None):
+                logger.info("Executing reminder %s", "r-1", extra={"vapi_call_id": "v-9"})
+        finally:
+            logger.removeHandler(handler)
+
+        payload = json.loads(JsonFormatter().format(log_queue.get_nowait()))
+        assert payload["message"] == "Executing reminder r-1"
+        assert payload["reminder_id"] == "r-1"
+        assert payload["vapi_call_id"] == "v-9"
+        assert "call_attempt_id" not in payload
+
+    def test_message_is_formatted_by_listener_not_caller(self):
+        log_queue = queue.Queue()
+        handler = ContextQueueHandler(log_queue)
+        record = logging.makeLogRecord({"msg": "call %s", "args": ("abc",)})
+
+        handler.handle(record)
+
+        queued = log_queue.get_nowait()
+        assert queued.args == ("abc",)
+        assert queued.getMessage() == "call abc"
+
+
+class TestSamplingFilter:
+    def test_drops_sampled_info_but_keeps_warnings(self):
+        sampler = SamplingFilter({"app.routers.webhooks": 0.0})
+
+        info = logging.makeLogRecord(
+            {"name": "app.routers.webhooks", "levelno": logging.INFO, "msg": "x"}
+        )
+        warning = logging.makeLogRecord(
+            {"name": "app.routers.webhooks", "levelno": logging.WARNING, "msg": "x"}
+        )
+        other = logging.makeLogRecord(
+            {"name": "app.services.scheduler_service", "levelno": logging.INFO, "msg": "x"}
+        )
+
+        assert sampler.filter(info) is False
+        assert sampler.filter(warning) is True
+        assert sampler.filter(other) is True
+
+    def test_rates_match_logger_prefix(self):
+        sampler = SamplingFilter(parse_sampling_rates("app.services=0, app.services.vapi=1"))
+        assert sampler._rate_for("app.services.webhook_service") == 0.0
+        assert sampler._rate_for("app.services.vapi") == 1.0
+        assert sampler._rate_for("app.main") == 1.0
@@ -0,0 +1,141 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.core import profiling
+from app.core.config import get_settings
+from app.core.profiling import ProfileStore, ProfilingMiddleware, StackSampler
+from app.db.database import Base, SessionLocal
+from app.main import app
+from app.models.reminder import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus
+from app.routers import reminders as reminders_router
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, stub_scheduler):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profiling.db'}")
+    Base.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as db:
+        for i in range(8):
+            reminder = Reminder(
+                id=uuid.uuid4(),
+                title=f"Profiled reminder {i}",
+                message="Profiled reminder message",
+                phone_number="+12025551234",
+                scheduled_for=now + timedelta(hours=i + 1),
+                timezone="UTC",
+                status=ReminderStatus.SCHEDULED,
+                created_at=now,
+                updated_at=now,
+            )
+            reminder.call_attempts.append(
+                CallAttempt(attempt_number=1, status=CallAttemptStatus.FAILED)
+            )
+            db.add(reminder)
+        db.commit()
+
+    monkeypatch.setitem(SessionLocal.kw, "bind", engine)
+    monkeypatch.setattr(get_settings(), "PROFILING_TOKEN", "secret")
+    profiling.get_profile_store().reset()
+    yield TestClient(app)
+    profiling.get_profile_store().reset()
+    engine.dispose()
+
+
+def test_profiled_requests_report_routes_statements_and_n_plus_one(client, monkeypatch):
+    # Reintroduce the call_attempts N+1 the list endpoint used to have
+    get_reminder_items = reminders_router.ReminderService.get_reminder_items
+
+    def get_reminder_items_loading_attempts(db, **kwargs):
+        rows, total = get_reminder_items(db, **kwargs)
+        for row in rows:
+            db.execute(select(CallAttempt).where(CallAttempt.reminder_id == row.id)).all()
+        return rows, total
+
+    monkeypatch.setattr(
+        reminders_router.ReminderService,
+        "get_reminder_items",
+        get_reminder_items_loading_attempts,
+    )
+
+    assert "server-timing" not in client.get("/api/reminders/").headers
+    response = client.get("/api/reminders/", headers={"X-Profile": "secret"})
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith('sql;desc="10 statements"')
+    client.get("/api/reminders/stats", headers={"X-Profile": "secret"})
+
+    assert client.get("/debug/profile").status_code == 403
+    report = client.get("/debug/profile", headers={"X-Profile": "secret"}).json()
+
+    routes = {route["route"]: route for route in report["routes"]}
+    assert set(routes) == {"GET /api/reminders/", "GET /api/reminders/stats"}
+    assert routes["GET /api/reminders/"]["requests"] == 1
+    assert routes["GET /api/reminders/"]["avg_statements"] == 10
+
+    (slowest_list,) = [
+        r for r in report["slowest_requests"] if r["route"] == "GET /api/reminders/"
+    ]
+    ((statement, count),) = slowest_list["repeated_statements"].items()
+    assert "FROM call_attempts" in statement and count == 8
+    assert any(q["executions"] == 8 for q in report["queries"])
+
+    assert client.delete("/debug/profile", headers={"X-Profile": "secret"}).status_code == 204
+    assert client.get("/debug/profile", headers={"X-Profile": "secret"}).json()["routes"] == []
+
+
+def test_stack_sampler_attributes_time_to_the_busy_function():
+    def spin_in_profiled_code(seconds):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            pass
+
+    sampler = StackSampler(0.001)
+    sampler.start()
+    spin_in_profiled_code(0.1)
+    stacks = sampler.stop()
+
+    assert stacks and "spin_in_profiled_code" in stacks[0][0].rsplit(";", 1)[-1]
+
+
+def test_disabled_profiling_adds_negligible_overhead():
+    async def endpoint(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def send(message):
+        pass
+
+    scope = {"type": "http", "method": "GET", "path": "/api/reminders/", "headers": []}
+    wrapped = ProfilingMiddleware(endpoint, store=ProfileStore())
+
+    async def per_call(asgi_app, calls=20_000):
+        started = time.perf_counter()
+        for _ in range(calls):
+            await asgi_app(scope, None, send)
+        return (time.perf_counter() - started) / calls
+
+    bare = min(asyncio.run(per_call(endpoint)) for _ in range(3))
+    profiled_off = min(asyncio.run(per_call(wrapped)) for _ in range(3))
+    assert wrapped.store.report()["routes"] == []
+    # A couple of microseconds at most, against the milliseconds a request takes
+    assert profiled_off - bare < 5e-6
+
+    # The engine hooks stay installed; outside a profiled request they only read a ContextVar
+    class Context:
+        pass
+
+    context = Context()
+    calls = 100_000
+    started = time.perf_counter()
+    for _ in range(calls):
+        profiling._before_cursor_execute(None, None, "SELECT 1", (), context, False)
+        profiling._after_cursor_execute(None, None, "SELECT 1", (), context, False)
+    assert (time.perf_counter() - started) / calls < 1e-6
+    assert not hasattr(context, "_profile_started")
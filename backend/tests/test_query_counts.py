@@ -0,0 +1,250 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.reminder import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus
+from app.services import scheduler_service
+from app.services.reminder_service import ReminderService
+from app.services.status_writer import StatusWriter
+from app.services.webhook_service import WebhookService
+
+
+@contextmanager
+def capture_statements(db):
+    statements = []
+    engine = db.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _history_loads(statements):
+    # Loading a reminder's attempt collection always filters on reminder_id
+    return [
+        s
+        for s in statements
+        if s.lstrip().upper().startswith("SELECT") and "call_attempts.reminder_id = " in s
+    ]
+
+
+def _reminder_with_history(db, attempts, last_status):
+    reminder = Reminder(
+        id=uuid.uuid4(),
+        title="Query count reminder",
+        message="This is a test message",
+        phone_number="+12025551234",
+        scheduled_for=datetime.now(timezone.utc) + timedelta(minutes=5),
+        timezone="UTC",
+        status=ReminderStatus.SCHEDULED,
+        retry_count=0,
+    )
+    for number in range(1, attempts + 1):
+        reminder.call_attempts.append(
+            CallAttempt(
+                attempt_number=number,
+                status=last_status if number == attempts else CallAttemptStatus.FAILED,
+                vapi_call_id=f"call-{reminder.id}-{number}",
+            )
+        )
+    reminder.attempt_count = attempts
+    reminder.last_attempt_status = last_status
+    db.add(reminder)
+    db.commit()
+    db.expire_all()
+    return reminder.id
+
+
+@pytest.fixture
+def dispatch_session(db_session, monkeypatch):
+    monkeypatch.setattr(scheduler_service, "SessionLocal", lambda: db_session)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+
+    async def trigger_call(reminder, call_attempt_id):
+        return True, f"vapi-{call_attempt_id}", None
+
+    monkeypatch.setattr(scheduler_service.vapi_service, "trigger_call", trigger_call)
+    return db_session
+
+
+def test_execute_reminder_does_not_load_call_history(dispatch_session):
+    reminder_id = _reminder_with_history(dispatch_session, 3, CallAttemptStatus.FAILED)
+
+    with capture_statements(dispatch_session) as statements:
+        scheduler_service.execute_reminder(str(reminder_id))
+
+    assert _history_loads(statements) == []
+
+    reminder = dispatch_session.get(Reminder, reminder_id)
+    assert reminder.attempt_count == 4
+    assert reminder.last_attempt_status == CallAttemptStatus.RINGING
+    assert reminder.last_attempt_at is not None
+    assert [a.attempt_number for a in reminder.call_attempts] == [1, 2, 3, 4]
+
+
+def test_delete_reminder_is_a_single_row_read(db_session, stub_scheduler):
+    reminder_id = _reminder_with_history(db_session, 5, CallAttemptStatus.COMPLETED)
+
+    with capture_statements(db_session) as statements:
+        ReminderService.delete_reminder(db_session, reminder_id)
+
+    assert _history_loads(statements) == []
+    assert db_session.query(CallAttempt).count() == 0
+
+
+def test_delete_refuses_while_latest_attempt_in_progress(db_session, stub_scheduler):
+    reminder_id = _reminder_with_history(db_session, 2, CallAttemptStatus.RINGING)
+
+    with pytest.raises(HTTPException) as exc_info:
+        ReminderService.delete_reminder(db_session, reminder_id)
+    assert exc_info.value.status_code == 400
+
+
+def test_list_page_runs_two_statements(db_session):
+    ids = [_reminder_with_history(db_session, n, CallAttemptStatus.FAILED) for n in (1, 3)]
+
+    with capture_statements(db_session) as statements:
+        rows, total = ReminderService.get_reminder_items(db_session, sort_order="desc")
+
+    assert total == 2 and len(statements) == 2
+    assert _history_loads(statements) == [] and "failure_reason" not in statements[1]
+    assert len(db_session.identity_map) == 0
+    assert [(row.id, row.call_attempts_count) for row in rows] == [(ids[1], 3), (ids[0], 1)]
+
+
+def test_webhook_updates_last_attempt_status(db_session):
+    reminder_id = _reminder_with_history(db_session, 2, CallAttemptStatus.RINGING)
+    vapi_call_id = f"call-{reminder_id}-2"
+
+    WebhookService.process_vapi_webhook(
+        db_session, {"type": "call.ended", "call": {"id": vapi_call_id, "duration": 12}}
+    )
+
+    reminder = db_session.get(Reminder, reminder_id)
+    assert reminder.status == ReminderStatus.COMPLETED
+    assert reminder.last_attempt_status == CallAttemptStatus.COMPLETED
+
+
+def test_dispatch_is_one_claim_and_one_status_write(dispatch_session):
+    reminder_id = _reminder_with_history(dispatch_session, 0, None)
+
+    with capture_statements(dispatch_session) as statements:
+        scheduler_service.execute_reminder(str(reminder_id))
+
+    verbs = [statement.lstrip().split()[0].upper() for statement in statements]
+    # Claim (UPDATE ... RETURNING) + attempt INSERT, then the RINGING write for both rows
+    assert verbs == ["UPDATE", "INSERT", "UPDATE", "UPDATE"]
+
+    # A second promotion of the same reminder finds nothing to claim
+    with capture_statements(dispatch_session) as statements:
+        scheduler_service.execute_reminder(str(reminder_id))
+    assert len(statements) == 1
+
+    dispatch_session.expire_all()
+    reminder = dispatch_session.get(Reminder, reminder_id)
+    assert reminder.attempt_count == 1
+    assert reminder.vapi_call_id.startswith("vapi-")
+    assert [a.status for a in reminder.call_attempts] == [CallAttemptStatus.RINGING]
+
+
+def test_status_writer_batches_concurrent_dispatch_results(db_session):
+    reminder_ids = [
+        _reminder_with_history(db_session, 1, CallAttemptStatus.INITIATED) for _ in range(40)
+    ]
+    attempts = {
+        attempt.reminder_id: attempt.id for attempt in db_session.query(CallAttempt).all()
+    }
+
+    writer = StatusWriter(sessionmaker(bind=db_session.get_bind()), max_delay=0.2)
+    writer.start()
+    with ThreadPoolExecutor(8) as pool:
+        for reminder_id in reminder_ids:
+            pool.submit(
+                writer.mark_ringing,
+                None,
+                reminder_id,
+                attempts[reminder_id],
+                f"vapi-{reminder_id}",
+                datetime.now(timezone.utc),
+            )
+    writer.stop()
+
+    assert writer.written == 40
+    assert writer.batches < 10
+    db_session.expire_all()
+    assert {a.status for a in db_session.query(CallAttempt)} == {CallAttemptStatus.RINGING}
+
+
+def test_status_writer_falls_back_to_row_writes_when_a_batch_fails(db_session, monkeypatch):
+    reminder_ids = [
+        _reminder_with_history(db_session, 1, CallAttemptStatus.INITIATED) for _ in range(3)
+    ]
+    rows = [
+        {
+            "b_reminder_id": reminder_id,
+            "b_attempt_id": db_session.get(Reminder, reminder_id).call_attempts[0].id,
+            "b_vapi_call_id": f"vapi-{reminder_id}",
+            "b_at": datetime.now(timezone.utc),
+        }
+        for reminder_id in reminder_ids
+    ]
+
+    writer = StatusWriter(sessionmaker(bind=db_session.get_bind()), max_delay=0)
+    apply = writer._apply
+    poisoned = reminder_ids[1]
+
+    def apply_failing_on_one_row(db, batch):
+        if any(row["b_reminder_id"] == poisoned for row in batch):
+            raise RuntimeError("database is locked")
+        apply(db, batch)
+
+    monkeypatch.setattr(writer, "_apply", apply_failing_on_one_row)
+    writer._write(rows)
+
+    # Only the row that fails on its own is lost; the rest of the batch is written
+    db_session.expire_all()
+    statuses = {a.reminder_id: a.status for a in db_session.query(CallAttempt)}
+    assert statuses == {
+        reminder_ids[0]: CallAttemptStatus.RINGING,
+        poisoned: CallAttemptStatus.INITIATED,
+        reminder_ids[2]: CallAttemptStatus.RINGING,
+    }
+    assert writer.written == 2
+
+
+def test_dispatch_that_raises_closes_its_attempt(dispatch_session, stub_scheduler, monkeypatch):
+    reminder_id = _reminder_with_history(dispatch_session, 0, None)
+
+    async def trigger_call(reminder, call_attempt_id):
+        raise RuntimeError("connection pool exhausted")
+
+    monkeypatch.setattr(scheduler_service.vapi_service, "trigger_call", trigger_call)
+    scheduler_service.execute_reminder(str(reminder_id))
+
+    dispatch_session.expire_all()
+    reminder = dispatch_session.get(Reminder, reminder_id)
+    assert reminder.status == ReminderStatus.FAILED
+    assert reminder.last_attempt_status == CallAttemptStatus.FAILED
+    assert [(a.status, a.failure_reason) for a in reminder.call_attempts] == [
+        (CallAttemptStatus.FAILED, "connection pool exhausted")
+    ]
+
+    # A retry is dispatched again rather than skipped as a call still in flight
+    ReminderService.retry_reminder(dispatch_session, reminder_id, datetime.now(timezone.utc))
+    scheduler_service.execute_reminder(str(reminder_id))
+    dispatch_session.expire_all()
+    assert dispatch_session.get(Reminder, reminder_id).attempt_count == 2
+
+    ReminderService.delete_reminder(dispatch_session, reminder_id)
+    assert dispatch_session.query(CallAttempt).count() == 0
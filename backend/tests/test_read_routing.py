@@ -0,0 +1,103 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db import database
+from app.db.database import PRIMARY_PIN_COOKIE, Base, SessionLocal
+from app.main import app
+from app.models.reminder import Reminder, ReminderStatus
+
+REMINDER_ID = uuid.uuid4()
+
+
+def _seed(engine, title):
+    now = datetime.now(timezone.utc)
+    with Session(engine) as db:
+        db.add(
+            Reminder(
+                id=REMINDER_ID,
+                title=title,
+                message="Replicated reminder message",
+                phone_number="+12025551234",
+                scheduled_for=now + timedelta(hours=1),
+                timezone="UTC",
+                status=ReminderStatus.SCHEDULED,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        db.commit()
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, stub_scheduler):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine, title in ((primary, "On the primary"), (replica, "On the replica")):
+        Base.metadata.create_all(engine)
+        _seed(engine, title)
+
+    monkeypatch.setitem(SessionLocal.kw, "bind", primary)
+    monkeypatch.setattr(database, "get_read_engines", lambda: (replica,))
+    monkeypatch.setattr(get_settings(), "DATABASE_READ_URLS", str(replica.url))
+    yield TestClient(app)
+    primary.dispose()
+    replica.dispose()
+
+
+def _titles(client):
+    return [item["title"] for item in client.get("/api/reminders/").json()["reminders"]]
+
+
+def test_reads_go_to_replica_until_the_client_writes(client, sample_reminder_data):
+    assert client.get(f"/api/reminders/{REMINDER_ID}").json()["title"] == "On the replica"
+    assert _titles(client) == ["On the replica"]
+
+    response = client.post(
+        "/api/reminders/", json={**sample_reminder_data, "phone_number": "+12025551234"}
+    )
+    assert response.status_code == 201
+    assert PRIMARY_PIN_COOKIE in response.cookies
+
+    # The writer sees its own reminder straight away, from the primary
+    assert sorted(_titles(client)) == ["On the primary", "Test Reminder"]
+    assert client.get(f"/api/reminders/{REMINDER_ID}").json()["title"] == "On the primary"
+
+    # Another client, or the same one once the window has passed, reads the replica again
+    assert _titles(TestClient(app)) == ["On the replica"]
+    client.cookies.set(PRIMARY_PIN_COOKIE, f"{time.time() - 1:.3f}")
+    assert _titles(client) == ["On the replica"]
+
+
+def test_failed_writes_and_reads_do_not_pin(client):
+    assert PRIMARY_PIN_COOKIE not in client.get("/api/reminders/").cookies
+
+    response = client.post("/api/reminders/", json={"title": "x"})
+    assert response.status_code == 422
+    assert PRIMARY_PIN_COOKIE not in response.cookies
+    assert _titles(client) == ["On the replica"]
+
+
+@pytest.mark.parametrize(
+    "environment, attributes",
+    [("development", {"samesite=lax"}), ("production", {"samesite=none", "secure"})],
+)
+def test_pin_cookie_reaches_a_cross_site_api(
+    client, sample_reminder_data, monkeypatch, environment, attributes
+):
+    monkeypatch.setattr(get_settings(), "ENVIRONMENT", environment)
+    response = client.post(
+        "/api/reminders/", json={**sample_reminder_data, "phone_number": "+12025551234"}
+    )
+
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith(f"{PRIMARY_PIN_COOKIE}=")
+    flags = {part.strip().lower() for part in cookie.split(";")[1:]}
+    assert attributes | {"httponly"} <= flags
+    assert ("secure" in flags) == (environment == "production")
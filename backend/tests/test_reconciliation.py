@@ -0,0 +1,178 @@
+from datetime import datetime, timedelta, timezone
+import random
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.reminder import (
+    CallAttempt,
+    CallAttemptStatus,
+    IN_PROGRESS_ATTEMPT_STATUSES,
+    Reminder,
+    ReminderStatus,
+)
+from app.services import scheduler_service
+from app.services.reconciliation_service import (
+    NEVER_PLACED_REASON,
+    UNAVAILABLE_REASON,
+    ReconciliationService,
+)
+from app.services.reminder_service import ReminderService
+from app.services.stats_service import StatsService
+from app.services.vapi_service import vapi_service
+from app.services.webhook_service import WebhookService
+
+
+class LossyVapi:
+    """Places every call, then delivers its final webhook only (1 - drop_rate) of the time."""
+
+    def __init__(self, drop_rate, seed=7):
+        self.random = random.Random(seed)
+        self.drop_rate = drop_rate
+        self.calls = {}
+        self.dropped = set()
+        self.lookups = []
+
+    async def trigger_call(self, reminder, call_attempt_id):
+        vapi_call_id = f"vapi-{call_attempt_id}"
+        answered = self.random.random() < 0.8
+        self.calls[vapi_call_id] = {
+            "id": vapi_call_id,
+            "status": "ended",
+            "endedReason": "customer-ended-call" if answered else "customer-did-not-answer",
+            "startedAt": "2026-10-19T12:00:00.000Z",
+            "endedAt": "2026-10-19T12:00:42.000Z" if answered else "2026-10-19T12:00:00.000Z",
+            "cost": 0.05,
+            "metadata": {"reminder_id": str(reminder.id), "call_attempt_id": str(call_attempt_id)},
+        }
+        return True, vapi_call_id, None
+
+    def deliver_webhooks(self, db):
+        for call in self.calls.values():
+            if self.random.random() < self.drop_rate:
+                self.dropped.add(call["id"])
+                continue
+            failed = call["endedReason"] == "customer-did-not-answer"
+            event = {
+                "type": "call.failed" if failed else "call.ended",
+                "call": {**call, "duration": None if failed else 42},
+            }
+            assert WebhookService.process_vapi_webhook(db, event)["status"] == "success"
+
+    async def get_call_status(self, vapi_call_id, client=None):
+        self.lookups.append(vapi_call_id)
+        return self.calls.get(vapi_call_id)
+
+
+@pytest.fixture
+def shared_session(db_session, monkeypatch):
+    monkeypatch.setattr(scheduler_service, "SessionLocal", lambda: db_session)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+    return db_session
+
+
+def _reminder(db, attempt_status=None, vapi_call_id=None):
+    reminder = Reminder(
+        id=uuid.uuid4(),
+        title="Reconcile me",
+        message="This is a test message",
+        phone_number="+12025551234",
+        scheduled_for=datetime.now(timezone.utc),
+        timezone="UTC",
+        status=ReminderStatus.SCHEDULED,
+        retry_count=0,
+    )
+    if attempt_status:
+        reminder.call_attempts.append(
+            CallAttempt(attempt_number=1, status=attempt_status, vapi_call_id=vapi_call_id)
+        )
+        reminder.attempt_count = 1
+        reminder.last_attempt_status = attempt_status
+    db.add(reminder)
+    StatsService.record_transition(db, None, None, ReminderStatus.SCHEDULED)
+    db.commit()
+    return reminder.id
+
+
+def test_reconciler_finishes_calls_whose_webhooks_were_dropped(
+    shared_session, stub_scheduler, monkeypatch
+):
+    db = shared_session
+    vapi = LossyVapi(drop_rate=0.3)
+    monkeypatch.setattr(scheduler_service.vapi_service, "trigger_call", vapi.trigger_call)
+    monkeypatch.setattr(vapi_service, "get_call_status", vapi.get_call_status)
+
+    reminder_ids = [_reminder(db) for _ in range(60)]
+    for reminder_id in reminder_ids:
+        scheduler_service.execute_reminder(str(reminder_id))
+    vapi.deliver_webhooks(db)
+    assert vapi.dropped
+
+    stuck = db.query(CallAttempt).filter(CallAttempt.vapi_call_id.in_(vapi.dropped)).first()
+    with pytest.raises(HTTPException):
+        ReminderService.delete_reminder(db, stuck.reminder_id)
+
+    later = datetime.now(timezone.utc) + timedelta(hours=1)
+    totals = ReconciliationService.reconcile_stale_attempts(
+        now=later, session_factory=lambda: db, batch_size=16, rate=0
+    )
+
+    # Only the calls that lost their webhook were looked up, each once
+    assert sorted(vapi.lookups) == sorted(vapi.dropped)
+    assert totals["resolved"] == len(vapi.dropped)
+    assert totals["errors"] == totals["unknown"] == totals["in_flight"] == 0
+
+    db.expire_all()
+    assert (
+        db.query(CallAttempt).filter(CallAttempt.status.in_(IN_PROGRESS_ATTEMPT_STATUSES)).count()
+        == 0
+    )
+    for attempt in db.query(CallAttempt).all():
+        answered = vapi.calls[attempt.vapi_call_id]["endedReason"] == "customer-ended-call"
+        assert attempt.reminder.status == (
+            ReminderStatus.COMPLETED if answered else ReminderStatus.FAILED
+        )
+        if answered:
+            assert attempt.duration_seconds == 42
+    assert StatsService.check_consistency(db) == []
+
+    ReminderService.delete_reminder(db, stuck.reminder_id)
+    again = ReconciliationService.reconcile_stale_attempts(
+        now=later, session_factory=lambda: db, rate=0
+    )
+    assert again["resolved"] == 0
+
+
+def test_reconciler_leaves_live_calls_and_gives_up_on_unknown_ones(db_session, monkeypatch):
+    live = _reminder(db_session, CallAttemptStatus.RINGING, "vapi-live")
+    never_placed = _reminder(db_session, CallAttemptStatus.INITIATED)
+    unknown = _reminder(db_session, CallAttemptStatus.RINGING, "vapi-unknown")
+
+    async def get_call_status(vapi_call_id, client=None):
+        if vapi_call_id == "vapi-live":
+            return {"id": vapi_call_id, "status": "in-progress"}
+        return None
+
+    monkeypatch.setattr(vapi_service, "get_call_status", get_call_status)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+
+    def reconcile(after):
+        return ReconciliationService.reconcile_stale_attempts(
+            now=datetime.now(timezone.utc) + after, session_factory=lambda: db_session, rate=0
+        )
+
+    totals = reconcile(timedelta(hours=1))
+    assert (totals["in_flight"], totals["abandoned"], totals["unknown"]) == (1, 1, 1)
+
+    totals = reconcile(timedelta(days=2))
+    assert (totals["in_flight"], totals["abandoned"], totals["unknown"]) == (1, 1, 0)
+
+    db_session.expire_all()
+    assert db_session.get(Reminder, live).last_attempt_status == CallAttemptStatus.RINGING
+    for reminder_id, reason in ((never_placed, NEVER_PLACED_REASON), (unknown, UNAVAILABLE_REASON)):
+        reminder = db_session.get(Reminder, reminder_id)
+        assert reminder.status == ReminderStatus.FAILED
+        assert reminder.last_attempt_status == CallAttemptStatus.FAILED
+        assert reminder.call_attempts[0].failure_reason == reason
+    assert StatsService.check_consistency(db_session) == []
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.reminder import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus
+from app.schemas.reminder import ReminderCreate
+from app.services.recurrence import RecurrenceRule
+from app.services.reminder_service import ReminderService
+from app.services.stats_service import StatsService
+from app.services.webhook_service import WebhookService
+
+
+def _expand(rule, first, tz_name, limit=10):
+    rule = RecurrenceRule.parse(rule)
+    occurrences = [first]
+    current, index = first, 0
+    while len(occurrences) < limit:
+        following = rule.next_occurrence(current, tz_name, index, current)
+        if following is None:
+            break
+        current, index = following
+        occurrences.append(current)
+    return occurrences
+
+
+def test_parse_normalizes_and_rejects_unsupported_rules():
+    assert str(RecurrenceRule.parse("rrule:byday=we,mo;freq=weekly")) == "FREQ=WEEKLY;BYDAY=MO,WE"
+
+    for bad in ("FREQ=HOURLY", "FREQ=DAILY;BYDAY=MO", "FREQ=DAILY;COUNT=0", "FREQ=DAILY;BYHOUR=9"):
+        with pytest.raises(ValueError):
+            RecurrenceRule.parse(bad)
+
+
+def test_daily_keeps_local_wall_time_across_dst():
+    # 09:00 in New York is 14:00 UTC until clocks move forward on 2026-03-08, then 13:00 UTC
+    first = datetime(2026, 3, 6, 14, 0, tzinfo=timezone.utc)
+    occurrences = _expand("FREQ=DAILY;COUNT=4", first, "America/New_York")
+
+    assert [o.hour for o in occurrences] == [14, 14, 13, 13]
+    assert occurrences[-1] == datetime(2026, 3, 9, 13, 0, tzinfo=timezone.utc)
+
+
+def test_weekly_byday_monthly_and_until():
+    monday = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+    weekly = _expand("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,FR", monday, "UTC", limit=4)
+    assert [o.day for o in weekly] == [1, 5, 15, 19]
+
+    # Months without a 31st are skipped rather than clamped
+    monthly = _expand("FREQ=MONTHLY", datetime(2026, 1, 31, 9, tzinfo=timezone.utc), "UTC", 3)
+    assert [o.month for o in monthly] == [1, 3, 5]
+
+    until = _expand("FREQ=DAILY;UNTIL=20260603", monday, "UTC")
+    assert len(until) == 3
+
+
+def test_missed_occurrences_are_skipped_but_counted():
+    rule = RecurrenceRule.parse("FREQ=DAILY;COUNT=5")
+    first = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+    following = rule.next_occurrence(first, "UTC", 0, first + timedelta(days=2, hours=1))
+    assert following == (datetime(2026, 6, 4, 12, 0, tzinfo=timezone.utc), 3)
+    assert rule.next_occurrence(first, "UTC", 0, first + timedelta(days=5)) is None
+
+
+def test_webhook_completion_materializes_only_the_next_occurrence(db_session, stub_scheduler):
+    reminder = ReminderService.create_reminder(
+        db_session,
+        ReminderCreate(
+            title="Daily standup",
+            message="Time for the daily standup call",
+            phone_number="+12025551234",
+            scheduled_for=datetime.now(timezone.utc) + timedelta(minutes=5),
+            timezone="Europe/Madrid",
+            recurrence_rule="FREQ=DAILY;COUNT=3",
+        ),
+    )
+    assert reminder.series_id == reminder.id
+
+    for index, call_id in enumerate(("call-1", "call-2", "call-3")):
+        current = (
+            db_session.query(Reminder)
+            .filter(Reminder.series_id == reminder.id, Reminder.occurrence_index == index)
+            .one()
+        )
+        db_session.add(
+            CallAttempt(
+                reminder_id=current.id,
+                attempt_number=1,
+                status=CallAttemptStatus.RINGING,
+                vapi_call_id=call_id,
+            )
+        )
+        db_session.commit()
+
+        event = {"type": "call.ended", "call": {"id": call_id}}
+        WebhookService.process_vapi_webhook(db_session, event)
+        # Duplicate deliveries must not create a second occurrence
+        WebhookService.process_vapi_webhook(db_session, event)
+
+        assert db_session.query(Reminder).filter(Reminder.status == "scheduled").count() == (
+            1 if index < 2 else 0
+        )
+
+    series = db_session.query(Reminder).order_by(Reminder.occurrence_index).all()
+    assert [r.status for r in series] == [ReminderStatus.COMPLETED] * 3
+    assert (series[1].scheduled_for - series[0].scheduled_for) == timedelta(days=1)
+    assert len(stub_scheduler.scheduled) == 3
+    assert StatsService.check_consistency(db_session) == []
@@ -0,0 +1,169 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+import json
+import uuid
+
+import pytest
+from sqlalchemy import event, update
+
+from app.models.reminder import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus
+from app.schemas.reminder import ReminderUpdate
+from app.services import reminder_cache, reminder_service
+from app.services.reminder_cache import ReminderCache
+from app.services.reminder_service import ReminderService
+from app.services.webhook_service import WebhookService
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ReminderCache(maxsize=100, ttl=60)
+    monkeypatch.setattr(reminder_cache, "get_reminder_cache", lambda: cache)
+    monkeypatch.setattr(reminder_service, "get_reminder_cache", lambda: cache)
+    return cache
+
+
+@contextmanager
+def capture_statements(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", before_cursor_execute)
+
+
+def _ringing_reminder(db):
+    reminder = Reminder(
+        id=uuid.uuid4(),
+        title="Cached reminder",
+        message="This is a test message",
+        phone_number="+12025551234",
+        scheduled_for=datetime.now(timezone.utc) + timedelta(minutes=5),
+        timezone="UTC",
+        status=ReminderStatus.SCHEDULED,
+        retry_count=0,
+        attempt_count=1,
+        last_attempt_status=CallAttemptStatus.RINGING,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+    reminder.call_attempts.append(
+        CallAttempt(
+            attempt_number=1, status=CallAttemptStatus.RINGING, vapi_call_id=f"call-{reminder.id}"
+        )
+    )
+    db.add(reminder)
+    db.commit()
+    db.expire_all()
+    return reminder.id
+
+
+def _detail(db, reminder_id):
+    db.expire_all()
+    return json.loads(ReminderService.get_reminder_detail(db, reminder_id))
+
+
+def test_polling_hits_are_one_row_lookup_until_the_reminder_changes(
+    db_session, cache, stub_scheduler
+):
+    reminder_id = _ringing_reminder(db_session)
+    first = _detail(db_session, reminder_id)
+    assert first["call_attempts"][0]["status"] == "ringing"
+
+    for _ in range(3):
+        with capture_statements(db_session) as statements:
+            assert _detail(db_session, reminder_id) == first
+        # The version probe only: neither the full row nor its attempts are loaded
+        assert len(statements) == 1 and "call_attempts" not in statements[0]
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    WebhookService.process_vapi_webhook(
+        db_session, {"type": "call.started", "call": {"id": f"call-{reminder_id}"}}
+    )
+    assert _detail(db_session, reminder_id)["call_attempts"][0]["status"] == "answered"
+
+    WebhookService.process_vapi_webhook(
+        db_session, {"type": "call.ended", "call": {"id": f"call-{reminder_id}", "duration": 9}}
+    )
+    assert _detail(db_session, reminder_id)["status"] == "completed"
+
+    ReminderService.delete_reminder(db_session, reminder_id)
+    assert ReminderService.get_reminder_detail(db_session, reminder_id) is None
+
+
+def test_versions_cover_writes_the_cache_was_not_told_about(db_session, cache, stub_scheduler):
+    reminder_id = _ringing_reminder(db_session)
+    _detail(db_session, reminder_id)
+
+    # Another API process renames the reminder: this one only sees the new updated_at
+    db_session.execute(
+        update(Reminder)
+        .where(Reminder.id == reminder_id)
+        .values(title="Renamed elsewhere", updated_at=datetime.now(timezone.utc))
+    )
+    db_session.commit()
+    assert _detail(db_session, reminder_id)["title"] == "Renamed elsewhere"
+
+    # With invalidations broadcast the version check is skipped and writes drop the entry
+    cache._trusted = True
+    with capture_statements(db_session) as statements:
+        _detail(db_session, reminder_id)
+    assert statements == []
+
+    ReminderService.update_reminder(db_session, reminder_id, ReminderUpdate(title="Edited"))
+    assert _detail(db_session, reminder_id)["title"] == "Edited"
+
+
+def test_cache_is_bounded_and_entries_expire():
+    now = [0.0]
+    cache = ReminderCache(maxsize=2, ttl=30, clock=lambda: now[0])
+    cache.put("a", 1, b"a1")
+    cache.put("b", 1, b"b1")
+    assert cache.get("a", 1) == b"a1"
+    cache.put("c", 1, b"c1")
+
+    # "b" was least recently used
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 2) is None
+    assert cache.get("c") == b"c1"
+
+    now[0] = 31.0
+    assert cache.get("a", 1) is None and cache.get("c", 1) is None
+    assert ReminderCache(maxsize=0, ttl=30).enabled is False
+
+
+def test_trusted_cache_is_filled_from_the_primary_only(db_session, cache, monkeypatch):
+    reminder_id = _ringing_reminder(db_session)
+    cache._trusted = True
+
+    # Served by a replica: the body is returned but not cached, and versions are checked
+    monkeypatch.setattr(reminder_service, "get_read_engines", lambda: (db_session.get_bind(),))
+    _detail(db_session, reminder_id)
+    assert cache.stats()["size"] == 0
+    cache.put(reminder_id, "stale version", b"{}")
+    assert _detail(db_session, reminder_id)["title"] == "Cached reminder"
+
+    # A read that loaded before an invalidation must not store what it loaded
+    token = cache.token()
+    cache.invalidate([reminder_id])
+    cache.put(reminder_id, 1, b"old", token)
+    assert cache.get(reminder_id) is None
+    cache.put(reminder_id, 1, b"new", cache.token())
+    assert cache.get(reminder_id) == b"new"
+
+
+def test_events_that_change_nothing_keep_the_version(db_session, cache, stub_scheduler):
+    reminder_id = _ringing_reminder(db_session)
+    first = _detail(db_session, reminder_id)
+
+    with capture_statements(db_session) as statements:
+        WebhookService.process_vapi_webhook(
+            db_session, {"type": "speech-update", "call": {"id": f"call-{reminder_id}"}}
+        )
+    assert not any(s.lstrip().upper().startswith("UPDATE") for s in statements)
+    assert _detail(db_session, reminder_id) == first
+    assert (cache.hits, cache.misses) == (1, 1)
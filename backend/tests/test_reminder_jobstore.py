@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+import uuid
+
+import pytest
+from apscheduler.jobstores.base import ConflictingIdError, JobLookupError
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.date import DateTrigger
+from sqlalchemy import create_engine
+
+from app.services.reminder_jobstore import ReminderJobStore
+from app.services.scheduler_service import promote_reminder
+
+
+@pytest.fixture
+def store(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    store = ReminderJobStore(engine)
+    scheduler = BackgroundScheduler(jobstores={"default": store}, timezone="UTC")
+    scheduler.start(paused=True)
+    yield scheduler, store
+    scheduler.shutdown(wait=False)
+    engine.dispose()
+
+
+def test_store_round_trips_promotion_jobs_through_apscheduler(store):
+    scheduler, store = store
+    now = datetime.now(timezone.utc)
+    ids = [uuid.uuid4() for _ in range(3)]
+    for i, reminder_id in enumerate(ids):
+        scheduler.add_job(
+            promote_reminder,
+            trigger=DateTrigger(run_date=now + timedelta(minutes=10 - i)),
+            args=[str(reminder_id)],
+            id=f"reminder_{reminder_id}",
+        )
+
+    job = scheduler.get_job(f"reminder_{ids[0]}")
+    assert job.func is promote_reminder and job.args == (str(ids[0]),)
+    assert job.next_run_time == job.trigger.run_date
+    assert job.misfire_grace_time is None
+
+    assert [j.args[0] for j in store.get_due_jobs(now + timedelta(minutes=9, seconds=30))] == [
+        str(ids[2]),
+        str(ids[1]),
+    ]
+    assert store.get_next_run_time() == job.trigger.run_date - timedelta(minutes=2)
+
+    with pytest.raises(ConflictingIdError):
+        store.add_job(job)
+    with pytest.raises(ValueError):
+        scheduler.add_job(print, trigger=DateTrigger(run_date=now), id="not_a_reminder")
+
+    scheduler.reschedule_job(job.id, trigger=DateTrigger(run_date=now + timedelta(hours=1)))
+    assert scheduler.get_job(job.id).next_run_time == now + timedelta(hours=1)
+
+    scheduler.remove_job(job.id)
+    with pytest.raises(JobLookupError):
+        store.remove_job(job.id)
+    assert scheduler.get_job(job.id) is None
+    assert store.count() == 2
+
+
+def test_bulk_add_replaces_and_bulk_remove_counts(store):
+    _, store = store
+    now = datetime.now(timezone.utc)
+    ids = [uuid.uuid4() for _ in range(2500)]
+
+    assert store.add_reminders((reminder_id, now + timedelta(hours=1)) for reminder_id in ids)
+    # Rescheduling moves existing jobs instead of tripping over their ids
+    store.add_reminders([(str(ids[0]), now + timedelta(minutes=1))])
+    assert store.count() == 2500
+    (due,) = store.get_due_jobs(now + timedelta(minutes=2))
+    assert due.args == (str(ids[0]),)
+
+    assert store.remove_reminders(ids[:1200] + [uuid.uuid4()]) == 1200
+    assert store.count() == 1300
+    assert store.get_next_run_time() == datetime.fromtimestamp(
+        (now + timedelta(hours=1)).timestamp(), timezone.utc
+    )
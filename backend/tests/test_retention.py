@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+import uuid
+
+from sqlalchemy import text
+
+from app.models.archive import ArchivedReminder
+from app.models.reminder import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus
+from app.schemas.reminder import ReminderResponse
+from app.services.retention_service import RetentionService
+from app.services.stats_service import StatsService
+
+
+def _reminder(db, status, finished_days_ago):
+    finished = datetime.now(timezone.utc) - timedelta(days=finished_days_ago)
+    reminder = Reminder(
+        id=uuid.uuid4(),
+        title="Old reminder",
+        message="This is a test message",
+        phone_number="+12025551234",
+        scheduled_for=finished,
+        timezone="UTC",
+        status=status,
+        retry_count=0,
+        created_at=finished,
+        updated_at=finished,
+    )
+    reminder.call_attempts.append(
+        CallAttempt(
+            attempt_number=1,
+            status=CallAttemptStatus.COMPLETED,
+            vapi_call_id=f"call-{reminder.id}",
+            duration_seconds=30,
+            initiated_at=finished,
+        )
+    )
+    db.add(reminder)
+    db.commit()
+    StatsService.record_transition(db, None, None, status)
+    db.commit()
+    return reminder.id
+
+
+def test_archives_only_old_finished_reminders_in_batches(db_session):
+    old_ids = [_reminder(db_session, ReminderStatus.COMPLETED, 120) for _ in range(5)]
+    recent_id = _reminder(db_session, ReminderStatus.COMPLETED, 1)
+    scheduled_id = _reminder(db_session, ReminderStatus.SCHEDULED, 120)
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=90)
+    assert RetentionService.archive_batch(db_session, cutoff, batch_size=2) == 2
+    assert RetentionService.archive_batch(db_session, cutoff, batch_size=10) == 3
+    assert RetentionService.archive_batch(db_session, cutoff, batch_size=10) == 0
+
+    live_ids = {row.id for row in db_session.query(Reminder).all()}
+    assert live_ids == {recent_id, scheduled_id}
+    assert db_session.query(CallAttempt).count() == 2
+    assert {row.id for row in db_session.query(ArchivedReminder).all()} == set(old_ids)
+
+    # Archiving moves rows, it doesn't change the user-visible totals
+    assert StatsService.check_consistency(db_session) == []
+
+
+def test_archive_scan_uses_the_status_updated_index(db_session):
+    statement = RetentionService._finished_before(datetime.now(timezone.utc), 100)
+    compiled = statement.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    assert "USING INDEX idx_reminders_status_updated (status=? AND updated_at<?)" in plan[0][-1]
+
+
+def test_archived_reminder_serializes_like_a_live_one(db_session):
+    reminder_id = _reminder(db_session, ReminderStatus.FAILED, 200)
+    RetentionService.archive_batch(db_session, datetime.now(timezone.utc), batch_size=10)
+
+    archived = RetentionService.get_archived_reminder(db_session, reminder_id)
+    response = ReminderResponse.model_validate(archived)
+
+    assert response.id == reminder_id
+    assert response.archived is True
+    assert response.status == ReminderStatus.FAILED
+    assert [attempt.duration_seconds for attempt in response.call_attempts] == [30]
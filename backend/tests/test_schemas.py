@@ -1,8 +1,11 @@
+import json
+
 import pytest
 from datetime import datetime, timedelta, timezone
 from pydantic import ValidationError
 
 from app.schemas.reminder import ReminderCreate, ReminderUpdate
+from app.services.vapi_service import vapi_service
 
 
 class TestReminderCreate:
@@ -112,3 +115,47 @@ class TestReminderUpdate:
         with pytest.raises(ValidationError) as exc_info:
             ReminderUpdate(**data)
         assert "at least 3 characters" in str(exc_info.value)
+
+
+class TestVapiWebhookDecoding:
+    def test_end_of_call_payload_keeps_only_the_fields_we_use(self):
+        body = json.dumps(
+            {
+                "type": "call.ended",
+                "call": {
+                    "id": "call-1",
+                    "status": "ended",
+                    "duration": 42.5,
+                    "endedReason": "customer-ended-call",
+                    "cost": 0.12,
+                    "metadata": {"reminder_id": "r-1", "call_attempt_id": "a-1", "extra": 1},
+                    "messages": [{"role": "bot", "message": "Hello " * 50}] * 100,
+                    "transcript": "AI: Hello\nUser: Hi\n" * 1000,
+                },
+                "artifact": {"recordingUrl": "https://example.com/r.wav"},
+            }
+        ).encode()
+
+        event = vapi_service.decode_webhook(body)
+
+        assert not hasattr(event.call, "messages") and not hasattr(event, "artifact")
+        assert vapi_service.parse_webhook_event(event) == {
+            "event_type": "call.ended",
+            "vapi_call_id": "call-1",
+            "reminder_id": "r-1",
+            "call_attempt_id": "a-1",
+            "status": "ended",
+            "duration_seconds": 42.5,
+            "end_reason": "customer-ended-call",
+            "cost": 0.12,
+        }
+
+    def test_missing_or_null_fields_decode_and_bad_json_is_rejected(self):
+        parsed = vapi_service.parse_webhook_event(
+            vapi_service.decode_webhook(b'{"type": "status-update", "call": {"endedReason": null}}')
+        )
+        assert (parsed["vapi_call_id"], parsed["end_reason"], parsed["status"]) == (None, "", "")
+        assert vapi_service.decode_webhook(b"{}").call is None
+
+        with pytest.raises(ValidationError):
+            vapi_service.decode_webhook(b"{not json")
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.reminder import CallAttempt, CallAttemptStatus, ReminderStatus
+from app.schemas.reminder import ReminderCreate
+from app.services.reminder_service import ReminderService
+from app.services.stats_service import StatsService
+from app.services.webhook_service import WebhookService
+
+
+def _create(db, minutes):
+    return ReminderService.create_reminder(
+        db,
+        ReminderCreate(
+            title="Stats reminder",
+            message="This is a test message",
+            phone_number="+12025551234",
+            scheduled_for=datetime.now(timezone.utc) + timedelta(minutes=minutes),
+            timezone="UTC",
+        ),
+    )
+
+
+def _ring(db, reminder, vapi_call_id):
+    attempt = CallAttempt(
+        reminder_id=reminder.id,
+        attempt_number=1,
+        status=CallAttemptStatus.RINGING,
+        vapi_call_id=vapi_call_id,
+    )
+    db.add(attempt)
+    db.commit()
+    return attempt
+
+
+def _webhook(event_type, vapi_call_id, **call):
+    return {"type": event_type, "call": {"id": vapi_call_id, **call}}
+
+
+def test_counters_follow_reminder_lifecycle(db_session, stub_scheduler):
+    first = _create(db_session, 10)
+    second = _create(db_session, 20)
+    third = _create(db_session, 30)
+
+    _ring(db_session, first, "call-1")
+    _ring(db_session, second, "call-2")
+
+    WebhookService.process_vapi_webhook(
+        db_session, _webhook("call.ended", "call-1", duration=42, cost=0.12)
+    )
+    # Duplicate deliveries must not double count
+    WebhookService.process_vapi_webhook(
+        db_session, _webhook("call.ended", "call-1", duration=42, cost=0.12)
+    )
+    WebhookService.process_vapi_webhook(
+        db_session, _webhook("call.failed", "call-2", endedReason="no-answer")
+    )
+    ReminderService.delete_reminder(db_session, third.id)
+
+    stats = StatsService.get_stats(db_session)
+    assert stats["by_status"] == {"scheduled": 0, "completed": 1, "failed": 1}
+    assert stats["total"] == 2
+    assert stats["calls"]["count"] == 2
+    assert stats["calls"]["total_duration_seconds"] == 42
+    assert round(stats["calls"]["total_cost"], 2) == 0.12
+
+    ReminderService.retry_reminder(
+        db_session, second.id, datetime.now(timezone.utc) + timedelta(hours=1)
+    )
+    stats = StatsService.get_stats(db_session)
+    assert stats["by_status"]["scheduled"] == 1
+    assert stats["by_status"]["failed"] == 0
+    assert StatsService.check_consistency(db_session) == []
+
+
+def test_consistency_checker_detects_and_repairs_drift(db_session, stub_scheduler):
+    reminder = _create(db_session, 10)
+    reminder.status = ReminderStatus.COMPLETED
+    db_session.commit()
+
+    mismatches = StatsService.check_consistency(db_session, repair=True)
+    assert {(m["status"], m["expected"], m["recorded"]) for m in mismatches} == {
+        ("scheduled", 0, 1),
+        ("completed", 1, 0),
+    }
+    assert StatsService.check_consistency(db_session) == []
+    assert StatsService.get_stats(db_session)["by_status"]["completed"] == 1
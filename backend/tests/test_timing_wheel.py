@@ -0,0 +1,81 @@
+import math
+import random
+
+from app.services.timing_wheel import TimingWheel
+
+
+def _run(wheel, until, step):
+    fired = {}
+    now = 0.0
+    while now <= until:
+        for key, payload in wheel.advance(now):
+            fired[key] = (now, payload)
+        now = round(now + step, 6)
+    return fired
+
+
+def test_entries_fire_on_their_tick_across_all_levels():
+    wheel = TimingWheel(tick=0.1, slots=8, levels=3)
+    rng = random.Random(7)
+    # 8 * 8**3 ticks is beyond the top level, so some entries go through the overflow bucket
+    deadlines = {f"r{i}": rng.uniform(0.05, 600.0) for i in range(2000)}
+    for key, deadline in deadlines.items():
+        wheel.insert(key, deadline, payload=deadline)
+
+    fired = _run(wheel, 601.0, 0.1)
+
+    assert set(fired) == set(deadlines)
+    for key, (fired_at, payload) in fired.items():
+        assert payload == deadlines[key]
+        assert fired_at >= math.floor(deadlines[key] * 10) / 10
+        assert fired_at - deadlines[key] < 0.1 + 1e-6
+    assert len(wheel) == 0
+
+
+def test_cancel_and_reinsert():
+    wheel = TimingWheel(tick=1.0, slots=4, levels=2)
+    wheel.insert("a", 3)
+    wheel.insert("b", 10)
+    wheel.insert("b", 5)
+    assert wheel.cancel("a") is True
+    assert wheel.cancel("a") is False
+    assert "b" in wheel and len(wheel) == 1
+
+    assert wheel.advance(4) == []
+    assert [key for key, _ in wheel.advance(5)] == ["b"]
+
+
+def test_past_deadlines_fire_on_next_advance():
+    wheel = TimingWheel(tick=1.0, start=100.0)
+    wheel.insert("late", 50.0)
+    assert [key for key, _ in wheel.advance(100.0)] == ["late"]
+
+
+def test_scheduler_keeps_only_near_term_reminders_in_memory():
+    from datetime import datetime, timedelta, timezone
+    from types import SimpleNamespace
+    import uuid
+
+    from app.services.scheduler_service import ReminderScheduler, promote_reminder
+
+    scheduler = ReminderScheduler()
+
+    now = datetime.now(timezone.utc)
+    near = SimpleNamespace(id=uuid.uuid4(), title="near", scheduled_for=now + timedelta(seconds=40))
+    far = SimpleNamespace(id=uuid.uuid4(), title="far", scheduled_for=now + timedelta(days=2))
+
+    try:
+        assert scheduler.schedule_reminder(near)
+        assert scheduler.schedule_reminder(far)
+
+        assert str(near.id) in scheduler._wheel
+        assert str(far.id) not in scheduler._wheel
+        job = scheduler._scheduler.get_job(f"reminder_{far.id}")
+        assert job.func is promote_reminder
+        assert job.trigger.run_date < far.scheduled_for
+
+        assert scheduler.cancel_reminder(near.id)
+        assert str(near.id) not in scheduler._wheel
+    finally:
+        scheduler.cancel_reminder(near.id)
+        scheduler.cancel_reminder(far.id)
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta, timezone
+import gzip
+import uuid
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import Base, get_db
+from app.models.reminder import CallAttempt, CallAttemptStatus, Reminder, ReminderStatus
+from app.routers import webhooks
+from app.services.webhook_capture import WebhookCapture, read_capture
+from app.tools.replay_webhooks import replay
+
+
+def test_capture_writes_compressed_ndjson_off_the_request_path(tmp_path, db_session, monkeypatch):
+    capture = WebhookCapture(str(tmp_path), flush_interval=0.05)
+    capture.start()
+    monkeypatch.setattr(webhooks, "get_webhook_capture", lambda: capture)
+
+    app = FastAPI()
+    app.include_router(webhooks.router, prefix="/api/webhooks")
+    app.dependency_overrides[get_db] = lambda: db_session
+    client = TestClient(app)
+
+    event = {"type": "call.started", "call": {"id": "call-1", "metadata": {}}}
+    assert client.post("/api/webhooks/vapi", json=event).status_code == 200
+    client.post(
+        "/api/webhooks/vapi", content=b"{not json", headers={"content-type": "application/json"}
+    )
+    capture.stop()
+
+    with gzip.open(capture.path, "rt") as f:
+        assert len(f.read().splitlines()) == 2
+
+    records = list(read_capture([str(tmp_path / "*.ndjson.gz")]))
+    assert records[0]["event"] == event
+    assert records[1]["raw"] == "{not json"
+    assert records[0]["t"] <= records[1]["t"]
+    assert capture.captured == 2 and capture.dropped == 0
+
+
+def test_capture_drops_instead_of_blocking_when_full(tmp_path):
+    capture = WebhookCapture(str(tmp_path), max_queue=2)
+    for _ in range(5):
+        capture.record(b"{}", 0.0)
+    assert capture.dropped == 3
+
+
+def test_replay_reports_results_and_state_changes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'replay.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    now = datetime.now(timezone.utc)
+    db = Session()
+    reminders = []
+    for i in range(3):
+        reminder = Reminder(
+            id=uuid.uuid4(),
+            title="Replay reminder",
+            message="This is a test message",
+            phone_number="+12025551234",
+            scheduled_for=now - timedelta(minutes=i),
+            timezone="UTC",
+            status=ReminderStatus.SCHEDULED,
+            retry_count=0,
+            attempt_count=1,
+            created_at=now,
+            updated_at=now,
+        )
+        reminder.call_attempts.append(
+            CallAttempt(
+                id=uuid.uuid4(),
+                attempt_number=1,
+                status=CallAttemptStatus.RINGING,
+                vapi_call_id=f"call-{i}",
+                initiated_at=now,
+            )
+        )
+        db.add(reminder)
+        reminders.append(reminder)
+    db.commit()
+
+    records = []
+    for i, reminder in enumerate(reminders):
+        call = {
+            "id": f"call-{i}",
+            "metadata": {
+                "reminder_id": str(reminder.id),
+                "call_attempt_id": str(reminder.call_attempts[0].id),
+            },
+        }
+        final = "call.failed" if i == 2 else "call.ended"
+        records.append({"t": 100.0 + i, "event": {"type": "call.started", "call": call}})
+        records.append(
+            {"t": 100.5 + i, "event": {"type": final, "call": {**call, "duration": 30}}}
+        )
+    records.append({"t": 104.0, "raw": "{truncated"})
+    db.close()
+
+    report = replay(records, session_factory=Session, speed=0, concurrency=3)
+
+    assert report["events"] == 6
+    assert report["malformed"] == 1
+    assert report["results"] == {"success": 6}
+    assert report["state_changes"]["reminders"] == {
+        "scheduled -> completed": 2,
+        "scheduled -> failed": 1,
+    }
+    assert report["state_changes"]["call_attempts"] == {
+        "ringing -> completed": 2,
+        "ringing -> failed": 1,
+    }
+    assert report["throughput_per_second"] > 0
+    engine.dispose()
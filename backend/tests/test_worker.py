@@ -0,0 +1,195 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.reminder import Reminder, ReminderStatus
+from app.models.signal import SchedulerSignal
+from app.services.scheduler_signals import SignalConsumer, SignalingScheduler
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class RecordingScheduler:
+    def __init__(self):
+        self.scheduled = []
+        self.cancelled = []
+
+    def schedule_reminder(self, reminder):
+        self.scheduled.append(reminder.id)
+        return True
+
+    def cancel_reminder(self, reminder_id):
+        self.cancelled.append(reminder_id)
+        return True
+
+    def schedule_reminders(self, reminders):
+        ids = [reminder.id for reminder in reminders]
+        self.scheduled.extend(ids)
+        return len(ids)
+
+    def cancel_reminders(self, reminder_ids):
+        ids = list(reminder_ids)
+        self.cancelled.extend(ids)
+        return len(ids)
+
+
+def _reminder(db, status=ReminderStatus.SCHEDULED):
+    now = datetime.now(timezone.utc)
+    reminder = Reminder(
+        id=uuid.uuid4(),
+        title="Worker reminder",
+        message="This is a test message",
+        phone_number="+12025551234",
+        scheduled_for=now + timedelta(days=1),
+        timezone="UTC",
+        status=status,
+        retry_count=0,
+        created_at=now,
+        updated_at=now,
+    )
+    db.add(reminder)
+    db.commit()
+    return reminder
+
+
+def test_signals_are_applied_from_current_reminder_state(db_session):
+    factory = sessionmaker(bind=db_session.get_bind())
+    signaling = SignalingScheduler()
+    dispatcher = RecordingScheduler()
+    consumer = SignalConsumer(dispatcher, session_factory=factory, batch_size=2)
+
+    scheduled = _reminder(db_session)
+    finished = _reminder(db_session, status=ReminderStatus.COMPLETED)
+    deleted_id = uuid.uuid4()
+
+    # Signals commit or roll back with the change they belong to
+    assert signaling.stage(db_session, [uuid.uuid4()]) == 1
+    db_session.rollback()
+    assert db_session.query(SchedulerSignal).count() == 0
+
+    # Duplicate signals for one reminder in a batch collapse into a single scheduler call;
+    # with batch_size=2 both of scheduled's signals land in the first batch
+    assert signaling.stage(db_session, [scheduled.id, scheduled.id, finished.id]) == 3
+    assert signaling.stage(db_session, [deleted_id]) == 1
+    db_session.commit()
+
+    assert consumer.drain() == 4
+    assert dispatcher.scheduled == [scheduled.id]
+    assert sorted(dispatcher.cancelled) == sorted([finished.id, deleted_id])
+    assert db_session.query(SchedulerSignal).count() == 0
+    assert consumer.drain() == 0
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(predicate, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.2)
+    return False
+
+
+@pytest.fixture
+def worker_deployment(tmp_path):
+    """4 API workers in SCHEDULER_MODE=worker plus one `python -m app.worker`, sharing a
+    SQLite file."""
+    pytest.importorskip("uvicorn")
+
+    from app.db.database import Base
+    import app.models  # noqa: F401
+
+    database_url = f"sqlite:///{tmp_path / 'deployment.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+
+    env = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        SCHEDULER_MODE="worker",
+        SCHEDULER_SIGNAL_POLL_SECONDS="0.2",
+        LOG_LEVEL="WARNING",
+    )
+    port = _free_port()
+    processes = [
+        subprocess.Popen([sys.executable, "-m", "app.worker"], cwd=BACKEND_DIR, env=env),
+        subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--workers", "4",
+             "--port", str(port), "--log-level", "warning"],
+            cwd=BACKEND_DIR,
+            env=env,
+        ),
+    ]
+    base_url = f"http://127.0.0.1:{port}"
+
+    def live():
+        try:
+            return httpx.get(f"{base_url}/health/live").status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    try:
+        if not _wait_for(live, timeout=30):
+            pytest.skip("API workers did not come up")
+        yield base_url, engine
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        engine.dispose()
+
+
+def test_api_workers_signal_standalone_dispatcher(worker_deployment):
+    base_url, engine = worker_deployment
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+
+    def create(i):
+        payload = {
+            "title": f"Reminder {i}",
+            "message": "This is a test message",
+            "phone_number": "+12025551234",
+            "scheduled_for": (start + timedelta(minutes=i)).isoformat(),
+            "timezone": "UTC",
+        }
+        response = httpx.post(f"{base_url}/api/reminders/", json=payload, timeout=30)
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = list(pool.map(create, range(40)))
+
+    def job_ids():
+        with engine.connect() as connection:
+            try:
+                rows = connection.execute(text("SELECT reminder_id FROM reminder_jobs")).all()
+            except Exception:
+                return set()
+        return {str(uuid.UUID(row.reminder_id)) for row in rows}
+
+    expected = set(ids)
+    assert _wait_for(lambda: job_ids() == expected, timeout=20), job_ids() ^ expected
+
+    for reminder_id in ids[:10]:
+        assert httpx.delete(f"{base_url}/api/reminders/{reminder_id}").status_code == 204
+
+    expected = set(ids[10:])
+    assert _wait_for(lambda: job_ids() == expected, timeout=20), job_ids() ^ expected
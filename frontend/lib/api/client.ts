@@ -8,6 +8,8 @@ export const apiClient = axios.create({
     "Content-Type": "application/json",
   },
   timeout: 10000,
+  // Carries the read-your-writes cookie that pins reads to the primary after a write
+  withCredentials: true,
 });
 
 apiClient.interceptors.request.use(